@@ -14,6 +14,7 @@ class BaseGetDTO(BaseModel):
 class BaseListDTO(BaseModel):
     skip: int = Field(0, ge=0)
     limit: int = Field(100, ge=1, le=1000)
+    cursor: Optional[str] = None  # Непрозрачный курсор keyset-пагинации, имеет приоритет над skip
 
 class BaseUpdateDTO(BaseModel):
     id: UUID = Field(..., alias="entity_id")
@@ -1,12 +1,13 @@
 from uuid import UUID
 from datetime import datetime
-from pydantic import Field
-from typing import List
+from pydantic import BaseModel, Field, model_validator
+from typing import Any, Dict, List, Optional
 from application.dto.base import (
     BaseCreateDTO, BaseGetDTO, BaseListDTO,
     BaseUpdateDTO, BaseDeleteDTO, BaseResponseDTO
 )
-from domain.models.entities.note import Note
+from domain.models.entities.note import Note, NoteSummary
+from domain.models.enums.bulk import BulkAction
 
 class NoteCreateDTO(BaseCreateDTO):
     title: str = Field(..., min_length=1, max_length=100)
@@ -22,6 +23,22 @@ class NoteUpdateDTO(BaseUpdateDTO):
     title: str = Field(..., min_length=1, max_length=100)
     content: str = Field(..., min_length=1)
 
+class NotePatchDTO(BaseUpdateDTO):
+    title: Optional[str] = Field(None, min_length=1, max_length=100)
+    content: Optional[str] = Field(None, min_length=1)
+
+    @model_validator(mode="after")
+    def check_not_empty(self) -> "NotePatchDTO":
+        if not self.changes():
+            raise ValueError("At least one of 'title' or 'content' must be provided")
+        return self
+
+    def changes(self) -> Dict[str, Any]:
+        return {
+            field: value for field, value in (("title", self.title), ("content", self.content))
+            if value is not None
+        }
+
 class NoteDeleteDTO(BaseDeleteDTO):
     pass
 
@@ -42,4 +59,76 @@ class NoteResponseDTO(BaseResponseDTO[Note]):
 
 class NoteListResponseDTO(BaseListDTO):
     notes: List[NoteResponseDTO] = Field(default_factory=list)
-    total: int = 0
\ No newline at end of file
+    total: int = 0
+    next_cursor: Optional[str] = None
+
+class NoteSummaryResponseDTO(BaseResponseDTO[NoteSummary]):
+    title: str
+
+    @classmethod
+    def from_entity(cls, entity: NoteSummary) -> "NoteSummaryResponseDTO":
+        return cls(
+            id=entity.id,
+            title=entity.title,
+            owner_id=entity.owner_id,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at
+        )
+
+class NoteSummaryListResponseDTO(BaseListDTO):
+    notes: List[NoteSummaryResponseDTO] = Field(default_factory=list)
+    total: int = 0
+    next_cursor: Optional[str] = None
+
+class NoteBatchOperationDTO(BaseModel):
+    op: BulkAction
+    entity_id: Optional[UUID] = None
+    title: Optional[str] = Field(None, min_length=1, max_length=100)
+    content: Optional[str] = Field(None, min_length=1)
+
+    @model_validator(mode="after")
+    def check_fields(self) -> "NoteBatchOperationDTO":
+        if self.op == BulkAction.CREATE:
+            if self.title is None or self.content is None:
+                raise ValueError("'create' requires 'title' and 'content'")
+        elif self.entity_id is None:
+            raise ValueError(f"'{self.op.value}' requires 'entity_id'")
+        elif self.op == BulkAction.UPDATE and not self.changes():
+            raise ValueError("'update' requires at least one of 'title' or 'content'")
+        return self
+
+    def changes(self) -> Dict[str, Any]:
+        return {
+            field: value for field, value in (("title", self.title), ("content", self.content))
+            if value is not None
+        }
+
+class NoteBatchDTO(BaseModel):
+    operations: List[NoteBatchOperationDTO] = Field(..., min_length=1, max_length=1000)
+    ordered: bool = True
+
+class NoteBatchItemResultDTO(BaseModel):
+    index: int
+    op: BulkAction
+    entity_id: Optional[UUID] = None
+    note: Optional[NoteResponseDTO] = None
+    error: Optional[str] = None
+
+class NoteBatchResponseDTO(BaseModel):
+    results: List[NoteBatchItemResultDTO] = Field(default_factory=list)
+    succeeded: int = 0
+    failed: int = 0
+
+class NoteBatchGetDTO(BaseModel):
+    entity_ids: List[UUID] = Field(..., min_length=1, max_length=1000)
+
+class NoteBatchGetItemDTO(BaseModel):
+    index: int
+    entity_id: UUID
+    note: Optional[NoteResponseDTO] = None
+    error: Optional[str] = None
+
+class NoteBatchGetResponseDTO(BaseModel):
+    results: List[NoteBatchGetItemDTO] = Field(default_factory=list)
+    succeeded: int = 0
+    failed: int = 0
@@ -78,7 +78,9 @@ class BaseService(Generic[T_CreateDTO, T_GetDTO, T_ListDTO, T_UpdateDTO, T_Delet
         try:
             logger.info(f"Listing {self.entity_name}s")
             target_user_id = user_id if role == "user" else (list_dto.user_id if list_dto.user_id else None)
-            entities = await self.repo.list(target_user_id, list_dto.skip, list_dto.limit, request_id)
+            entities, _ = await self.repo.list(
+                target_user_id, list_dto.skip, list_dto.limit, request_id, cursor=list_dto.cursor
+            )
             response = [self._to_response_dto(entity) for entity in entities]
             logger.info(f"{self.entity_name}s listed successfully", count=len(response))
             return response
@@ -1,14 +1,23 @@
 from domain.exceptions import AccessDeniedError, NotFoundError, ValidationException
 from domain.ports.outbound.event.event_publisher import EventPublisherPort
-from domain.models.entities.note import Note
+from domain.ports.outbound.database.quota import QuotaRepositoryPort
+from domain.models.entities.note import Note, NoteSummary
+from domain.models.bulk import BatchGetResult, BulkOperation, BulkItemResult
+from domain.models.page import Page
+from domain.models.enums.bulk import BulkAction
 from application.dto.note import (
     NoteCreateDTO, NoteGetDTO, NoteListDTO,
-    NoteUpdateDTO, NoteDeleteDTO, NoteResponseDTO, NoteListResponseDTO
+    NoteUpdateDTO, NotePatchDTO, NoteDeleteDTO, NoteResponseDTO, NoteListResponseDTO,
+    NoteSummaryResponseDTO, NoteSummaryListResponseDTO,
+    NoteBatchDTO, NoteBatchItemResultDTO, NoteBatchResponseDTO,
+    NoteBatchGetDTO, NoteBatchGetItemDTO, NoteBatchGetResponseDTO
 )
 from domain import exceptions
 from application.services.base import BaseService
 from uuid import uuid4, UUID
 from datetime import datetime
+from collections import Counter
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from infrastructure.config import settings
 
 class AsyncNoteService(BaseService[
@@ -20,9 +29,10 @@ class AsyncNoteService(BaseService[
     NoteResponseDTO,
     Note
 ]):
-    def __init__(self, repo, logger, event_publisher: EventPublisherPort):
+    def __init__(self, repo, logger, event_publisher: EventPublisherPort, quota: QuotaRepositoryPort):
         super().__init__(repo, logger, "Note")
         self.publisher = event_publisher
+        self.quota = quota
 
     def _create_entity(self, create_dto: NoteCreateDTO, user_id: UUID) -> Note:
         now = datetime.utcnow()
@@ -39,10 +49,30 @@ class AsyncNoteService(BaseService[
         entity.title = update_dto.title
         entity.content = update_dto.content
 
+    def _update_fields(self, update_dto: NoteUpdateDTO) -> Dict[str, Any]:
+        return {"title": update_dto.title, "content": update_dto.content}
+
     def _to_response_dto(self, entity: Note) -> NoteResponseDTO:
         return NoteResponseDTO.from_entity(entity)
 
+    @staticmethod
+    def _owner_filter(user_id: UUID, role: str) -> Optional[UUID]:
+        return user_id if role == "user" else None
+
+    async def _raise_for_miss(self, entity_id: UUID, owner_id: Optional[UUID], logger, request_id: str) -> None:
+        # Редкий путь: запрос с фильтром по владельцу ничего не нашёл - различаем "нет заметки" и "чужая заметка"
+        if owner_id and await self.repo.exists(entity_id, request_id):
+            logger.error("Access denied to Note")
+            raise AccessDeniedError(f"Access to this Note is denied")
+        logger.warning("Note not found")
+        raise NotFoundError(self.entity_name, str(entity_id))
+
+    # Методы *_note(s) отдают сущности, gRPC строит protobuf прямо из них; create/get/list/... - обёртки для REST с DTO
+
     async def create(self, create_dto: NoteCreateDTO, user_id: UUID, role: str, request_id: str) -> NoteResponseDTO:
+        return self._to_response_dto(await self.create_note(create_dto, user_id, role, request_id))
+
+    async def create_note(self, create_dto: NoteCreateDTO, user_id: UUID, role: str, request_id: str) -> Note:
         logger = self.logger.bind(request_id=request_id, user_id=str(user_id), role=role)
         try:
             logger.info("Starting Note creation process")
@@ -50,14 +80,17 @@ class AsyncNoteService(BaseService[
                 logger.error("Invalid role provided")
                 raise exceptions.AuthenticationError(f"Invalid role: {role}")
 
-            current_count = await self.repo.count_by_user_id(user_id, request_id)
-            if current_count >= settings.max_docs_per_user:
+            # Проверка и резервирование квоты одним атомарным запросом
+            if not await self.quota.reserve(user_id, settings.max_docs_per_user, request_id):
                 logger.error(f"Note limit exceeded for user", user_id=str(user_id))
                 raise exceptions.LimitExceededError(self.entity_name, settings.max_docs_per_user)
 
             entity = self._create_entity(create_dto, user_id)
-            created_entity = await self.repo.create(entity, request_id)
-            response = self._to_response_dto(created_entity)
+            try:
+                created_entity = await self.repo.create(entity, request_id)
+            except Exception:
+                await self.quota.release(user_id, request_id)
+                raise
             logger.info(f"Note created successfully", entity_id=str(created_entity.id))
 
             await self.publisher.publish("note.created", {
@@ -67,12 +100,15 @@ class AsyncNoteService(BaseService[
                 "created_at": created_entity.created_at.isoformat()
             })
 
-            return response
+            return created_entity
         except Exception as e:
             logger.exception(f"Failed to create Note", error=str(e))
             raise
 
     async def get(self, get_dto: NoteGetDTO, user_id: UUID, role: str, request_id: str) -> NoteResponseDTO:
+        return self._to_response_dto(await self.get_note(get_dto, user_id, role, request_id))
+
+    async def get_note(self, get_dto: NoteGetDTO, user_id: UUID, role: str, request_id: str) -> Note:
         logger = self.logger.bind(request_id=request_id, entity_id=str(get_dto.id), user_id=str(user_id), role=role)
         try:
             logger.info("Fetching Note")
@@ -83,50 +119,141 @@ class AsyncNoteService(BaseService[
             if role == "user" and entity.owner_id != user_id:
                 logger.error("Access denied to Note")
                 raise AccessDeniedError(f"Access to this Note is denied")
-            response = self._to_response_dto(entity)
             logger.info("Note fetched successfully")
-            return response
+            return entity
         except Exception as e:
             logger.exception(f"Failed to get Note", error=str(e))
             raise
 
+    async def batch_get(
+        self, batch_dto: NoteBatchGetDTO, user_id: UUID, role: str, request_id: str
+    ) -> NoteBatchGetResponseDTO:
+        results = await self.batch_get_notes(batch_dto, user_id, role, request_id)
+        succeeded = sum(1 for result in results if result.ok)
+        return NoteBatchGetResponseDTO(
+            results=[
+                NoteBatchGetItemDTO(
+                    index=result.index, entity_id=result.entity_id,
+                    note=self._to_response_dto(result.entity) if result.ok else None,
+                    error=None if result.ok else str(result.error)
+                )
+                for result in results
+            ],
+            succeeded=succeeded,
+            failed=len(results) - succeeded
+        )
+
+    async def batch_get_notes(
+        self, batch_dto: NoteBatchGetDTO, user_id: UUID, role: str, request_id: str
+    ) -> List[BatchGetResult[Note]]:
+        logger = self.logger.bind(request_id=request_id, user_id=str(user_id), role=role, size=len(batch_dto.entity_ids))
+        try:
+            logger.info("Fetching Note batch")
+            # Один MGET в кеш и один $in в базу на промахи; результаты в порядке запроса, повторы id допустимы
+            entities = await self.repo.get_many(list(dict.fromkeys(batch_dto.entity_ids)), request_id)
+            owner_id = self._owner_filter(user_id, role)
+            results = []
+            for index, entity_id in enumerate(batch_dto.entity_ids):
+                entity = entities.get(entity_id)
+                if entity is None:
+                    result = BatchGetResult(index, entity_id, error=NotFoundError(self.entity_name, str(entity_id)))
+                elif owner_id and entity.owner_id != owner_id:
+                    result = BatchGetResult(index, entity_id, error=AccessDeniedError("Access to this Note is denied"))
+                else:
+                    result = BatchGetResult(index, entity_id, entity=entity)
+                results.append(result)
+            succeeded = sum(1 for result in results if result.ok)
+            logger.info("Note batch fetched", succeeded=succeeded, failed=len(results) - succeeded)
+            return results
+        except Exception as e:
+            logger.exception("Failed to fetch Note batch", error=str(e))
+            raise
+
     async def list(self, list_dto: NoteListDTO, user_id: UUID, role: str, request_id: str) -> NoteListResponseDTO:
+        page = await self.list_notes(list_dto, user_id, role, request_id)
+        return NoteListResponseDTO(
+            notes=[self._to_response_dto(entity) for entity in page.items],
+            total=page.total,
+            skip=list_dto.skip,
+            limit=list_dto.limit,
+            cursor=list_dto.cursor,
+            next_cursor=page.next_cursor
+        )
+
+    async def list_notes(self, list_dto: NoteListDTO, user_id: UUID, role: str, request_id: str) -> Page[Note]:
         logger = self.logger.bind(request_id=request_id, user_id=str(user_id), role=role, skip=list_dto.skip, limit=list_dto.limit)
         try:
             logger.info("Listing Notes")
             target_user_id = user_id if role == "user" else None
-            entities = await self.repo.list(target_user_id, list_dto.skip, list_dto.limit, request_id)
-            total = await self.repo.count_by_user_id(target_user_id, request_id) if target_user_id else 0
-            response = NoteListResponseDTO(
-                notes=[self._to_response_dto(entity) for entity in entities],
-                total=total,
-                skip=list_dto.skip,
-                limit=list_dto.limit
+            entities, next_cursor, total = await self.repo.list_page(
+                target_user_id, list_dto.skip, list_dto.limit, request_id, cursor=list_dto.cursor
             )
-            logger.info(f"Notes listed successfully", count=len(response.notes), total=total)
-            return response
+            logger.info(f"Notes listed successfully", count=len(entities), total=total, has_more=bool(next_cursor))
+            return Page(entities, total, next_cursor)
         except Exception as e:
             logger.exception(f"Failed to list Notes", error=str(e))
             raise
 
+    async def list_summaries(
+        self, list_dto: NoteListDTO, user_id: UUID, role: str, request_id: str
+    ) -> NoteSummaryListResponseDTO:
+        page = await self.list_note_summaries(list_dto, user_id, role, request_id)
+        return NoteSummaryListResponseDTO(
+            notes=[NoteSummaryResponseDTO.from_entity(summary) for summary in page.items],
+            total=page.total,
+            skip=list_dto.skip,
+            limit=list_dto.limit,
+            cursor=list_dto.cursor,
+            next_cursor=page.next_cursor
+        )
+
+    async def list_note_summaries(
+        self, list_dto: NoteListDTO, user_id: UUID, role: str, request_id: str
+    ) -> Page[NoteSummary]:
+        logger = self.logger.bind(request_id=request_id, user_id=str(user_id), role=role, skip=list_dto.skip, limit=list_dto.limit)
+        try:
+            logger.info("Listing Note summaries")
+            target_user_id = user_id if role == "user" else None
+            summaries, next_cursor, total = await self.repo.list_page(
+                target_user_id, list_dto.skip, list_dto.limit, request_id, cursor=list_dto.cursor, summaries=True
+            )
+            logger.info(f"Note summaries listed successfully", count=len(summaries), total=total, has_more=bool(next_cursor))
+            return Page(summaries, total, next_cursor)
+        except Exception as e:
+            logger.exception(f"Failed to list Note summaries", error=str(e))
+            raise
+
+    async def export(self, user_id: UUID, role: str, request_id: str) -> AsyncIterator[List[NoteResponseDTO]]:
+        async for notes in self.export_notes(user_id, role, request_id):
+            yield [self._to_response_dto(note) for note in notes]
+
+    async def export_notes(self, user_id: UUID, role: str, request_id: str) -> AsyncIterator[List[Note]]:
+        logger = self.logger.bind(request_id=request_id, user_id=str(user_id), role=role)
+        target_user_id = user_id if role == "user" else None
+        exported = 0
+        logger.info("Exporting Notes", batch_size=settings.export_batch_size)
+        try:
+            async for notes in self.repo.export(target_user_id, settings.export_batch_size, request_id):
+                exported += len(notes)
+                yield notes
+        except Exception as e:
+            logger.exception(f"Failed to export Notes", error=str(e), exported=exported)
+            raise
+        logger.info(f"Notes exported successfully", count=exported)
+
     async def update(self, update_dto: NoteUpdateDTO, user_id: UUID, role: str, request_id: str) -> NoteResponseDTO:
+        return self._to_response_dto(await self.update_note(update_dto, user_id, role, request_id))
+
+    async def update_note(self, update_dto: NoteUpdateDTO, user_id: UUID, role: str, request_id: str) -> Note:
         logger = self.logger.bind(request_id=request_id, entity_id=str(update_dto.id), user_id=str(user_id), role=role)
         try:
             logger.info("Updating Note")
-            entity = await self.repo.get_by_id(update_dto.id, request_id)
-            if not entity:
-                logger.warning("Note not found")
-                raise NotFoundError(self.entity_name, str(update_dto.id))
-            if role == "user" and entity.owner_id != user_id:
-                logger.error("Access denied to Note")
-                raise AccessDeniedError(f"Access to this Note is denied")
-            self._update_entity(entity, update_dto)
-            entity.updated_at = datetime.utcnow()
-            updated_entity = await self.repo.update(entity, request_id)
+            owner_id = self._owner_filter(user_id, role)
+            updated_entity = await self.repo.update_owned(
+                update_dto.id, owner_id, self._update_fields(update_dto), request_id
+            )
             if not updated_entity:
-                logger.warning("Note not found after update")
-                raise NotFoundError(self.entity_name, str(update_dto.id))
-            response = self._to_response_dto(updated_entity)
+                await self._raise_for_miss(update_dto.id, owner_id, logger, request_id)
             logger.info("Note updated successfully")
 
             await self.publisher.publish("note.updated", {
@@ -136,31 +263,176 @@ class AsyncNoteService(BaseService[
                 "updated_at": updated_entity.updated_at.isoformat()
             })
 
-            return response
+            return updated_entity
         except Exception as e:
             logger.exception(f"Failed to update Note", error=str(e))
             raise
 
+    async def patch(self, patch_dto: NotePatchDTO, user_id: UUID, role: str, request_id: str) -> NoteResponseDTO:
+        return self._to_response_dto(await self.patch_note(patch_dto, user_id, role, request_id))
+
+    async def patch_note(self, patch_dto: NotePatchDTO, user_id: UUID, role: str, request_id: str) -> Note:
+        logger = self.logger.bind(request_id=request_id, entity_id=str(patch_dto.id), user_id=str(user_id), role=role)
+        try:
+            changes = patch_dto.changes()
+            logger.info("Patching Note", fields=list(changes))
+            owner_id = self._owner_filter(user_id, role)
+            # В $set уходят только переданные поля, документ целиком не переписывается
+            updated_entity = await self.repo.update_owned(patch_dto.id, owner_id, changes, request_id)
+            if not updated_entity:
+                await self._raise_for_miss(patch_dto.id, owner_id, logger, request_id)
+            logger.info("Note patched successfully")
+
+            await self.publisher.publish("note.updated", {
+                "id": str(updated_entity.id),
+                "title": updated_entity.title,
+                "owner_id": str(updated_entity.owner_id),
+                "updated_at": updated_entity.updated_at.isoformat()
+            })
+
+            return updated_entity
+        except Exception as e:
+            logger.exception(f"Failed to patch Note", error=str(e))
+            raise
+
     async def delete(self, delete_dto: NoteDeleteDTO, user_id: UUID, role: str, request_id: str) -> bool:
         logger = self.logger.bind(request_id=request_id, entity_id=str(delete_dto.id), user_id=str(user_id), role=role)
         try:
             logger.info("Deleting Note")
-            entity = await self.repo.get_by_id(delete_dto.id, request_id)
-            if not entity:
-                logger.warning("Note not found")
-                raise NotFoundError(self.entity_name, str(delete_dto.id))
-            if role == "user" and entity.owner_id != user_id:
-                logger.error("Access denied to Note")
-                raise AccessDeniedError(f"Access to this Note is denied")
-            await self.repo.delete(delete_dto.id, request_id)
+            owner_id = self._owner_filter(user_id, role)
+            deleted_entity = await self.repo.delete_owned(delete_dto.id, owner_id, request_id)
+            if not deleted_entity:
+                await self._raise_for_miss(delete_dto.id, owner_id, logger, request_id)
+            await self.quota.release(deleted_entity.owner_id, request_id)
             logger.info("Note deleted successfully")
 
             await self.publisher.publish("note.deleted", {
                 "id": str(delete_dto.id),
-                "owner_id": str(user_id)
+                "owner_id": str(deleted_entity.owner_id)
             })
 
             return True
         except Exception as e:
             logger.exception(f"Failed to delete Note", error=str(e))
-            raise
\ No newline at end of file
+            raise
+
+    async def batch(self, batch_dto: NoteBatchDTO, user_id: UUID, role: str, request_id: str) -> NoteBatchResponseDTO:
+        results = await self.batch_notes(batch_dto, user_id, role, request_id)
+        succeeded = sum(1 for r in results if r.ok)
+        return NoteBatchResponseDTO(
+            results=[self._to_batch_item_dto(r) for r in results],
+            succeeded=succeeded,
+            failed=len(results) - succeeded
+        )
+
+    async def batch_notes(
+        self, batch_dto: NoteBatchDTO, user_id: UUID, role: str, request_id: str
+    ) -> List[BulkItemResult[Note]]:
+        logger = self.logger.bind(
+            request_id=request_id, user_id=str(user_id), role=role,
+            size=len(batch_dto.operations), ordered=batch_dto.ordered
+        )
+        try:
+            logger.info("Processing Note batch")
+            owner_id = self._owner_filter(user_id, role)
+            results: List[Optional[BulkItemResult[Note]]] = [None] * len(batch_dto.operations)
+            pending: List[Tuple[int, BulkOperation[Note]]] = []
+            for index, item in enumerate(batch_dto.operations):
+                if item.op == BulkAction.CREATE and role != "user":
+                    results[index] = BulkItemResult(index, item.op, error=exceptions.AuthenticationError(f"Invalid role: {role}"))
+                elif item.op == BulkAction.CREATE:
+                    entity = self._create_entity(NoteCreateDTO(title=item.title, content=item.content), user_id)
+                    pending.append((index, BulkOperation(item.op, entity=entity)))
+                else:
+                    pending.append((index, BulkOperation(
+                        item.op, entity_id=item.entity_id, changes=item.changes(), owner_id=owner_id
+                    )))
+
+            # Квота на все создания пакета резервируется одним запросом (всё или ничего)
+            creates = sum(1 for _, op in pending if op.action == BulkAction.CREATE)
+            reserved = False
+            if creates:
+                reserved = await self.quota.reserve(user_id, settings.max_docs_per_user, request_id, amount=creates)
+            if creates and not reserved:
+                limit_error = exceptions.LimitExceededError(self.entity_name, settings.max_docs_per_user)
+                for index, op in pending:
+                    if op.action == BulkAction.CREATE:
+                        results[index] = BulkItemResult(index, op.action, entity_id=op.entity.id, error=limit_error)
+                pending = [(index, op) for index, op in pending if op.action != BulkAction.CREATE]
+
+            if batch_dto.ordered:
+                first_failed = next((r.index for r in results if r is not None), None)
+                if first_failed is not None:
+                    pending = [(index, op) for index, op in pending if index < first_failed]
+            if pending:
+                try:
+                    written = await self.repo.bulk_write([op for _, op in pending], batch_dto.ordered, request_id)
+                except Exception:
+                    # Как в create_note: пакет не записан, резерв под его создания возвращаем
+                    if reserved:
+                        await self.quota.release(user_id, request_id, amount=creates)
+                    raise
+                for (index, _), result in zip(pending, written):
+                    result.index = index
+                    results[index] = result
+            if batch_dto.ordered:
+                self._mark_skipped(results, batch_dto)
+
+            if reserved:
+                failed_creates = sum(1 for r in results if r.action == BulkAction.CREATE and not r.ok)
+                if failed_creates:
+                    await self.quota.release(user_id, request_id, amount=failed_creates)
+            deleted_by_owner = Counter(r.owner_id for r in results if r.ok and r.action == BulkAction.DELETE)
+            for deleted_owner, amount in deleted_by_owner.items():
+                await self.quota.release(deleted_owner, request_id, amount=amount)
+
+            await self.publisher.publish_many([self._batch_event(r) for r in results if r.ok])
+
+            succeeded = sum(1 for r in results if r.ok)
+            logger.info("Note batch processed", succeeded=succeeded, failed=len(results) - succeeded)
+            return results
+        except Exception as e:
+            logger.exception("Failed to process Note batch", error=str(e))
+            raise
+
+    @staticmethod
+    def _mark_skipped(results: List[Optional[BulkItemResult[Note]]], batch_dto: NoteBatchDTO) -> None:
+        # В упорядоченном режиме всё невыполненное после первой ошибки считается пропущенным.
+        # Успешный результат репозитория - выполненная запись, он остаётся успешным
+        first_failed = None
+        for index, (result, item) in enumerate(zip(results, batch_dto.operations)):
+            if first_failed is None:
+                if result is not None and not result.ok:
+                    first_failed = index
+            elif result is None or isinstance(result.error, exceptions.OperationSkippedError):
+                results[index] = BulkItemResult(
+                    index, item.op, entity_id=item.entity_id, error=exceptions.OperationSkippedError(first_failed)
+                )
+
+    @staticmethod
+    def _batch_event(result: BulkItemResult[Note]) -> Tuple[str, Dict[str, Any]]:
+        if result.action == BulkAction.DELETE:
+            return "note.deleted", {"id": str(result.entity_id), "owner_id": str(result.owner_id)}
+        entity = result.entity
+        if result.action == BulkAction.CREATE:
+            return "note.created", {
+                "id": str(entity.id),
+                "title": entity.title,
+                "owner_id": str(entity.owner_id),
+                "created_at": entity.created_at.isoformat()
+            }
+        return "note.updated", {
+            "id": str(entity.id),
+            "title": entity.title,
+            "owner_id": str(entity.owner_id),
+            "updated_at": entity.updated_at.isoformat()
+        }
+
+    def _to_batch_item_dto(self, result: BulkItemResult[Note]) -> NoteBatchItemResultDTO:
+        return NoteBatchItemResultDTO(
+            index=result.index,
+            op=result.action,
+            entity_id=result.entity_id,
+            note=self._to_response_dto(result.entity) if result.ok and result.entity else None,
+            error=None if result.ok else str(result.error)
+        )
@@ -1,5 +1,5 @@
 from .base import AppBaseException, InternalError
-from .application import ValidationException, UseCaseException
+from .application import ValidationException, UseCaseException, OperationSkippedError
 from .domain import EntityNotFound as NotFoundError, BusinessRuleViolation
 from .infrastructure import DatabaseException, ExternalServiceException, MessageBrokerException
 from .auth import AuthenticationError
@@ -11,6 +11,7 @@ __all__ = [
     "InternalError",
     "ValidationException",
     "UseCaseException",
+    "OperationSkippedError",
     "NotFoundError",
     "BusinessRuleViolation",
     "DatabaseException",
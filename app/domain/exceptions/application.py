@@ -9,3 +9,9 @@ class ValidationException(AppBaseException):
 class UseCaseException(AppBaseException):
     """Ошибка на уровне бизнес-логики в Application слое."""
     pass
+
+
+class OperationSkippedError(UseCaseException):
+    """Операция пакета не выполнялась из-за ошибки в предыдущей (упорядоченный режим)."""
+    def __init__(self, failed_index: int):
+        super().__init__(f"Skipped because operation {failed_index} failed in an ordered batch")
@@ -0,0 +1,41 @@
+from uuid import UUID
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generic, Optional, TypeVar
+from domain.models.enums.bulk import BulkAction
+
+T_Entity = TypeVar("T_Entity")
+
+
+@dataclass
+class BulkOperation(Generic[T_Entity]):
+    action: BulkAction
+    entity: Optional[T_Entity] = None  # Для CREATE
+    entity_id: Optional[UUID] = None  # Для UPDATE/DELETE
+    changes: Dict[str, Any] = field(default_factory=dict)  # Для UPDATE
+    owner_id: Optional[UUID] = None  # Фильтр владельца для UPDATE/DELETE, None - без проверки
+
+
+@dataclass
+class BulkItemResult(Generic[T_Entity]):
+    index: int
+    action: BulkAction
+    entity_id: Optional[UUID] = None
+    owner_id: Optional[UUID] = None
+    entity: Optional[T_Entity] = None  # Созданная/обновлённая сущность
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchGetResult(Generic[T_Entity]):
+    index: int
+    entity_id: UUID
+    entity: Optional[T_Entity] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
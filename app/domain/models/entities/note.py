@@ -9,4 +9,13 @@ class Note:
     content: str
     owner_id: UUID  # Изменено на owner_id
     created_at: datetime
-    updated_at: datetime
\ No newline at end of file
+    updated_at: datetime
+
+@dataclass
+class NoteSummary:
+    # Заметка без content для списков, где текст не показывается
+    id: UUID
+    title: str
+    owner_id: UUID
+    created_at: datetime
+    updated_at: datetime
@@ -0,0 +1,11 @@
+from dataclasses import dataclass, field
+from typing import Generic, List, Optional, TypeVar
+
+T_Item = TypeVar("T_Item")
+
+
+@dataclass
+class Page(Generic[T_Item]):
+    items: List[T_Item] = field(default_factory=list)
+    total: int = 0
+    next_cursor: Optional[str] = None  # None - последняя страница
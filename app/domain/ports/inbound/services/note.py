@@ -1,7 +1,13 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
-from typing import List
-from application.dto.note import NoteCreateDTO, NoteGetDTO, NoteListDTO, NoteUpdateDTO, NoteDeleteDTO, NoteResponseDTO
+from typing import AsyncIterator, List
+from domain.models.bulk import BatchGetResult, BulkItemResult
+from domain.models.entities.note import Note, NoteSummary
+from domain.models.page import Page
+from application.dto.note import (
+    NoteCreateDTO, NoteGetDTO, NoteListDTO, NoteUpdateDTO, NotePatchDTO, NoteDeleteDTO, NoteResponseDTO,
+    NoteBatchDTO, NoteBatchResponseDTO, NoteBatchGetDTO, NoteBatchGetResponseDTO, NoteSummaryListResponseDTO
+)
 
 class NoteServicePort(ABC):
     @abstractmethod
@@ -16,10 +22,78 @@ class NoteServicePort(ABC):
     async def list(self, dto: NoteListDTO, user_id: UUID, role: str, request_id: str) -> List[NoteResponseDTO]:
         ...
 
+    @abstractmethod
+    async def list_summaries(
+        self, dto: NoteListDTO, user_id: UUID, role: str, request_id: str
+    ) -> NoteSummaryListResponseDTO:
+        ...
+
     @abstractmethod
     async def update(self, dto: NoteUpdateDTO, user_id: UUID, role: str, request_id: str) -> NoteResponseDTO:
         ...
 
+    @abstractmethod
+    async def patch(self, dto: NotePatchDTO, user_id: UUID, role: str, request_id: str) -> NoteResponseDTO:
+        ...
+
     @abstractmethod
     async def delete(self, dto: NoteDeleteDTO, user_id: UUID, role: str, request_id: str) -> bool:
         ...
+
+    @abstractmethod
+    async def batch(self, dto: NoteBatchDTO, user_id: UUID, role: str, request_id: str) -> NoteBatchResponseDTO:
+        ...
+
+    @abstractmethod
+    async def batch_get(
+        self, dto: NoteBatchGetDTO, user_id: UUID, role: str, request_id: str
+    ) -> NoteBatchGetResponseDTO:
+        ...
+
+    @abstractmethod
+    def export(self, user_id: UUID, role: str, request_id: str) -> AsyncIterator[List[NoteResponseDTO]]:
+        ...
+
+    # Те же сценарии с результатом в виде сущностей - для адаптеров, которые строят ответ прямо из них (gRPC)
+
+    @abstractmethod
+    async def create_note(self, dto: NoteCreateDTO, user_id: UUID, role: str, request_id: str) -> Note:
+        ...
+
+    @abstractmethod
+    async def get_note(self, dto: NoteGetDTO, user_id: UUID, role: str, request_id: str) -> Note:
+        ...
+
+    @abstractmethod
+    async def list_notes(self, dto: NoteListDTO, user_id: UUID, role: str, request_id: str) -> Page[Note]:
+        ...
+
+    @abstractmethod
+    async def list_note_summaries(
+        self, dto: NoteListDTO, user_id: UUID, role: str, request_id: str
+    ) -> Page[NoteSummary]:
+        ...
+
+    @abstractmethod
+    async def update_note(self, dto: NoteUpdateDTO, user_id: UUID, role: str, request_id: str) -> Note:
+        ...
+
+    @abstractmethod
+    async def patch_note(self, dto: NotePatchDTO, user_id: UUID, role: str, request_id: str) -> Note:
+        ...
+
+    @abstractmethod
+    async def batch_notes(
+        self, dto: NoteBatchDTO, user_id: UUID, role: str, request_id: str
+    ) -> List[BulkItemResult[Note]]:
+        ...
+
+    @abstractmethod
+    async def batch_get_notes(
+        self, dto: NoteBatchGetDTO, user_id: UUID, role: str, request_id: str
+    ) -> List[BatchGetResult[Note]]:
+        ...
+
+    @abstractmethod
+    def export_notes(self, user_id: UUID, role: str, request_id: str) -> AsyncIterator[List[Note]]:
+        ...
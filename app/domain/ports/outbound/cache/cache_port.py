@@ -1,11 +1,25 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Dict, List, Optional, Tuple
 
 class CachePort(ABC):
     @abstractmethod
     async def get(self, key: str) -> Any:
         ...
 
+    @abstractmethod
+    async def get_with_ttl(self, key: str) -> Tuple[Any, Optional[float]]:
+        """
+        Возвращает значение и оставшееся время жизни ключа в секундах (None, если неизвестно или ключа нет).
+        """
+        ...
+
+    @abstractmethod
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Читает несколько ключей за один сетевой запрос; отсутствующих ключей в результате нет.
+        """
+        ...
+
     @abstractmethod
     async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
         ...
@@ -13,3 +27,13 @@ class CachePort(ABC):
     @abstractmethod
     async def delete(self, key: str) -> None:
         ...
+
+    @abstractmethod
+    async def write_many(
+        self, entries: Dict[str, Optional[Any]], ttl: int | None = None, only_missing: bool = False
+    ) -> None:
+        """
+        Записывает несколько ключей за один сетевой запрос; значение None удаляет ключ.
+        only_missing=True не перезаписывает существующие ключи (прогрев кеша).
+        """
+        ...
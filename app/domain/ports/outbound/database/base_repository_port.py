@@ -1,12 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
 from uuid import UUID
+from domain.models.bulk import BulkOperation, BulkItemResult
 
 T_Entity = TypeVar("T_Entity")
 
 class BaseRepositoryPort(ABC, Generic[T_Entity]):
     @abstractmethod
-    async def list(self, user_id: Optional[UUID], skip: int, limit: int, request_id: str) -> List[T_Entity]:
+    async def list(
+        self, user_id: Optional[UUID], skip: int, limit: int, request_id: str, cursor: Optional[str] = None
+    ) -> Tuple[List[T_Entity], Optional[str]]:
+        """
+        Возвращает страницу сущностей в детерминированном порядке и курсор следующей страницы.
+        Если передан cursor, skip игнорируется. Курсор равен None, когда страница последняя.
+        """
         pass
 
 
@@ -26,6 +33,41 @@ class BaseRepositoryPort(ABC, Generic[T_Entity]):
     async def delete(self, entity_id: UUID, request_id: str) -> None:
         pass
 
+    @abstractmethod
+    async def update_owned(
+        self, entity_id: UUID, owner_id: Optional[UUID], changes: Dict[str, Any], request_id: str
+    ) -> Optional[T_Entity]:
+        """
+        Атомарно применяет изменения к сущности, если она принадлежит owner_id (None - без проверки владельца).
+        Returns:
+            Optional[T_Entity]: обновлённая сущность или None, если сущность не найдена или чужая.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_owned(self, entity_id: UUID, owner_id: Optional[UUID], request_id: str) -> Optional[T_Entity]:
+        """
+        Атомарно удаляет сущность, если она принадлежит owner_id (None - без проверки владельца).
+        Returns:
+            Optional[T_Entity]: удалённая сущность или None, если сущность не найдена или чужая.
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_write(
+        self, operations: List[BulkOperation[T_Entity]], ordered: bool, request_id: str
+    ) -> List[BulkItemResult[T_Entity]]:
+        """
+        Выполняет пакет операций одним bulk-запросом к хранилищу.
+        ordered=True останавливается на первой ошибке, остальные операции помечаются пропущенными;
+        ordered=False выполняет всё, что может. Результаты возвращаются в порядке operations.
+        """
+        pass
+
+    @abstractmethod
+    async def exists(self, entity_id: UUID, request_id: str) -> bool:
+        pass
+
     @abstractmethod
     async def count_by_user_id(self, user_id: UUID, request_id: str) -> int:
         pass
\ No newline at end of file
@@ -1,6 +1,49 @@
-from abc import ABC
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID
 from domain.ports.outbound.database.base_repository_port import BaseRepositoryPort
-from domain.models.entities.note import Note
+from domain.models.entities.note import Note, NoteSummary
 
 class NoteRepositoryPort(BaseRepositoryPort[Note], ABC):
-    pass
\ No newline at end of file
+    @abstractmethod
+    async def list_summaries(
+        self, user_id: Optional[UUID], skip: int, limit: int, request_id: str, cursor: Optional[str] = None
+    ) -> Tuple[List[NoteSummary], Optional[str]]:
+        """
+        Как list, но без content: поле отсекается проекцией в БД. Порядок и курсоры совпадают с list.
+        """
+        pass
+
+    @abstractmethod
+    async def list_page(
+        self, user_id: Optional[UUID], skip: int, limit: int, request_id: str,
+        cursor: Optional[str] = None, summaries: bool = False
+    ) -> Tuple[List[Any], Optional[str], int]:
+        """
+        Страница list (или list_summaries при summaries=True) вместе с total владельца.
+        Для user_id=None total не считается и равен 0.
+        """
+        pass
+
+    @abstractmethod
+    async def get_many(self, entity_ids: List[UUID], request_id: str) -> Dict[UUID, Note]:
+        """
+        Загружает несколько заметок: один запрос в кеш и один запрос в БД за недостающими.
+        Ненайденных id в результате нет.
+        """
+        pass
+
+    @abstractmethod
+    async def warm_owners(self, owner_ids: List[UUID], limit: int, request_id: str) -> int:
+        """
+        Кладёт в кеш первые limit заметок каждого владельца (в порядке list). Возвращает число заметок.
+        """
+        pass
+
+    @abstractmethod
+    def export(self, user_id: Optional[UUID], batch_size: int, request_id: str) -> AsyncIterator[List[Note]]:
+        """
+        Потоково отдаёт все заметки владельца (None - всех) батчами по batch_size в порядке list.
+        Следующий батч читается из БД только после того, как потребитель забрал предыдущий.
+        """
+        pass
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class QuotaRepositoryPort(ABC):
+    @abstractmethod
+    async def reserve(self, owner_id: UUID, limit: int, request_id: str, amount: int = 1) -> bool:
+        """
+        Атомарно проверяет лимит и резервирует amount единиц квоты владельца.
+        Returns:
+            bool: True, если квота зарезервирована; False, если лимит был бы превышен.
+        """
+        ...
+
+    @abstractmethod
+    async def release(self, owner_id: UUID, request_id: str, amount: int = 1) -> None:
+        """
+        Возвращает amount единиц квоты (после удаления или неудачного создания).
+        """
+        ...
+
+    @abstractmethod
+    async def reconcile(self, request_id: str) -> int:
+        """
+        Сверяет счётчики с фактическим числом сущностей и исправляет расхождения.
+        Returns:
+            int: количество исправленных счётчиков.
+        """
+        ...
@@ -1,7 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, List, Tuple
 
 class EventPublisherPort(ABC):
     @abstractmethod
     async def publish(self, event_name: str, payload: dict[str, Any]) -> None:
         ...
+
+    @abstractmethod
+    async def publish_many(self, events: List[Tuple[str, dict[str, Any]]]) -> None:
+        """
+        Публикует пачку событий (event_name, payload) одной операцией.
+        """
+        ...
@@ -1,11 +1,26 @@
 import uuid
 import grpc
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Any, Awaitable, Optional
+from uuid import UUID
 from domain.exceptions.auth import AuthenticationError
 from domain.ports.outbound.logger.logger_port import LoggerPort
 from domain.ports.outbound.security.auth_port import AuthPort
-from typing import Callable, Any, Awaitable
 import structlog.contextvars
 
+
+@dataclass(frozen=True)
+class GrpcIdentity:
+    user_id: UUID
+    role: str
+    request_id: str
+
+
+# Проверенная перехватчиком личность текущего вызова; servicer не проверяет токен повторно
+current_identity: ContextVar[Optional[GrpcIdentity]] = ContextVar("grpc_identity", default=None)
+
+
 class AuthInterceptor(grpc.aio.ServerInterceptor):
     def __init__(self, auth: AuthPort, logger: LoggerPort):
         self.auth = auth
@@ -22,29 +37,75 @@ class AuthInterceptor(grpc.aio.ServerInterceptor):
         request_id = metadata.get("request_id", str(uuid.uuid4()))  # Generate request_id if not provided
         logger = self.logger.bind(request_id=request_id, endpoint=method)
 
+        handler = await continuation(handler_call_details)
         if method in self._excluded_methods:
             logger.debug("Skipping auth for reflection endpoint")
-            return await continuation(handler_call_details)
+            return handler
+        if handler is None:
+            return None
 
         token = metadata.get("authorization", "").replace("Bearer ", "")
-        if not token:
-            logger.error("No token provided", metadata=metadata)
-            raise grpc.RpcError(grpc.StatusCode.UNAUTHENTICATED, "No token provided")
-
         try:
+            if not token:
+                raise AuthenticationError("No token provided")
             user_id, role = self.auth.verify_token(token)
-            logger.debug(f"Token verified, user_id={user_id}, role={role}")
-            # Set context variables for the servicer
-            structlog.contextvars.bind_contextvars(
-                user_id=str(user_id),
-                role=role,
-                request_id=request_id
-            )
-            try:
-                result = await continuation(handler_call_details)
-                return result
-            finally:
-                structlog.contextvars.clear_contextvars()
         except AuthenticationError as e:
-            logger.error("Authentication failed", error=str(e), metadata=metadata)
-            raise grpc.RpcError(grpc.StatusCode.UNAUTHENTICATED, str(e))
\ No newline at end of file
+            logger.error("Authentication failed", error=str(e), endpoint=method)
+            return _reject(handler, str(e))
+        logger.debug(f"Token verified, user_id={user_id}, role={role}")
+        return _with_identity(handler, GrpcIdentity(user_id, role, request_id))
+
+
+def _bind(identity: GrpcIdentity) -> None:
+    # grpc.aio выполняет каждый вызов в отдельной задаче со своей копией контекста,
+    # поэтому значения не переживают вызов и сбрасывать их не нужно
+    current_identity.set(identity)
+    structlog.contextvars.bind_contextvars(
+        user_id=str(identity.user_id), role=identity.role, request_id=identity.request_id
+    )
+
+
+def _with_identity(handler: grpc.RpcMethodHandler, identity: GrpcIdentity) -> grpc.RpcMethodHandler:
+    # Личность выставляется внутри самого обработчика: перехватчик лишь возвращает его серверу
+    if handler.unary_unary:
+        async def unary_unary(request, context):
+            _bind(identity)
+            return await handler.unary_unary(request, context)
+
+        return grpc.unary_unary_rpc_method_handler(
+            unary_unary, request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+    if handler.unary_stream:
+        async def unary_stream(request, context):
+            _bind(identity)
+            async for response in handler.unary_stream(request, context):
+                yield response
+
+        return grpc.unary_stream_rpc_method_handler(
+            unary_stream, request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+    # Потоковые запросы не используются; servicer проверит токен сам
+    return handler
+
+
+def _reject(handler: grpc.RpcMethodHandler, message: str) -> grpc.RpcMethodHandler:
+    async def abort(request, context):
+        await context.abort(grpc.StatusCode.UNAUTHENTICATED, message)
+
+    async def abort_stream(request, context):
+        await context.abort(grpc.StatusCode.UNAUTHENTICATED, message)
+        yield  # Недостижимо: делает функцию генератором, как у потокового обработчика
+
+    if handler.unary_unary:
+        return grpc.unary_unary_rpc_method_handler(
+            abort, request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+    if handler.unary_stream:
+        return grpc.unary_stream_rpc_method_handler(
+            abort_stream, request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+    return handler
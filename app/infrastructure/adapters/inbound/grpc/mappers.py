@@ -1,81 +1,137 @@
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Sequence, Union
+from google.protobuf.timestamp_pb2 import Timestamp
 from application.dto.note import (
-    NoteCreateDTO, NoteGetDTO, NoteListDTO, NoteUpdateDTO, NoteDeleteDTO,
-    NoteResponseDTO, NoteListResponseDTO
-)
-from infrastructure.adapters.inbound.grpc.dto.note import (
-    GrpcNoteCreateDTO, GrpcNoteGetDTO, GrpcNoteListDTO, GrpcNoteUpdateDTO,
-    GrpcNoteDeleteDTO, GrpcNoteResponseDTO, GrpcNoteListResponseDTO
+    NoteCreateDTO, NoteGetDTO, NoteListDTO, NoteUpdateDTO, NotePatchDTO, NoteDeleteDTO,
+    NoteBatchDTO, NoteBatchOperationDTO, NoteBatchGetDTO
 )
+from domain.models.bulk import BatchGetResult, BulkItemResult
+from domain.models.entities.note import Note, NoteSummary
+from domain.models.enums.bulk import BulkAction
+from domain.models.page import Page
 from infrastructure.adapters.inbound.grpc import note_pb2
 
-def grpc_to_service_create_dto(grpc_dto: GrpcNoteCreateDTO) -> NoteCreateDTO:
-    return NoteCreateDTO(title=grpc_dto.title, content=grpc_dto.content)
+PATCHABLE_FIELDS = {"title", "content"}
+_EPOCH = datetime(1970, 1, 1)
+
+# Запросы проверяются сервисными DTO, ответы строятся прямо из сущностей (методы сервиса *_note(s)) -
+# без pydantic-моделей на каждую заметку
+
+def proto_to_service_create_dto(request: note_pb2.CreateNoteRequest) -> NoteCreateDTO:
+    return NoteCreateDTO(title=request.title, content=request.content)
 
-def grpc_to_service_get_dto(grpc_dto: GrpcNoteGetDTO) -> NoteGetDTO:
-    return NoteGetDTO(entity_id=UUID(grpc_dto.entity_id))
+def proto_to_service_get_dto(request: note_pb2.GetNoteRequest) -> NoteGetDTO:
+    return NoteGetDTO(entity_id=UUID(request.entity_id))
 
-def grpc_to_service_list_dto(grpc_dto: GrpcNoteListDTO) -> NoteListDTO:
-    return NoteListDTO(skip=grpc_dto.skip, limit=grpc_dto.limit)
+def proto_to_service_list_dto(request: note_pb2.ListNotesRequest) -> NoteListDTO:
+    return NoteListDTO(skip=request.skip, limit=request.limit, cursor=request.page_token or None)
 
-def grpc_to_service_update_dto(grpc_dto: GrpcNoteUpdateDTO) -> NoteUpdateDTO:
-    return NoteUpdateDTO(
-        entity_id=UUID(grpc_dto.entity_id),
-        title=grpc_dto.title,
-        content=grpc_dto.content
+def proto_to_service_update_dto(request: note_pb2.UpdateNoteRequest) -> NoteUpdateDTO:
+    return NoteUpdateDTO(entity_id=UUID(request.entity_id), title=request.title, content=request.content)
+
+def proto_to_service_patch_dto(request: note_pb2.UpdateNoteRequest) -> NotePatchDTO:
+    paths = set(request.update_mask.paths)
+    unknown = paths - PATCHABLE_FIELDS
+    if unknown:
+        raise ValueError(f"Unsupported update_mask paths: {', '.join(sorted(unknown))}")
+    return NotePatchDTO(
+        entity_id=UUID(request.entity_id),
+        title=request.title if "title" in paths else None,
+        content=request.content if "content" in paths else None
     )
 
-def grpc_to_service_delete_dto(grpc_dto: GrpcNoteDeleteDTO) -> NoteDeleteDTO:
-    return NoteDeleteDTO(entity_id=UUID(grpc_dto.entity_id))
-
-def service_to_grpc_response_dto(service_dto: NoteResponseDTO) -> GrpcNoteResponseDTO:
-    return GrpcNoteResponseDTO(
-        id=str(service_dto.id),
-        title=service_dto.title,
-        content=service_dto.content,
-        owner_id=str(service_dto.owner_id),
-        created_at=service_dto.created_at.isoformat(),
-        updated_at=service_dto.updated_at.isoformat()
+def proto_to_service_delete_dto(request: note_pb2.DeleteNoteRequest) -> NoteDeleteDTO:
+    return NoteDeleteDTO(entity_id=UUID(request.entity_id))
+
+def proto_to_service_batch_create_dto(request: note_pb2.BatchCreateNotesRequest) -> NoteBatchDTO:
+    return NoteBatchDTO(
+        operations=[
+            NoteBatchOperationDTO(op=BulkAction.CREATE, title=note.title, content=note.content)
+            for note in request.notes
+        ],
+        ordered=request.ordered
     )
 
-def service_to_grpc_list_response_dto(service_dto: NoteListResponseDTO) -> GrpcNoteListResponseDTO:
-    return GrpcNoteListResponseDTO(
-        notes=[service_to_grpc_response_dto(note) for note in service_dto.notes],
-        total=service_dto.total
+def proto_to_service_batch_delete_dto(request: note_pb2.BatchDeleteNotesRequest) -> NoteBatchDTO:
+    return NoteBatchDTO(
+        operations=[
+            NoteBatchOperationDTO(op=BulkAction.DELETE, entity_id=UUID(entity_id))
+            for entity_id in request.entity_ids
+        ],
+        ordered=request.ordered
     )
 
-def proto_to_grpc_create_dto(request: note_pb2.CreateNoteRequest) -> GrpcNoteCreateDTO:
-    return GrpcNoteCreateDTO(title=request.title, content=request.content)
+def proto_to_service_batch_get_dto(request: note_pb2.BatchGetNotesRequest) -> NoteBatchGetDTO:
+    return NoteBatchGetDTO(entity_ids=[UUID(entity_id) for entity_id in request.entity_ids])
 
-def proto_to_grpc_get_dto(request: note_pb2.GetNoteRequest) -> GrpcNoteGetDTO:
-    return GrpcNoteGetDTO(entity_id=request.entity_id)
+def set_timestamp(target: Timestamp, value: datetime) -> None:
+    # Вдвое быстрее Timestamp.FromDatetime; наивное время в базе - UTC
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = value - _EPOCH
+    target.seconds = delta.days * 86400 + delta.seconds
+    target.nanos = delta.microseconds * 1000
 
-def proto_to_grpc_list_dto(request: note_pb2.ListNotesRequest) -> GrpcNoteListDTO:
-    return GrpcNoteListDTO(skip=request.skip, limit=request.limit)
+# Сообщения заполняются на месте (response.notes.add(), response.v2): вложенное сообщение,
+# переданное в конструктор, копируется целиком
 
-def proto_to_grpc_update_dto(request: note_pb2.UpdateNoteRequest) -> GrpcNoteUpdateDTO:
-    return GrpcNoteUpdateDTO(
-        entity_id=request.entity_id,
-        title=request.title,
-        content=request.content
-    )
+def _fill_v2(target: note_pb2.NoteV2, note: Union[Note, NoteSummary], content: str) -> None:
+    target.id = note.id.bytes
+    target.title = note.title
+    target.content = content
+    target.owner_id = note.owner_id.bytes
+    set_timestamp(target.created_at, note.created_at)
+    set_timestamp(target.updated_at, note.updated_at)
 
-def proto_to_grpc_delete_dto(request: note_pb2.DeleteNoteRequest) -> GrpcNoteDeleteDTO:
-    return GrpcNoteDeleteDTO(entity_id=request.entity_id)
-
-def grpc_to_proto_response(grpc_dto: GrpcNoteResponseDTO) -> note_pb2.NoteResponse:
-    return note_pb2.NoteResponse(
-        id=grpc_dto.id,
-        title=grpc_dto.title,
-        content=grpc_dto.content,
-        owner_id=grpc_dto.owner_id,
-        created_at=grpc_dto.created_at,
-        updated_at=grpc_dto.updated_at
-    )
+def _fill_note(target: note_pb2.NoteResponse, note: Note, v2: bool) -> None:
+    if v2:
+        _fill_v2(target.v2, note, note.content)
+        return
+    target.id = str(note.id)
+    target.title = note.title
+    target.content = note.content
+    target.owner_id = str(note.owner_id)
+    target.created_at = note.created_at.isoformat()
+    target.updated_at = note.updated_at.isoformat()
+
+def _fill_summary(target: note_pb2.NoteSummary, note: NoteSummary, v2: bool) -> None:
+    if v2:
+        _fill_v2(target.v2, note, "")
+        return
+    target.id = str(note.id)
+    target.title = note.title
+    target.owner_id = str(note.owner_id)
+    target.created_at = note.created_at.isoformat()
+    target.updated_at = note.updated_at.isoformat()
+
+def note_to_proto(note: Note, v2: bool = False) -> note_pb2.NoteResponse:
+    response = note_pb2.NoteResponse()
+    _fill_note(response, note, v2)
+    return response
+
+def page_to_proto_list_response(page: Page[Note], v2: bool = False) -> note_pb2.ListNotesResponse:
+    response = note_pb2.ListNotesResponse(total=page.total, next_page_token=page.next_cursor or "")
+    for note in page.items:
+        _fill_note(response.notes.add(), note, v2)
+    return response
+
+def page_to_proto_summary_list_response(page: Page[NoteSummary], v2: bool = False) -> note_pb2.ListNotesResponse:
+    response = note_pb2.ListNotesResponse(total=page.total, next_page_token=page.next_cursor or "")
+    for note in page.items:
+        _fill_summary(response.summaries.add(), note, v2)
+    return response
 
-def grpc_to_proto_list_response(grpc_dto: GrpcNoteListResponseDTO) -> note_pb2.ListNotesResponse:
-    return note_pb2.ListNotesResponse(
-        notes=[grpc_to_proto_response(note) for note in grpc_dto.notes],
-        total=grpc_dto.total
-    )
\ No newline at end of file
+def results_to_proto_batch_response(
+    results: Sequence[Union[BulkItemResult[Note], BatchGetResult[Note]]], v2: bool = False
+) -> note_pb2.BatchNotesResponse:
+    succeeded = sum(1 for item in results if item.ok)
+    response = note_pb2.BatchNotesResponse(succeeded=succeeded, failed=len(results) - succeeded)
+    for item in results:
+        result = response.results.add(
+            index=item.index, entity_id=str(item.entity_id) if item.entity_id else "",
+            error="" if item.ok else str(item.error)
+        )
+        if item.ok and item.entity:
+            _fill_note(result.note, item.entity, v2)
+    return response
@@ -6,19 +6,24 @@ from domain.ports.outbound.security.auth_port import AuthPort
 from domain.ports.outbound.logger.logger_port import LoggerPort
 from application.services.note import AsyncNoteService
 from infrastructure.adapters.inbound.grpc import note_pb2, note_pb2_grpc
-from infrastructure.adapters.inbound.grpc.dto.note import (
-    GrpcNoteCreateDTO, GrpcNoteGetDTO, GrpcNoteListDTO, GrpcNoteUpdateDTO,
-    GrpcNoteDeleteDTO, GrpcNoteResponseDTO, GrpcNoteListResponseDTO
-)
+from infrastructure.adapters.inbound.grpc.auth_interceptor import current_identity
 from infrastructure.adapters.inbound.grpc.mappers import (
-    proto_to_grpc_create_dto, proto_to_grpc_get_dto, proto_to_grpc_list_dto,
-    proto_to_grpc_update_dto, proto_to_grpc_delete_dto,
-    grpc_to_service_create_dto, grpc_to_service_get_dto, grpc_to_service_list_dto,
-    grpc_to_service_update_dto, grpc_to_service_delete_dto,
-    service_to_grpc_response_dto, service_to_grpc_list_response_dto,
-    grpc_to_proto_response, grpc_to_proto_list_response
+    proto_to_service_create_dto, proto_to_service_get_dto, proto_to_service_list_dto,
+    proto_to_service_update_dto, proto_to_service_patch_dto, proto_to_service_delete_dto,
+    proto_to_service_batch_create_dto, proto_to_service_batch_delete_dto, proto_to_service_batch_get_dto,
+    note_to_proto, page_to_proto_list_response, page_to_proto_summary_list_response,
+    results_to_proto_batch_response
+)
+from infrastructure.adapters.inbound.grpc.utils import (
+    async_handle_grpc_exceptions, async_handle_grpc_stream_exceptions, log_execution_time
 )
-from infrastructure.adapters.inbound.grpc.utils import async_handle_grpc_exceptions, log_execution_time
+
+# Клиент, приславший note-format: v2, получает заметки в NoteV2 (bytes UUID, Timestamp)
+NOTE_FORMAT_METADATA = "note-format"
+
+
+def _wants_v2(context: grpc.aio.ServicerContext) -> bool:
+    return any(key == NOTE_FORMAT_METADATA and value == "v2" for key, value in context.invocation_metadata())
 
 
 class NoteServiceServicer(note_pb2_grpc.NoteServiceServicer):
@@ -29,6 +34,11 @@ class NoteServiceServicer(note_pb2_grpc.NoteServiceServicer):
         self.logger.debug("NoteServiceServicer initialized")
 
     def _extract_metadata(self, context: grpc.aio.ServicerContext, method: str) -> Tuple[UUID, str, str]:
+        identity = current_identity.get()
+        if identity is not None:
+            return identity.user_id, identity.role, identity.request_id
+
+        # Без AuthInterceptor (например, servicer подключён к серверу напрямую) проверяем токен здесь
         metadata = dict(context.invocation_metadata())
         self.logger.debug(f"Metadata received: {metadata}", endpoint=method)
 
@@ -53,11 +63,10 @@ class NoteServiceServicer(note_pb2_grpc.NoteServiceServicer):
         logger = self.logger.bind(request_id=request_id, endpoint="CreateNote")
         logger.debug(f"Entering CreateNote with user_id={user_id}, role={role}")
 
-        grpc_dto = proto_to_grpc_create_dto(request)
-        service_dto = grpc_to_service_create_dto(grpc_dto)
-        result = await self.service.create(service_dto, user_id, role, request_id)
+        service_dto = proto_to_service_create_dto(request)
+        result = await self.service.create_note(service_dto, user_id, role, request_id)
         logger.info("Note created successfully")
-        return grpc_to_proto_response(service_to_grpc_response_dto(result))
+        return note_to_proto(result, _wants_v2(context))
 
     @async_handle_grpc_exceptions
     @log_execution_time
@@ -66,11 +75,10 @@ class NoteServiceServicer(note_pb2_grpc.NoteServiceServicer):
         logger = self.logger.bind(request_id=request_id, endpoint="GetNote")
         logger.debug(f"Entering GetNote with entity_id={request.entity_id}")
 
-        grpc_dto = proto_to_grpc_get_dto(request)
-        service_dto = grpc_to_service_get_dto(grpc_dto)
-        result = await self.service.get(service_dto, user_id, role, request_id)
+        service_dto = proto_to_service_get_dto(request)
+        result = await self.service.get_note(service_dto, user_id, role, request_id)
         logger.info("Note retrieved successfully")
-        return grpc_to_proto_response(service_to_grpc_response_dto(result))
+        return note_to_proto(result, _wants_v2(context))
 
     @async_handle_grpc_exceptions
     @log_execution_time
@@ -79,11 +87,14 @@ class NoteServiceServicer(note_pb2_grpc.NoteServiceServicer):
         logger = self.logger.bind(request_id=request_id, endpoint="ListNotes")
         logger.debug(f"Entering ListNotes with skip={request.skip}, limit={request.limit}")
 
-        grpc_dto = proto_to_grpc_list_dto(request)
-        service_dto = grpc_to_service_list_dto(grpc_dto)
-        result = await self.service.list(service_dto, user_id, role, request_id)
+        service_dto = proto_to_service_list_dto(request)
+        if request.view == note_pb2.NOTE_VIEW_SUMMARY:
+            page = await self.service.list_note_summaries(service_dto, user_id, role, request_id)
+            logger.info("Note summaries listed successfully")
+            return page_to_proto_summary_list_response(page, _wants_v2(context))
+        page = await self.service.list_notes(service_dto, user_id, role, request_id)
         logger.info("Notes listed successfully")
-        return grpc_to_proto_list_response(service_to_grpc_list_response_dto(result))
+        return page_to_proto_list_response(page, _wants_v2(context))
 
     @async_handle_grpc_exceptions
     @log_execution_time
@@ -92,11 +103,16 @@ class NoteServiceServicer(note_pb2_grpc.NoteServiceServicer):
         logger = self.logger.bind(request_id=request_id, endpoint="UpdateNote")
         logger.debug(f"Entering UpdateNote with entity_id={request.entity_id}")
 
-        grpc_dto = proto_to_grpc_update_dto(request)
-        service_dto = grpc_to_service_update_dto(grpc_dto)
-        result = await self.service.update(service_dto, user_id, role, request_id)
+        if request.HasField("update_mask") and request.update_mask.paths:
+            service_dto = proto_to_service_patch_dto(request)
+            result = await self.service.patch_note(service_dto, user_id, role, request_id)
+            logger.info("Note patched successfully", fields=list(request.update_mask.paths))
+            return note_to_proto(result, _wants_v2(context))
+
+        service_dto = proto_to_service_update_dto(request)
+        result = await self.service.update_note(service_dto, user_id, role, request_id)
         logger.info("Note updated successfully")
-        return grpc_to_proto_response(service_to_grpc_response_dto(result))
+        return note_to_proto(result, _wants_v2(context))
 
     @async_handle_grpc_exceptions
     @log_execution_time
@@ -105,8 +121,67 @@ class NoteServiceServicer(note_pb2_grpc.NoteServiceServicer):
         logger = self.logger.bind(request_id=request_id, endpoint="DeleteNote")
         logger.debug(f"Entering DeleteNote with entity_id={request.entity_id}")
 
-        grpc_dto = proto_to_grpc_delete_dto(request)
-        service_dto = grpc_to_service_delete_dto(grpc_dto)
+        service_dto = proto_to_service_delete_dto(request)
         await self.service.delete(service_dto, user_id, role, request_id)
         logger.info("Note deleted successfully")
-        return note_pb2.DeleteNoteResponse()
\ No newline at end of file
+        return note_pb2.DeleteNoteResponse()
+
+    @async_handle_grpc_exceptions
+    @log_execution_time
+    async def BatchCreateNotes(self, request, context):
+        user_id, role, request_id = self._extract_metadata(context, "BatchCreateNotes")
+        logger = self.logger.bind(request_id=request_id, endpoint="BatchCreateNotes")
+        logger.debug(f"Entering BatchCreateNotes with size={len(request.notes)}, ordered={request.ordered}")
+
+        service_dto = proto_to_service_batch_create_dto(request)
+        results = await self.service.batch_notes(service_dto, user_id, role, request_id)
+        response = results_to_proto_batch_response(results, _wants_v2(context))
+        logger.info("Note batch created", succeeded=response.succeeded, failed=response.failed)
+        return response
+
+    @async_handle_grpc_exceptions
+    @log_execution_time
+    async def BatchDeleteNotes(self, request, context):
+        user_id, role, request_id = self._extract_metadata(context, "BatchDeleteNotes")
+        logger = self.logger.bind(request_id=request_id, endpoint="BatchDeleteNotes")
+        logger.debug(f"Entering BatchDeleteNotes with size={len(request.entity_ids)}, ordered={request.ordered}")
+
+        service_dto = proto_to_service_batch_delete_dto(request)
+        results = await self.service.batch_notes(service_dto, user_id, role, request_id)
+        response = results_to_proto_batch_response(results, _wants_v2(context))
+        logger.info("Note batch deleted", succeeded=response.succeeded, failed=response.failed)
+        return response
+
+    @async_handle_grpc_exceptions
+    @log_execution_time
+    async def BatchGetNotes(self, request, context):
+        user_id, role, request_id = self._extract_metadata(context, "BatchGetNotes")
+        logger = self.logger.bind(request_id=request_id, endpoint="BatchGetNotes")
+        logger.debug(f"Entering BatchGetNotes with size={len(request.entity_ids)}")
+
+        service_dto = proto_to_service_batch_get_dto(request)
+        results = await self.service.batch_get_notes(service_dto, user_id, role, request_id)
+        response = results_to_proto_batch_response(results, _wants_v2(context))
+        logger.info("Note batch retrieved", succeeded=response.succeeded, failed=response.failed)
+        return response
+
+    @async_handle_grpc_stream_exceptions
+    async def ExportNotes(self, request, context):
+        user_id, role, request_id = self._extract_metadata(context, "ExportNotes")
+        logger = self.logger.bind(request_id=request_id, endpoint="ExportNotes")
+        logger.debug(f"Entering ExportNotes with user_id={user_id}, role={role}")
+
+        v2 = _wants_v2(context)
+        # Каждый yield ждёт, пока gRPC примет сообщение (flow control HTTP/2), поэтому медленный клиент
+        # притормаживает чтение курсора, и в памяти остаётся не больше одного батча
+        exported = 0
+        try:
+            async for notes in self.service.export_notes(user_id, role, request_id):
+                for note in notes:
+                    yield note_to_proto(note, v2)
+                exported += len(notes)
+        except Exception as e:
+            # Часть заметок клиент уже получил; статус ошибки поток получит от декоратора
+            logger.error("Failed to export notes", error=str(e), exported=exported)
+            raise
+        logger.info("Notes exported successfully", count=exported)
@@ -4,11 +4,16 @@ from . import note_pb2, note_pb2_grpc
 from infrastructure.adapters.inbound.grpc.note_service import NoteServiceServicer
 from infrastructure.adapters.inbound.grpc.auth_interceptor import AuthInterceptor
 from domain.ports.outbound.logger.logger_port import LoggerPort
+from infrastructure.config import settings
 
 async def start_grpc_server(
     note_service: NoteServiceServicer, auth_interceptor: AuthInterceptor, logger: LoggerPort
-):
-    server = grpc.aio.server(interceptors=[auth_interceptor])
+) -> grpc.aio.Server:
+    """
+    Запускает сервер и возвращает его, не дожидаясь завершения; останавливает вызывающий через server.stop.
+    """
+    # SO_REUSEPORT: воркеры слушают один порт, соединения между ними распределяет ядро
+    server = grpc.aio.server(interceptors=[auth_interceptor], options=[("grpc.so_reuseport", 1)])
     note_pb2_grpc.add_NoteServiceServicer_to_server(note_service, server)
 
     # Enable gRPC reflection
@@ -18,8 +23,8 @@ async def start_grpc_server(
     )
     reflection.enable_server_reflection(SERVICE_NAMES, server)
 
-    server.add_insecure_port("[::]:50051")
-    logger.info("Starting async gRPC server on port 50051 with reflection enabled")
+    server.add_insecure_port(f"[::]:{settings.grpc_port}")
+    logger.info(f"Starting async gRPC server on port {settings.grpc_port} with reflection enabled")
     await server.start()
     logger.info("Async gRPC server started successfully")
-    await server.wait_for_termination()
\ No newline at end of file
+    return server
@@ -3,7 +3,8 @@ import time
 import grpc
 from domain.ports.outbound.logger.logger_port import LoggerPort
 from domain.exceptions import (
-    NotFoundError, AccessDeniedError, AuthenticationError, LimitExceededError, DatabaseException
+    NotFoundError, AccessDeniedError, AuthenticationError, LimitExceededError, DatabaseException,
+    ValidationException
 )
 
 def log_execution_time(func):
@@ -18,24 +19,39 @@ def log_execution_time(func):
         return result
     return wrapper
 
+async def _abort_with_status(self, context: grpc.aio.ServicerContext, method: str, e: Exception) -> None:
+    if isinstance(e, (ValueError, ValidationException)):
+        await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+    elif isinstance(e, NotFoundError):
+        await context.abort(grpc.StatusCode.NOT_FOUND, str(e))
+    elif isinstance(e, AccessDeniedError):
+        await context.abort(grpc.StatusCode.PERMISSION_DENIED, str(e))
+    elif isinstance(e, AuthenticationError):
+        await context.abort(grpc.StatusCode.UNAUTHENTICATED, str(e))
+    elif isinstance(e, LimitExceededError):
+        await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(e))
+    elif isinstance(e, DatabaseException):
+        await context.abort(grpc.StatusCode.INTERNAL, str(e))
+    else:
+        self.logger.exception(f"Unexpected error in {method}", error=str(e))
+        await context.abort(grpc.StatusCode.INTERNAL, "Internal server error")
+
 def async_handle_grpc_exceptions(func):
     @wraps(func)
     async def wrapper(self, *args, **kwargs):
         try:
             return await func(self, *args, **kwargs)
-        except ValueError as e:
-            await args[1].abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
-        except NotFoundError as e:
-            await args[1].abort(grpc.StatusCode.NOT_FOUND, str(e))
-        except AccessDeniedError as e:
-            await args[1].abort(grpc.StatusCode.PERMISSION_DENIED, str(e))
-        except AuthenticationError as e:
-            await args[1].abort(grpc.StatusCode.UNAUTHENTICATED, str(e))
-        except LimitExceededError as e:
-            await args[1].abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(e))
-        except DatabaseException as e:
-            await args[1].abort(grpc.StatusCode.INTERNAL, str(e))
         except Exception as e:
-            self.logger.exception(f"Unexpected error in {func.__name__}", error=str(e))
-            await args[1].abort(grpc.StatusCode.INTERNAL, "Internal server error")
-    return wrapper
\ No newline at end of file
+            await _abort_with_status(self, args[1], func.__name__, e)
+    return wrapper
+
+def async_handle_grpc_stream_exceptions(func):
+    # Для server-streaming методов: обработчик - асинхронный генератор, ответы отдаются по мере чтения клиентом
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            async for response in func(self, *args, **kwargs):
+                yield response
+        except Exception as e:
+            await _abort_with_status(self, args[1], func.__name__, e)
+    return wrapper
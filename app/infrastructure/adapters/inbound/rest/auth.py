@@ -1,19 +1,19 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from dishka.integrations.fastapi import FromDishka, inject
 from uuid import UUID
 from domain.ports.outbound.security.auth_port import AuthPort
 from domain.ports.outbound.logger.logger_port import LoggerPort
 from domain.exceptions import AuthenticationError
-from infrastructure.di.container import get_container
 
 security = HTTPBearer()
 
+@inject
 async def get_current_user(
+    auth: FromDishka[AuthPort],
+    logger: FromDishka[LoggerPort],
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> tuple[UUID, str]:
-    container = await get_container()
-    auth = await container.get(AuthPort)
-    logger = await container.get(LoggerPort)
     logger = logger.bind(component="RESTAuth")
     try:
         token = credentials.credentials
@@ -22,4 +22,4 @@ async def get_current_user(
         return user_id, role
     except AuthenticationError as e:
         logger.error("Authentication failed", error=str(e))
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
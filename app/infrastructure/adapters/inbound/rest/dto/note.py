@@ -1,7 +1,7 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from uuid import UUID
 from datetime import datetime
-from typing import List
+from typing import List, Literal, Optional
 
 class RestNoteCreateDTO(BaseModel):
     title: str = Field(..., min_length=1, max_length=100)
@@ -13,11 +13,23 @@ class RestNoteGetDTO(BaseModel):
 class RestNoteListDTO(BaseModel):
     skip: int = Field(0, ge=0)
     limit: int = Field(100, ge=1, le=1000)
+    cursor: Optional[str] = None
+    fields: Literal["full", "summary"] = "full"  # summary - без content
 
 class RestNoteUpdateDTO(BaseModel):
     title: str = Field(..., min_length=1, max_length=100)
     content: str = Field(..., min_length=1)
 
+class RestNotePatchDTO(BaseModel):
+    title: Optional[str] = Field(None, min_length=1, max_length=100)
+    content: Optional[str] = Field(None, min_length=1)
+
+    @model_validator(mode="after")
+    def check_not_empty(self) -> "RestNotePatchDTO":
+        if self.title is None and self.content is None:
+            raise ValueError("At least one of 'title' or 'content' must be provided")
+        return self
+
 class RestNoteDeleteDTO(BaseModel):
     entity_id: UUID = Field(...)
 
@@ -39,4 +51,55 @@ class RestNoteListResponseDTO(BaseModel):
     notes: List[RestNoteResponseDTO] = Field(default_factory=list)
     total: int = 0
     skip: int = 0
-    limit: int = 100
\ No newline at end of file
+    limit: int = 100
+    next_cursor: Optional[str] = None
+
+class RestNoteSummaryResponseDTO(BaseModel):
+    id: UUID
+    title: str
+    owner_id: UUID
+    created_at: datetime
+    updated_at: datetime
+
+class RestNoteSummaryListResponseDTO(BaseModel):
+    notes: List[RestNoteSummaryResponseDTO] = Field(default_factory=list)
+    total: int = 0
+    skip: int = 0
+    limit: int = 100
+    next_cursor: Optional[str] = None
+
+class RestNoteBatchOperationDTO(BaseModel):
+    op: Literal["create", "update", "delete"]
+    entity_id: Optional[UUID] = None
+    title: Optional[str] = Field(None, min_length=1, max_length=100)
+    content: Optional[str] = Field(None, min_length=1)
+
+class RestNoteBatchDTO(BaseModel):
+    operations: List[RestNoteBatchOperationDTO] = Field(..., min_length=1, max_length=1000)
+    ordered: bool = True
+
+class RestNoteBatchItemResultDTO(BaseModel):
+    index: int
+    op: str
+    entity_id: Optional[UUID] = None
+    note: Optional[RestNoteResponseDTO] = None
+    error: Optional[str] = None
+
+class RestNoteBatchResponseDTO(BaseModel):
+    results: List[RestNoteBatchItemResultDTO] = Field(default_factory=list)
+    succeeded: int = 0
+    failed: int = 0
+
+class RestNoteBatchGetDTO(BaseModel):
+    entity_ids: List[UUID] = Field(..., min_length=1, max_length=1000)
+
+class RestNoteBatchGetItemDTO(BaseModel):
+    index: int
+    entity_id: UUID
+    note: Optional[RestNoteResponseDTO] = None
+    error: Optional[str] = None
+
+class RestNoteBatchGetResponseDTO(BaseModel):
+    results: List[RestNoteBatchGetItemDTO] = Field(default_factory=list)
+    succeeded: int = 0
+    failed: int = 0
@@ -1,11 +1,15 @@
 from uuid import UUID
 from application.dto.note import (
-    NoteCreateDTO, NoteGetDTO, NoteListDTO, NoteUpdateDTO, NoteDeleteDTO,
-    NoteResponseDTO, NoteListResponseDTO
+    NoteCreateDTO, NoteGetDTO, NoteListDTO, NoteUpdateDTO, NotePatchDTO, NoteDeleteDTO,
+    NoteResponseDTO, NoteListResponseDTO, NoteSummaryListResponseDTO, NoteBatchDTO, NoteBatchOperationDTO, NoteBatchResponseDTO,
+    NoteBatchGetDTO, NoteBatchGetResponseDTO
 )
 from infrastructure.adapters.inbound.rest.dto.note import (
-    RestNoteCreateDTO, RestNoteGetDTO, RestNoteListDTO, RestNoteUpdateDTO,
-    RestNoteDeleteDTO, RestNoteResponseDTO, RestNoteListResponseDTO
+    RestNoteCreateDTO, RestNoteGetDTO, RestNoteListDTO, RestNoteUpdateDTO, RestNotePatchDTO,
+    RestNoteDeleteDTO, RestNoteResponseDTO, RestNoteListResponseDTO,
+    RestNoteSummaryResponseDTO, RestNoteSummaryListResponseDTO,
+    RestNoteBatchDTO, RestNoteBatchItemResultDTO, RestNoteBatchResponseDTO,
+    RestNoteBatchGetDTO, RestNoteBatchGetItemDTO, RestNoteBatchGetResponseDTO
 )
 
 def rest_to_service_create_dto(rest_dto: RestNoteCreateDTO) -> NoteCreateDTO:
@@ -15,11 +19,14 @@ def rest_to_service_get_dto(rest_dto: RestNoteGetDTO) -> NoteGetDTO:
     return NoteGetDTO(entity_id=rest_dto.entity_id)
 
 def rest_to_service_list_dto(rest_dto: RestNoteListDTO) -> NoteListDTO:
-    return NoteListDTO(skip=rest_dto.skip, limit=rest_dto.limit)
+    return NoteListDTO(skip=rest_dto.skip, limit=rest_dto.limit, cursor=rest_dto.cursor)
 
 def rest_to_service_update_dto(rest_dto: RestNoteUpdateDTO, entity_id: UUID) -> NoteUpdateDTO:
     return NoteUpdateDTO(entity_id=entity_id, title=rest_dto.title, content=rest_dto.content)
 
+def rest_to_service_patch_dto(rest_dto: RestNotePatchDTO, entity_id: UUID) -> NotePatchDTO:
+    return NotePatchDTO(entity_id=entity_id, title=rest_dto.title, content=rest_dto.content)
+
 def rest_to_service_delete_dto(rest_dto: RestNoteDeleteDTO) -> NoteDeleteDTO:
     return NoteDeleteDTO(entity_id=rest_dto.entity_id)
 
@@ -38,5 +45,67 @@ def service_to_rest_list_response_dto(service_dto: NoteListResponseDTO) -> RestN
         notes=[service_to_rest_response_dto(note) for note in service_dto.notes],
         total=service_dto.total,
         skip=service_dto.skip,
-        limit=service_dto.limit
-    )
\ No newline at end of file
+        limit=service_dto.limit,
+        next_cursor=service_dto.next_cursor
+    )
+
+def service_to_rest_summary_list_response_dto(service_dto: NoteSummaryListResponseDTO) -> RestNoteSummaryListResponseDTO:
+    return RestNoteSummaryListResponseDTO(
+        notes=[
+            RestNoteSummaryResponseDTO(
+                id=note.id,
+                title=note.title,
+                owner_id=note.owner_id,
+                created_at=note.created_at,
+                updated_at=note.updated_at
+            )
+            for note in service_dto.notes
+        ],
+        total=service_dto.total,
+        skip=service_dto.skip,
+        limit=service_dto.limit,
+        next_cursor=service_dto.next_cursor
+    )
+
+def rest_to_service_batch_dto(rest_dto: RestNoteBatchDTO) -> NoteBatchDTO:
+    return NoteBatchDTO(
+        operations=[
+            NoteBatchOperationDTO(op=item.op, entity_id=item.entity_id, title=item.title, content=item.content)
+            for item in rest_dto.operations
+        ],
+        ordered=rest_dto.ordered
+    )
+
+def service_to_rest_batch_response_dto(service_dto: NoteBatchResponseDTO) -> RestNoteBatchResponseDTO:
+    return RestNoteBatchResponseDTO(
+        results=[
+            RestNoteBatchItemResultDTO(
+                index=item.index,
+                op=item.op.value,
+                entity_id=item.entity_id,
+                note=service_to_rest_response_dto(item.note) if item.note else None,
+                error=item.error
+            )
+            for item in service_dto.results
+        ],
+        succeeded=service_dto.succeeded,
+        failed=service_dto.failed
+    )
+
+def rest_to_service_batch_get_dto(rest_dto: RestNoteBatchGetDTO) -> NoteBatchGetDTO:
+    return NoteBatchGetDTO(entity_ids=rest_dto.entity_ids)
+
+def service_to_rest_batch_get_response_dto(service_dto: NoteBatchGetResponseDTO) -> RestNoteBatchGetResponseDTO:
+    return RestNoteBatchGetResponseDTO(
+        results=[
+            RestNoteBatchGetItemDTO(
+                index=item.index,
+                entity_id=item.entity_id,
+                note=service_to_rest_response_dto(item.note) if item.note else None,
+                error=item.error
+            )
+            for item in service_dto.results
+        ],
+        succeeded=service_dto.succeeded,
+        failed=service_dto.failed
+    )
@@ -0,0 +1,9 @@
+from typing import Dict
+from fastapi import APIRouter
+from infrastructure.metrics import metrics
+
+router = APIRouter(tags=["metrics"])
+
+@router.get("/metrics", response_model=Dict[str, float])
+async def get_metrics():
+    return metrics.snapshot()
@@ -1,30 +1,38 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import json
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+from dishka.integrations.fastapi import FromDishka, inject
+from typing import Literal, Optional, Union
 from uuid import UUID, uuid4
 from application.services.note import AsyncNoteService
 from infrastructure.adapters.inbound.rest.dto.note import (
-    RestNoteCreateDTO, RestNoteGetDTO, RestNoteListDTO, RestNoteUpdateDTO,
-    RestNoteDeleteDTO, RestNoteResponseDTO, RestNoteListResponseDTO
+    RestNoteCreateDTO, RestNoteGetDTO, RestNoteListDTO, RestNoteUpdateDTO, RestNotePatchDTO,
+    RestNoteDeleteDTO, RestNoteResponseDTO, RestNoteListResponseDTO, RestNoteSummaryListResponseDTO,
+    RestNoteBatchDTO, RestNoteBatchResponseDTO, RestNoteBatchGetDTO, RestNoteBatchGetResponseDTO
 )
 from infrastructure.adapters.inbound.rest.mappers import (
     rest_to_service_create_dto, rest_to_service_get_dto, rest_to_service_list_dto,
-    rest_to_service_update_dto, rest_to_service_delete_dto,
-    service_to_rest_response_dto, service_to_rest_list_response_dto
+    rest_to_service_update_dto, rest_to_service_patch_dto, rest_to_service_delete_dto,
+    service_to_rest_response_dto, service_to_rest_list_response_dto, service_to_rest_summary_list_response_dto,
+    rest_to_service_batch_dto, service_to_rest_batch_response_dto,
+    rest_to_service_batch_get_dto, service_to_rest_batch_get_response_dto
+)
+from domain.exceptions import (
+    AuthenticationError, NotFoundError, AccessDeniedError, LimitExceededError, ValidationException
 )
-from domain.exceptions import AuthenticationError, NotFoundError, AccessDeniedError, LimitExceededError
 from domain.ports.outbound.logger.logger_port import LoggerPort
-from infrastructure.di.container import get_container
 from .auth import get_current_user
 
 router = APIRouter(prefix="/notes", tags=["notes"])
 
 @router.post("/", response_model=RestNoteResponseDTO, status_code=status.HTTP_201_CREATED)
+@inject
 async def create_note(
     dto: RestNoteCreateDTO,
+    service: FromDishka[AsyncNoteService],
+    logger: FromDishka[LoggerPort],
     user: tuple[UUID, str] = Depends(get_current_user),
 ):
-    container = await get_container()
-    service = await container.get(AsyncNoteService)
-    logger = await container.get(LoggerPort)
     request_id = str(uuid4())
     logger = logger.bind(request_id=request_id, endpoint="create_note")
     try:
@@ -41,14 +49,89 @@ async def create_note(
         logger.exception("Failed to create note", error=str(e))
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
+@router.post("/batch", response_model=RestNoteBatchResponseDTO)
+@inject
+async def batch_notes(
+    dto: RestNoteBatchDTO,
+    service: FromDishka[AsyncNoteService],
+    logger: FromDishka[LoggerPort],
+    user: tuple[UUID, str] = Depends(get_current_user),
+):
+    request_id = str(uuid4())
+    logger = logger.bind(request_id=request_id, endpoint="batch_notes")
+    try:
+        user_id, role = user
+        service_dto = rest_to_service_batch_dto(dto)
+        result = await service.batch(service_dto, user_id, role, request_id)
+        logger.info("Note batch processed", succeeded=result.succeeded, failed=result.failed)
+        return service_to_rest_batch_response_dto(result)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except AuthenticationError as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+    except Exception as e:
+        logger.exception("Failed to process note batch", error=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+
+@router.post("/batch-get", response_model=RestNoteBatchGetResponseDTO)
+@inject
+async def batch_get_notes(
+    dto: RestNoteBatchGetDTO,
+    service: FromDishka[AsyncNoteService],
+    logger: FromDishka[LoggerPort],
+    user: tuple[UUID, str] = Depends(get_current_user),
+):
+    request_id = str(uuid4())
+    logger = logger.bind(request_id=request_id, endpoint="batch_get_notes")
+    try:
+        user_id, role = user
+        service_dto = rest_to_service_batch_get_dto(dto)
+        result = await service.batch_get(service_dto, user_id, role, request_id)
+        logger.info("Note batch retrieved", succeeded=result.succeeded, failed=result.failed)
+        response = service_to_rest_batch_get_response_dto(result)
+        # Как и в list_notes, сериализуем сами, без повторной валидации по response_model
+        return Response(content=response.model_dump_json(), media_type="application/json")
+    except AuthenticationError as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+    except Exception as e:
+        logger.exception("Failed to get note batch", error=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+
+@router.get("/export", response_class=StreamingResponse)
+@inject
+async def export_notes(
+    service: FromDishka[AsyncNoteService],
+    logger: FromDishka[LoggerPort],
+    user: tuple[UUID, str] = Depends(get_current_user),
+):
+    request_id = str(uuid4())
+    logger = logger.bind(request_id=request_id, endpoint="export_notes")
+    user_id, role = user
+
+    async def ndjson():
+        # Один чанк на батч курсора; следующий батч читается, когда сервер отправил предыдущий клиенту
+        exported = 0
+        try:
+            async for notes in service.export(user_id, role, request_id):
+                yield b"".join(service_to_rest_response_dto(note).model_dump_json().encode() + b"\n" for note in notes)
+                exported += len(notes)
+        except Exception as e:
+            # Статус 200 уже отправлен: обрыв выгрузки клиент узнаёт по последней строке с ошибкой
+            logger.exception("Failed to export notes", error=str(e), exported=exported)
+            yield json.dumps({"error": "Internal server error", "request_id": request_id}).encode() + b"\n"
+            return
+        logger.info("Notes exported successfully", count=exported)
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
 @router.get("/{entity_id}", response_model=RestNoteResponseDTO)
+@inject
 async def get_note(
     entity_id: UUID,
+    service: FromDishka[AsyncNoteService],
+    logger: FromDishka[LoggerPort],
     user: tuple[UUID, str] = Depends(get_current_user),
 ):
-    container = await get_container()
-    service = await container.get(AsyncNoteService)
-    logger = await container.get(LoggerPort)
     request_id = str(uuid4())
     logger = logger.bind(request_id=request_id, endpoint="get_note")
     try:
@@ -67,23 +150,34 @@ async def get_note(
         logger.exception("Failed to get note", error=str(e))
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
-@router.get("/", response_model=RestNoteListResponseDTO)
+@router.get("/", response_model=Union[RestNoteListResponseDTO, RestNoteSummaryListResponseDTO])
+@inject
 async def list_notes(
+    service: FromDishka[AsyncNoteService],
+    logger: FromDishka[LoggerPort],
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    fields: Literal["full", "summary"] = "full",
     user: tuple[UUID, str] = Depends(get_current_user),
 ):
-    container = await get_container()
-    service = await container.get(AsyncNoteService)
-    logger = await container.get(LoggerPort)
     request_id = str(uuid4())
     logger = logger.bind(request_id=request_id, endpoint="list_notes")
     try:
         user_id, role = user
-        dto = rest_to_service_list_dto(RestNoteListDTO(skip=skip, limit=limit))
-        result = await service.list(dto, user_id, role, request_id)
-        logger.info("Notes listed successfully")
-        return service_to_rest_list_response_dto(result)
+        rest_dto = RestNoteListDTO(skip=skip, limit=limit, cursor=cursor, fields=fields)
+        dto = rest_to_service_list_dto(rest_dto)
+        if rest_dto.fields == "summary":
+            response = service_to_rest_summary_list_response_dto(
+                await service.list_summaries(dto, user_id, role, request_id)
+            )
+        else:
+            response = service_to_rest_list_response_dto(await service.list(dto, user_id, role, request_id))
+        logger.info("Notes listed successfully", fields=rest_dto.fields)
+        # Сериализуем сами: иначе FastAPI ещё раз валидирует каждую заметку по response_model
+        return Response(content=response.model_dump_json(), media_type="application/json")
+    except ValidationException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except AuthenticationError as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
     except Exception as e:
@@ -91,14 +185,14 @@ async def list_notes(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 @router.put("/{entity_id}", response_model=RestNoteResponseDTO)
+@inject
 async def update_note(
     entity_id: UUID,
     dto: RestNoteUpdateDTO,
+    service: FromDishka[AsyncNoteService],
+    logger: FromDishka[LoggerPort],
     user: tuple[UUID, str] = Depends(get_current_user),
 ):
-    container = await get_container()
-    service = await container.get(AsyncNoteService)
-    logger = await container.get(LoggerPort)
     request_id = str(uuid4())
     logger = logger.bind(request_id=request_id, endpoint="update_note")
     try:
@@ -117,14 +211,41 @@ async def update_note(
         logger.exception("Failed to update note", error=str(e))
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
+@router.patch("/{entity_id}", response_model=RestNoteResponseDTO)
+@inject
+async def patch_note(
+    entity_id: UUID,
+    dto: RestNotePatchDTO,
+    service: FromDishka[AsyncNoteService],
+    logger: FromDishka[LoggerPort],
+    user: tuple[UUID, str] = Depends(get_current_user),
+):
+    request_id = str(uuid4())
+    logger = logger.bind(request_id=request_id, endpoint="patch_note")
+    try:
+        user_id, role = user
+        service_dto = rest_to_service_patch_dto(dto, entity_id)
+        result = await service.patch(service_dto, user_id, role, request_id)
+        logger.info("Note patched successfully")
+        return service_to_rest_response_dto(result)
+    except NotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except AccessDeniedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except AuthenticationError as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+    except Exception as e:
+        logger.exception("Failed to patch note", error=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+
 @router.delete("/{entity_id}", status_code=status.HTTP_204_NO_CONTENT)
+@inject
 async def delete_note(
     entity_id: UUID,
+    service: FromDishka[AsyncNoteService],
+    logger: FromDishka[LoggerPort],
     user: tuple[UUID, str] = Depends(get_current_user),
 ):
-    container = await get_container()
-    service = await container.get(AsyncNoteService)
-    logger = await container.get(LoggerPort)
     request_id = str(uuid4())
     logger = logger.bind(request_id=request_id, endpoint="delete_note")
     try:
@@ -0,0 +1,31 @@
+import uuid
+from typing import List
+from uuid import UUID
+from domain.ports.outbound.database.note import NoteRepositoryPort
+from domain.ports.outbound.logger.logger_port import LoggerPort
+
+
+def parse_owner_ids(raw: str, logger: LoggerPort) -> List[UUID]:
+    owner_ids = []
+    for item in filter(None, (part.strip() for part in raw.split(","))):
+        try:
+            owner_ids.append(UUID(item))
+        except ValueError:
+            logger.warning("Skipping malformed owner id in cache warm-up list", owner_id=item)
+    return owner_ids
+
+
+async def warm_hot_owners(repo: NoteRepositoryPort, owners: str, limit: int, logger: LoggerPort):
+    logger = logger.bind(component="CacheWarmup")
+    owner_ids = parse_owner_ids(owners, logger)
+    if not owner_ids:
+        logger.info("Cache warm-up disabled")
+        return
+    request_id = str(uuid.uuid4())
+    logger.info("Cache warm-up started", owners=len(owner_ids), limit=limit, request_id=request_id)
+    try:
+        warmed = await repo.warm_owners(owner_ids, limit, request_id)
+        logger.info("Cache warm-up completed", notes=warmed, request_id=request_id)
+    except Exception as e:
+        # Прогрев - оптимизация: сервис стартует и с холодным кешем
+        logger.exception("Cache warm-up failed", error=str(e), request_id=request_id)
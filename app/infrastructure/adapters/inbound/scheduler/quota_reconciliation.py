@@ -0,0 +1,20 @@
+import asyncio
+import uuid
+from domain.ports.outbound.database.quota import QuotaRepositoryPort
+from domain.ports.outbound.logger.logger_port import LoggerPort
+
+
+async def start_quota_reconciliation(quota: QuotaRepositoryPort, interval: int, logger: LoggerPort):
+    logger = logger.bind(component="QuotaReconciliation")
+    if interval <= 0:
+        logger.info("Quota reconciliation disabled")
+        return
+    logger.info("Quota reconciliation started", interval=interval)
+    while True:
+        await asyncio.sleep(interval)
+        request_id = str(uuid.uuid4())
+        try:
+            await quota.reconcile(request_id)
+        except Exception as e:
+            # Сбой сверки не должен останавливать периодическую задачу
+            logger.exception("Quota reconciliation failed", error=str(e), request_id=request_id)
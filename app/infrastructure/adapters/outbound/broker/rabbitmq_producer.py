@@ -1,5 +1,5 @@
 import json
-from typing import Any
+from typing import Any, List, Tuple
 import aio_pika
 import asyncio
 from infrastructure.config import settings
@@ -20,12 +20,8 @@ class AsyncRabbitMQPublisher(EventPublisherPort):
             try:
                 self.connection = await aio_pika.connect_robust(settings.rabbitmq_uri)
                 self.channel = await self.connection.channel()
-                # Attempt to delete the existing exchange to resolve durable mismatch
-                try:
-                    await self.channel.exchange_delete("events")
-                    self.logger.info("Existing 'events' exchange deleted to resolve durable mismatch")
-                except Exception as e:
-                    self.logger.debug("No existing 'events' exchange to delete or error occurred", error=str(e))
+                # Обменник не удаляем: его привязки используют консьюмеры, а воркеры стартуют и перезапускаются
+                # независимо. Старый недолговечный обменник с тем же именем нужно удалить вручную один раз
                 self.exchange = await self.channel.declare_exchange(
                     "events",
                     aio_pika.ExchangeType.TOPIC,
@@ -51,13 +47,7 @@ class AsyncRabbitMQPublisher(EventPublisherPort):
     async def publish(self, event_name: str, data: Any) -> None:
         self.logger.info(f"Publishing event", event_name=event_name)
         try:
-            # Serialize the data to JSON and encode to bytes
-            message_body = json.dumps(data).encode('utf-8')
-            message = aio_pika.Message(
-                body=message_body,
-                content_type='application/json',
-                delivery_mode=aio_pika.DeliveryMode.PERSISTENT
-            )
+            message = self._to_message(data)
             await self.exchange.publish(
                 message,
                 routing_key=event_name
@@ -65,4 +55,28 @@ class AsyncRabbitMQPublisher(EventPublisherPort):
             self.logger.debug(f"Event published successfully", event_name=event_name)
         except Exception as e:
             self.logger.exception(f"Failed to publish event", event_name=event_name, error=str(e))
-            raise
\ No newline at end of file
+            raise
+
+    async def publish_many(self, events: List[Tuple[str, Any]]) -> None:
+        if not events:
+            return
+        self.logger.info("Publishing event batch", count=len(events))
+        try:
+            # Публикации идут по одному каналу без ожидания друг друга, подтверждения собираются вместе
+            await asyncio.gather(*(
+                self.exchange.publish(self._to_message(data), routing_key=event_name)
+                for event_name, data in events
+            ))
+            self.logger.debug("Event batch published successfully", count=len(events))
+        except Exception as e:
+            self.logger.exception("Failed to publish event batch", count=len(events), error=str(e))
+            raise
+
+    @staticmethod
+    def _to_message(data: Any) -> aio_pika.Message:
+        # Serialize the data to JSON and encode to bytes
+        return aio_pika.Message(
+            body=json.dumps(data).encode('utf-8'),
+            content_type='application/json',
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT
+        )
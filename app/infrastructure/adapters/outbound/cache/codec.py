@@ -0,0 +1,127 @@
+import base64
+import json
+import struct
+from abc import ABC, abstractmethod
+from dataclasses import asdict, is_dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID
+from domain.models.entities.note import Note
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+class CacheCodec(ABC):
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        ...
+
+    @abstractmethod
+    def decode(self, raw: bytes) -> Any:
+        """
+        Raises:
+            ValueError: если данные повреждены или формат неизвестен.
+        """
+        ...
+
+
+class JsonCacheCodec(CacheCodec):
+    """
+    Исходный формат кеша: JSON, UUID и datetime в полях id/owner_id/created_at/updated_at хранятся строками.
+    bytes хранятся объектом {"__bytes__": base64}.
+    """
+
+    _UUID_FIELDS = ("id", "owner_id")
+    _DATETIME_FIELDS = ("created_at", "updated_at")
+
+    def encode(self, value: Any) -> bytes:
+        if isinstance(value, (bytes, bytearray)):
+            return json.dumps({"__bytes__": base64.b64encode(value).decode("ascii")}).encode("utf-8")
+        if is_dataclass(value):
+            value = asdict(value)
+        if isinstance(value, dict):
+            value = value.copy()  # Avoid modifying the original dict
+            for field in self._UUID_FIELDS:
+                if field in value and isinstance(value[field], UUID):
+                    value[field] = str(value[field])
+            for field in self._DATETIME_FIELDS:
+                if field in value and isinstance(value[field], datetime):
+                    value[field] = value[field].isoformat()
+        return json.dumps(value).encode("utf-8")
+
+    def decode(self, raw: bytes) -> Any:
+        value = json.loads(raw)
+        if isinstance(value, dict) and "__bytes__" in value:
+            return base64.b64decode(value["__bytes__"])
+        # Convert string UUIDs and datetimes back to their respective types
+        if isinstance(value, dict):
+            for field in self._UUID_FIELDS:
+                if field in value and isinstance(value[field], str):
+                    value[field] = UUID(value[field])
+            for field in self._DATETIME_FIELDS:
+                if field in value and isinstance(value[field], str):
+                    value[field] = datetime.fromisoformat(value[field])
+        return value
+
+
+class BinaryCacheCodec(CacheCodec):
+    """
+    Компактный формат с тегом версии в первом байте:
+      0x01 - Note: id, owner_id (по 16 байт), created_at, updated_at (микросекунды от эпохи, UTC),
+             длина title, title и content в UTF-8;
+      0x02 - любое другое значение в JSON (через JsonCacheCodec);
+      0x03 - bytes как есть.
+    Записи старого формата (JSON без тега, начинаются с печатного символа) читаются как раньше.
+    """
+
+    NOTE_V1 = 0x01
+    JSON_V1 = 0x02
+    RAW_V1 = 0x03
+    _NOTE_HEADER = struct.Struct(">B16s16sqqI")
+
+    def __init__(self):
+        self._json = JsonCacheCodec()
+
+    def encode(self, value: Any) -> bytes:
+        if isinstance(value, Note):
+            title = value.title.encode("utf-8")
+            header = self._NOTE_HEADER.pack(
+                self.NOTE_V1, value.id.bytes, value.owner_id.bytes,
+                self._to_micros(value.created_at), self._to_micros(value.updated_at), len(title)
+            )
+            return b"".join((header, title, value.content.encode("utf-8")))
+        if isinstance(value, (bytes, bytearray)):
+            return bytes((self.RAW_V1,)) + value
+        return bytes((self.JSON_V1,)) + self._json.encode(value)
+
+    def decode(self, raw: bytes) -> Any:
+        if not raw:
+            raise ValueError("empty cache entry")
+        tag = raw[0]
+        if tag == self.NOTE_V1:
+            try:
+                _, note_id, owner_id, created_at, updated_at, title_len = self._NOTE_HEADER.unpack_from(raw)
+            except struct.error as e:
+                raise ValueError(f"truncated note entry: {e}")
+            offset = self._NOTE_HEADER.size
+            return Note(
+                id=UUID(bytes=note_id),
+                title=raw[offset:offset + title_len].decode("utf-8"),
+                content=raw[offset + title_len:].decode("utf-8"),
+                owner_id=UUID(bytes=owner_id),
+                created_at=_EPOCH + timedelta(microseconds=created_at),
+                updated_at=_EPOCH + timedelta(microseconds=updated_at),
+            )
+        if tag == self.RAW_V1:
+            return raw[1:]
+        if tag == self.JSON_V1:
+            return self._json.decode(raw[1:])
+        if tag >= 0x20:
+            return self._json.decode(raw)
+        raise ValueError(f"unknown cache entry format: 0x{tag:02x}")
+
+    @staticmethod
+    def _to_micros(value: datetime) -> int:
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return (value - _EPOCH) // timedelta(microseconds=1)
@@ -0,0 +1,72 @@
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+# Накладные расходы на запись: ключ в OrderedDict, кортеж, узел LRU-списка
+_ENTRY_OVERHEAD = 200
+
+
+def approximate_size(value: Any) -> int:
+    # Оценка снизу размера значения в памяти; точный подсчёт через gc обходится дороже самого кеша
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(approximate_size(k) + approximate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(approximate_size(item) for item in value)
+    if hasattr(value, "__dict__"):
+        return sys.getsizeof(value) + approximate_size(vars(value))
+    return sys.getsizeof(value)
+
+
+class MemoryLRUCache:
+    """
+    Ограниченный по памяти LRU-кеш с TTL внутри процесса. Не потокобезопасен: используется из одного event loop.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, expires_at, _ = entry
+        if expires_at <= time.monotonic():
+            self.discard(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.discard(key)
+        size = approximate_size(value) + len(key) + _ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        self._entries[key] = (value, time.monotonic() + ttl, size)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+
+    def discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[2]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
@@ -1,67 +1,173 @@
-import json
-from typing import Any, Optional
-from uuid import UUID
-from datetime import datetime
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple, TypeVar
 from redis.asyncio import Redis
 from domain.ports.outbound.cache.cache_port import CachePort
+from infrastructure.adapters.outbound.cache.codec import BinaryCacheCodec, CacheCodec
 from infrastructure.adapters.outbound.logger.structlog_adapter import StructlogAdapter
+from infrastructure.circuit_breaker import CircuitBreaker, CircuitOpenError
+from infrastructure.metrics import metrics
+
+T = TypeVar("T")
+
 
 class AsyncRedisCacheRepository(CachePort):
-    def __init__(self, redis: Redis, logger: StructlogAdapter):
+    """
+    Каждый вызов Redis ограничен timeout секунд и идёт через размыкатель. Кеш не роняет запросы:
+    при ошибке или разомкнутой цепи чтение - промах, запись пропускается. Ключи, запись или удаление
+    которых не удались, запоминаются (не больше max_pending) и удаляются, как только Redis снова ответит,
+    чтобы после восстановления не отдавать значения, устаревшие за время сбоя.
+    """
+
+    def __init__(
+        self, redis: Redis, logger: StructlogAdapter, codec: Optional[CacheCodec] = None,
+        breaker: Optional[CircuitBreaker] = None, timeout: Optional[float] = None, max_pending: int = 10000
+    ):
         self.redis = redis
+        self.codec = codec or BinaryCacheCodec()
+        self.breaker = breaker
+        self.timeout = timeout
+        self.max_pending = max_pending
+        self._pending: Set[str] = set()
         self.logger = logger.bind(component="AsyncRedisCache")
+        metrics.register_gauge("cache_pending_invalidations", lambda: len(self._pending))
 
     async def get(self, key: str) -> Optional[Any]:
         try:
-            value = await self.redis.get(key)
+            value = await self._call(lambda: self.redis.get(key))
             if value:
                 self.logger.debug("Cache hit", key=key)
-                deserialized = json.loads(value)
-                # Convert string UUIDs and datetimes back to their respective types
-                if isinstance(deserialized, dict):
-                    for field in ["id", "owner_id"]:
-                        if field in deserialized and isinstance(deserialized[field], str):
-                            try:
-                                deserialized[field] = UUID(deserialized[field])
-                            except ValueError:
-                                self.logger.error(f"Invalid UUID format for {field} in cache", key=key)
-                                return None
-                    for field in ["created_at", "updated_at"]:
-                        if field in deserialized and isinstance(deserialized[field], str):
-                            try:
-                                deserialized[field] = datetime.fromisoformat(deserialized[field])
-                            except ValueError:
-                                self.logger.error(f"Invalid datetime format for {field} in cache", key=key)
-                                return None
-                return deserialized
+                return self.codec.decode(value)
             self.logger.debug("Cache miss", key=key)
             return None
+        except CircuitOpenError:
+            return None
         except Exception as e:
             self.logger.error("Cache get error", error=str(e), key=key)
             return None
 
+    async def get_with_ttl(self, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        async def fetch():
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.get(key)
+                pipe.pttl(key)
+                return await pipe.execute()
+
+        try:
+            value, pttl = await self._call(fetch)
+            if value:
+                self.logger.debug("Cache hit", key=key, pttl=pttl)
+                return self.codec.decode(value), (pttl / 1000 if pttl >= 0 else None)
+            self.logger.debug("Cache miss", key=key)
+            return None, None
+        except CircuitOpenError:
+            return None, None
+        except Exception as e:
+            self.logger.error("Cache get error", error=str(e), key=key)
+            return None, None
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        if not keys:
+            return {}
+        try:
+            values = await self._call(lambda: self.redis.mget(keys))
+        except CircuitOpenError:
+            return {}
+        except Exception as e:
+            self.logger.error("Cache mget error", error=str(e), keys=len(keys))
+            return {}
+        found = {}
+        for key, value in zip(keys, values):
+            if not value:
+                continue
+            try:
+                found[key] = self.codec.decode(value)
+            except ValueError as e:
+                self.logger.error("Cache get error", error=str(e), key=key)
+        self.logger.debug("Cache mget", keys=len(keys), hits=len(found))
+        return found
+
     async def set(self, key: str, value: Any, ttl: int) -> None:
         try:
-            # Convert UUID and datetime objects to strings for JSON serialization
-            if isinstance(value, dict):
-                value = value.copy()  # Avoid modifying the original dict
-                for field in ["id", "owner_id"]:
-                    if field in value and isinstance(value[field], UUID):
-                        value[field] = str(value[field])
-                for field in ["created_at", "updated_at"]:
-                    if field in value and isinstance(value[field], datetime):
-                        value[field] = value[field].isoformat()
-            serialized = json.dumps(value)
-            await self.redis.setex(key, ttl, serialized)
+            serialized = self.codec.encode(value)
+            await self._call(lambda: self.redis.setex(key, ttl, serialized))
             self.logger.debug("Cache set", key=key, ttl=ttl)
+        except CircuitOpenError:
+            self._remember([key])
         except Exception as e:
             self.logger.error("Cache set error", error=str(e), key=key)
-            raise
+            self._remember([key])
 
     async def delete(self, key: str) -> None:
         try:
-            await self.redis.delete(key)
+            await self._call(lambda: self.redis.delete(key))
             self.logger.debug("Cache deleted", key=key)
+        except CircuitOpenError:
+            self._remember([key])
         except Exception as e:
             self.logger.error("Cache delete error", error=str(e), key=key)
-            raise
\ No newline at end of file
+            self._remember([key])
+
+    async def write_many(
+        self, entries: Dict[str, Optional[Any]], ttl: int | None = None, only_missing: bool = False
+    ) -> None:
+        if not entries:
+            return
+
+        async def write():
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in entries.items():
+                    if value is None:
+                        pipe.delete(key)
+                    else:
+                        pipe.set(key, self.codec.encode(value), ex=ttl, nx=only_missing)
+                await pipe.execute()
+
+        # Пропущенная запись "только если нет" ничего не перезаписывала, при сбое помнить нужно лишь удаления
+        overwritten = [key for key, value in entries.items() if value is None or not only_missing]
+        try:
+            await self._call(write)
+            self.logger.debug("Cache batch written", keys=len(entries), ttl=ttl, only_missing=only_missing)
+        except CircuitOpenError:
+            self._remember(overwritten)
+        except Exception as e:
+            self.logger.error("Cache batch write error", error=str(e), keys=len(entries))
+            self._remember(overwritten)
+
+    async def _call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        if self.breaker and not self.breaker.allow():
+            raise CircuitOpenError(self.breaker.name)
+        try:
+            if self._pending:
+                # Сначала удаляем ключи, пропущенные во время сбоя, иначе этот же вызов может прочитать устаревшее
+                await self._flush_pending()
+            result = await asyncio.wait_for(fn(), self.timeout)
+        except Exception as e:
+            if isinstance(e, asyncio.TimeoutError):
+                metrics.inc("cache_timeouts")
+            if self.breaker:
+                self.breaker.record_failure()
+            raise
+        if self.breaker and self.breaker.record_success():
+            self.logger.info("Redis recovered, cache re-enabled")
+        return result
+
+    def _remember(self, keys: Iterable[str]) -> None:
+        dropped = 0
+        for key in keys:
+            if len(self._pending) < self.max_pending:
+                self._pending.add(key)
+            else:
+                dropped += 1
+        if dropped:
+            # Эти ключи могут отдавать устаревшие значения до истечения своего TTL
+            metrics.inc("cache_pending_invalidations_dropped", dropped)
+            self.logger.error("Too many pending cache invalidations, dropping", dropped=dropped)
+
+    async def _flush_pending(self) -> None:
+        keys, self._pending = self._pending, set()
+        try:
+            await asyncio.wait_for(self.redis.delete(*keys), self.timeout)
+        except BaseException:
+            self._remember(keys)
+            raise
+        self.logger.info("Pending cache invalidations flushed", keys=len(keys))
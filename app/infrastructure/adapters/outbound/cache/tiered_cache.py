@@ -0,0 +1,156 @@
+import asyncio
+import copy
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import uuid4
+from redis.asyncio import Redis
+from domain.ports.outbound.cache.cache_port import CachePort
+from domain.ports.outbound.logger.logger_port import LoggerPort
+from infrastructure.adapters.outbound.cache.memory_cache import MemoryLRUCache
+from infrastructure.metrics import metrics
+
+
+class TieredCacheRepository(CachePort):
+    """
+    Двухуровневый кеш: L1 в памяти процесса перед L2 (Redis).
+    Каждая запись/удаление публикует ключи в Redis pub/sub, остальные реплики выбрасывают их из своего L1.
+    Пока слушатель не подписан на канал, L1 не используется: иначе пропущенные инвалидации
+    отдавали бы устаревшие данные.
+    """
+
+    def __init__(
+        self, l2: CachePort, redis: Redis, l1: MemoryLRUCache, channel: str, logger: LoggerPort,
+        publish_timeout: Optional[float] = None
+    ):
+        self.l2 = l2
+        self.redis = redis
+        self.l1 = l1
+        self.channel = channel
+        self.publish_timeout = publish_timeout
+        self.instance_id = uuid4().hex
+        self.l1_active = False
+        # Растёт при каждой инвалидации: чтение из L2, во время которого ключи инвалидировались,
+        # не кладёт результат в L1, чтобы не закешировать значение, которое уже устарело
+        self._epoch = 0
+        self.logger = logger.bind(component="TieredCache")
+        metrics.register_gauge("cache_l1_hits", lambda: self.l1.hits)
+        metrics.register_gauge("cache_l1_misses", lambda: self.l1.misses)
+        metrics.register_gauge("cache_l1_evictions", lambda: self.l1.evictions)
+        metrics.register_gauge("cache_l1_entries", lambda: len(self.l1))
+        metrics.register_gauge("cache_l1_bytes", lambda: self.l1.size)
+
+    async def get(self, key: str) -> Optional[Any]:
+        if self.l1_active:
+            value = self.l1.get(key)
+            if value is not None:
+                return copy.copy(value)
+        epoch = self._epoch
+        value = await self.l2.get(key)
+        if value is not None and self.l1_active and epoch == self._epoch:
+            self.l1.put(key, copy.copy(value))
+        return value
+
+    async def get_with_ttl(self, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        # L1 не знает срок жизни ключа в Redis: попадание в L1 считается свежим,
+        # срок проверяется при следующем чтении из L2, не позже чем через TTL L1
+        if self.l1_active:
+            value = self.l1.get(key)
+            if value is not None:
+                return copy.copy(value), None
+        epoch = self._epoch
+        value, remaining = await self.l2.get_with_ttl(key)
+        if value is not None and self.l1_active and epoch == self._epoch:
+            self.l1.put(key, copy.copy(value))
+        return value, remaining
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        found: Dict[str, Any] = {}
+        missing = keys
+        if self.l1_active:
+            missing = []
+            for key in keys:
+                value = self.l1.get(key)
+                if value is None:
+                    missing.append(key)
+                else:
+                    found[key] = copy.copy(value)
+        if not missing:
+            return found
+        epoch = self._epoch
+        fetched = await self.l2.get_many(missing)
+        if self.l1_active and epoch == self._epoch:
+            for key, value in fetched.items():
+                self.l1.put(key, copy.copy(value))
+        found.update(fetched)
+        return found
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        await self.l2.set(key, value, ttl=ttl)
+        self._invalidate_local([key])
+        await self._publish_invalidation([key])
+
+    async def delete(self, key: str) -> None:
+        await self.l2.delete(key)
+        self._invalidate_local([key])
+        await self._publish_invalidation([key])
+
+    async def write_many(
+        self, entries: Dict[str, Optional[Any]], ttl: int | None = None, only_missing: bool = False
+    ) -> None:
+        if not entries:
+            return
+        await self.l2.write_many(entries, ttl=ttl, only_missing=only_missing)
+        # Запись только отсутствующих ключей не меняет закешированные значения: инвалидировать нужно лишь удаления
+        changed = [key for key, value in entries.items() if value is None] if only_missing else list(entries)
+        if changed:
+            self._invalidate_local(changed)
+            await self._publish_invalidation(changed)
+
+    def _invalidate_local(self, keys: Iterable[str]) -> None:
+        self._epoch += 1
+        for key in keys:
+            self.l1.discard(key)
+
+    async def _publish_invalidation(self, keys: Iterable[str]) -> None:
+        # Ошибка публикации не откатывает запись в Redis: чужие L1 устареют не дольше, чем на TTL L1
+        try:
+            message = json.dumps({"origin": self.instance_id, "keys": list(keys)})
+            await asyncio.wait_for(self.redis.publish(self.channel, message), self.publish_timeout)
+        except Exception as e:
+            self.logger.error("Cache invalidation publish error", error=str(e), channel=self.channel)
+
+    def _apply_invalidation(self, data: bytes) -> None:
+        try:
+            message = json.loads(data)
+        except ValueError:
+            self.logger.warning("Malformed cache invalidation message", channel=self.channel)
+            return
+        if message.get("origin") == self.instance_id:
+            return
+        self._invalidate_local(message.get("keys", []))
+
+    async def listen_invalidations(self, retry_delay: float = 1.0) -> None:
+        """
+        Слушает канал инвалидаций до отмены задачи. При обрыве соединения L1 отключается и очищается,
+        после переподписки включается снова.
+        """
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    self._epoch += 1
+                    self.l1.clear()
+                    self.l1_active = True
+                    self.logger.info("Subscribed to cache invalidations", channel=self.channel)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._apply_invalidation(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error("Cache invalidation listener error", error=str(e), channel=self.channel)
+            finally:
+                self.l1_active = False
+                self._epoch += 1
+                self.l1.clear()
+            await asyncio.sleep(retry_delay)
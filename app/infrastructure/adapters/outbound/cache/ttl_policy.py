@@ -0,0 +1,53 @@
+import math
+import random
+from typing import Optional
+
+
+class CacheTtlPolicy:
+    """
+    Мягкий TTL записей кеша. Ключ живёт в Redis ttl (с разбросом +-jitter) плюс stale_ttl секунд:
+    после мягкого TTL значение ещё отдаётся, а обновление идёт в фоне. До истечения мягкого TTL
+    обновление запускается заранее с вероятностью по XFetch, растущей по мере приближения к сроку
+    и пропорциональной времени загрузки из базы (beta=0 отключает раннее обновление).
+    negative_ttl - срок жизни tombstone-записей для отсутствующих ключей, 0 - не кешировать отсутствие.
+    """
+
+    # Вес нового замера в скользящем среднем времени загрузки
+    _LOAD_TIME_WEIGHT = 0.1
+
+    def __init__(
+        self, ttl: int = 3600, stale_ttl: int = 0, jitter: float = 0.0, beta: float = 0.0, negative_ttl: int = 0
+    ):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.jitter = jitter
+        self.beta = beta
+        self.negative_ttl = negative_ttl
+        self.load_time = 0.0
+
+    def expire_in(self) -> int:
+        # Разброс не даёт ключам, записанным одновременно (батчем, после рестарта), истечь одновременно
+        ttl = self.ttl * random.uniform(1 - self.jitter, 1 + self.jitter) if self.jitter else self.ttl
+        return max(1, round(ttl)) + self.stale_ttl
+
+    def should_refresh(self, remaining: Optional[float]) -> bool:
+        """
+        remaining - сколько секунд ключу осталось жить в Redis; None, если неизвестно (например, попадание в L1).
+        """
+        if remaining is None:
+            return False
+        fresh_for = remaining - self.stale_ttl
+        if fresh_for <= 0:
+            return True
+        if not self.beta or not self.load_time:
+            return False
+        return fresh_for <= -self.load_time * self.beta * math.log(1.0 - random.random())
+
+    def is_stale(self, remaining: Optional[float]) -> bool:
+        return remaining is not None and remaining <= self.stale_ttl
+
+    def observe_load(self, seconds: float) -> None:
+        if not self.load_time:
+            self.load_time = seconds
+        else:
+            self.load_time += (seconds - self.load_time) * self._LOAD_TIME_WEIGHT
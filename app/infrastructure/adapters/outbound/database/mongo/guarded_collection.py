@@ -0,0 +1,121 @@
+import asyncio
+from typing import Any
+from pymongo.errors import ConnectionFailure, PyMongoError
+from infrastructure.circuit_breaker import CircuitBreaker, CircuitOpenError
+from infrastructure.metrics import metrics
+
+# Операции, которые ждут ответа сервера целиком; у чтений из них есть maxTimeMS
+_OPERATIONS = {
+    "find_one", "count_documents", "find_one_and_update", "find_one_and_delete", "find_one_and_replace",
+    "insert_one", "insert_many", "replace_one", "update_one", "update_many", "delete_one", "delete_many", "bulk_write",
+}
+_MAX_TIME_MS_KWARG = {
+    "find_one": "max_time_ms",
+    "count_documents": "maxTimeMS",
+    "find_one_and_update": "maxTimeMS",
+    "find_one_and_delete": "maxTimeMS",
+    "find_one_and_replace": "maxTimeMS",
+}
+_CURSORS = {"find", "find_raw_batches"}
+
+
+def is_outage(error: BaseException) -> bool:
+    # Размыкатель считают только недоступность и таймауты; ошибки запроса (дубликат ключа и т.п.) - нет
+    if isinstance(error, (asyncio.TimeoutError, ConnectionFailure)):
+        return True
+    return isinstance(error, PyMongoError) and error.timeout
+
+
+class GuardedCollection:
+    """
+    Обёртка коллекции Motor: каждая операция и каждый батч курсора ограничены timeout секунд,
+    чтения дополнительно получают maxTimeMS, чтобы сервер прекращал работу вместе с клиентом.
+    Курсоры find/find_raw_batches получают max_time_ms, если вызывающий не передал свой
+    (max_time_ms=None - без ограничения, например для потокового экспорта).
+    При разомкнутом размыкателе операции сразу падают с CircuitOpenError.
+    Остальные атрибуты (индексы, aggregate и т.п.) проксируются как есть.
+    """
+
+    def __init__(self, collection: Any, breaker: CircuitBreaker, timeout: float):
+        self._collection = collection
+        self._breaker = breaker
+        self._timeout = timeout
+        self._max_time_ms = int(timeout * 1000)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._collection, name)
+        if name in _OPERATIONS:
+            return self._wrap_operation(name, attr)
+        if name in _CURSORS:
+            return self._wrap_cursor(attr)
+        return attr
+
+    def _wrap_operation(self, name: str, method: Any):
+        async def call(*args, **kwargs):
+            if not self._breaker.allow():
+                raise CircuitOpenError(self._breaker.name)
+            if name in _MAX_TIME_MS_KWARG:
+                kwargs.setdefault(_MAX_TIME_MS_KWARG[name], self._max_time_ms)
+            return await guarded(self._breaker, self._timeout, method(*args, **kwargs))
+        return call
+
+    def _wrap_cursor(self, method: Any):
+        def open_cursor(*args, **kwargs):
+            if not self._breaker.allow():
+                raise CircuitOpenError(self._breaker.name)
+            kwargs.setdefault("max_time_ms", self._max_time_ms)
+            return GuardedCursor(method(*args, **kwargs), self._breaker, self._timeout)
+        return open_cursor
+
+
+class GuardedCursor:
+    def __init__(self, cursor: Any, breaker: CircuitBreaker, timeout: float):
+        self._cursor = cursor
+        self._breaker = breaker
+        self._timeout = timeout
+        self._iterator: Any = None
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._cursor, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            # sort/skip/limit/batch_size возвращают тот же курсор: цепочка остаётся под защитой
+            return self if result is self._cursor else result
+        return call
+
+    def __aiter__(self) -> "GuardedCursor":
+        self._iterator = self._cursor.__aiter__()
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return await asyncio.wait_for(self._iterator.__anext__(), self._timeout)
+        except StopAsyncIteration:
+            self._breaker.record_success()
+            raise
+        except Exception as e:
+            record_error(self._breaker, e)
+            raise
+
+
+def record_error(breaker: CircuitBreaker, error: Exception) -> None:
+    if not is_outage(error):
+        # Сервер ответил: зависимость доступна, даже если запрос отклонён
+        breaker.record_success()
+        return
+    if isinstance(error, asyncio.TimeoutError):
+        metrics.inc(f"{breaker.name}_timeouts")
+    breaker.record_failure()
+
+
+async def guarded(breaker: CircuitBreaker, timeout: float, awaitable: Any) -> Any:
+    try:
+        result = await asyncio.wait_for(awaitable, timeout)
+    except Exception as e:
+        record_error(breaker, e)
+        raise
+    breaker.record_success()
+    return result
@@ -0,0 +1,90 @@
+from typing import Any, Iterable, List, Tuple
+from pymongo import IndexModel
+from domain.exceptions import DatabaseException
+from domain.ports.outbound.logger.logger_port import LoggerPort
+
+# Режимы проверки планов запросов при старте
+INDEX_CHECK_OFF = "off"
+INDEX_CHECK_WARN = "warn"
+INDEX_CHECK_FAIL = "fail"
+
+
+def _key_of(spec: IndexModel) -> Tuple[Tuple[str, Any], ...]:
+    return tuple(spec.document["key"].items())
+
+
+async def ensure_indexes(collection: Any, specs: Iterable[IndexModel], logger: LoggerPort) -> List[str]:
+    """
+    Сверяет декларативное описание индексов с коллекцией и создаёт недостающие.
+    Индекс считается существующим, если совпадает набор ключей (имя не важно).
+    Returns:
+        List[str]: имена созданных индексов.
+    """
+    existing = {tuple(info["key"]): info for info in (await collection.index_information()).values()}
+    missing = []
+    for spec in specs:
+        info = existing.get(_key_of(spec))
+        if info is None:
+            missing.append(spec)
+        elif bool(info.get("unique")) != bool(spec.document.get("unique")):
+            logger.warning(
+                "Index exists with different options, leaving it as is",
+                index=spec.document["name"], expected_unique=bool(spec.document.get("unique"))
+            )
+    if not missing:
+        logger.debug("All indexes already exist", collection=collection.name)
+        return []
+    try:
+        created = await collection.create_indexes(missing)
+    except Exception as e:
+        logger.error("Failed to create indexes", error=str(e), collection=collection.name)
+        raise DatabaseException(f"Failed to create indexes on '{collection.name}': {e}")
+    logger.info("Indexes created", collection=collection.name, indexes=created)
+    return created
+
+
+def _collect_stages(plan: Any) -> List[str]:
+    # Дерево плана вложено через inputStage/inputStages/queryPlan (SBE), обходим его целиком
+    stages = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        for key in ("inputStage", "queryPlan"):
+            if key in plan:
+                stages.extend(_collect_stages(plan[key]))
+        for child in plan.get("inputStages", []):
+            stages.extend(_collect_stages(child))
+    return stages
+
+
+async def verify_query_plans(
+    collection: Any, probes: Iterable[Tuple[str, Any]], logger: LoggerPort, mode: str
+) -> List[str]:
+    """
+    Выполняет explain() для каждого пробного курсора и проверяет, что выигравший план не COLLSCAN.
+    Args:
+        probes: пары (имя запроса, motor-курсор без выполнения).
+        mode: off | warn | fail.
+    Returns:
+        List[str]: имена запросов, которые сканируют коллекцию целиком.
+    Raises:
+        DatabaseException: в режиме fail, если найден COLLSCAN.
+    """
+    if mode == INDEX_CHECK_OFF:
+        return []
+    scans = []
+    for name, cursor in probes:
+        try:
+            explanation = await cursor.explain()
+        except Exception as e:
+            logger.warning("Failed to explain query", query=name, error=str(e))
+            continue
+        stages = _collect_stages(explanation.get("queryPlanner", {}).get("winningPlan", {}))
+        if "COLLSCAN" in stages:
+            scans.append(name)
+            logger.warning("Query plan uses a collection scan", query=name, stages=stages, collection=collection.name)
+        else:
+            logger.debug("Query plan uses an index", query=name, stages=stages)
+    if scans and mode == INDEX_CHECK_FAIL:
+        raise DatabaseException(f"Queries without a usable index on '{collection.name}': {', '.join(scans)}")
+    return scans
@@ -1,40 +1,303 @@
-from typing import List, Optional, Any
-from uuid import UUID
-from domain.models.entities.note import Note
-from domain.ports.outbound.database.base_repository_port import BaseRepositoryPort
+import asyncio
+import base64
+import binascii
+import struct
+import time
+from dataclasses import replace
+from itertools import groupby
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID, uuid4
+from domain.models.entities.note import Note, NoteSummary
+from domain.models.bulk import BulkOperation, BulkItemResult
+from domain.models.enums.bulk import BulkAction
+from domain.ports.outbound.database.note import NoteRepositoryPort
 from domain.ports.outbound.logger.logger_port import LoggerPort
-from infrastructure.adapters.outbound.cache.redis_adapter import AsyncRedisCacheRepository
-from datetime import datetime
-from domain.exceptions import DatabaseException
+from domain.ports.outbound.cache.cache_port import CachePort
+from datetime import datetime, timedelta
+from domain.exceptions import (
+    AccessDeniedError, DatabaseException, NotFoundError, OperationSkippedError, ValidationException
+)
 from motor.motor_asyncio import AsyncIOMotorClient
-from bson import Binary, UUID_SUBTYPE
+from pymongo import ASCENDING, IndexModel, InsertOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
+from bson import Binary, UUID_SUBTYPE, decode_all
+from bson.binary import UuidRepresentation
+from bson.codec_options import CodecOptions
 from bson.binary import Binary as BsonBinary
+from infrastructure.adapters.outbound.cache.ttl_policy import CacheTtlPolicy
+from infrastructure.adapters.outbound.database.mongo.index_manager import ensure_indexes, verify_query_plans
+from infrastructure.metrics import metrics
+from infrastructure.single_flight import SingleFlight
+from infrastructure.batch_loader import BatchLoader
 
-class AsyncMongoNoteRepository(BaseRepositoryPort[Note]):
-    def __init__(self, collection: Any, cache: AsyncRedisCacheRepository, logger: LoggerPort):
+# Значение в кеше для заметки, которой нет в базе: повторные запросы несуществующих id не доходят до Mongo
+NOTE_TOMBSTONE = "__note_tombstone__"
+
+# Сколько find_one_and_delete пакета выполняется одновременно
+BULK_DELETE_CONCURRENCY = 32
+
+# Порядок выдачи списков: (created_at, id) уникален и стабилен, поэтому подходит для keyset-пагинации
+LIST_SORT = [("created_at", ASCENDING), ("id", ASCENDING)]
+
+# Декларативное описание индексов коллекции notes, сверяется и создаётся при старте
+NOTE_INDEXES = [
+    IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+    IndexModel([("owner_id", ASCENDING), *LIST_SORT], name="owner_id_created_at_id"),
+    IndexModel(LIST_SORT, name="created_at_id"),
+]
+
+# Списки читаются сырыми BSON-батчами: UUID оставляем Binary и превращаем в UUID один раз сами,
+# декодирование в UUID внутри драйвера (STANDARD) идёт через Python и обходится вдвое дороже.
+# _id не запрашиваем, чтобы не создавать лишний ObjectId на каждый документ
+LIST_CODEC_OPTIONS = CodecOptions(uuid_representation=UuidRepresentation.UNSPECIFIED)
+LIST_PROJECTION = {"_id": 0, "id": 1, "title": 1, "content": 1, "owner_id": 1, "created_at": 1, "updated_at": 1}
+# Сводка для списков в UI: content может быть большим и не должен покидать MongoDB
+SUMMARY_PROJECTION = {"_id": 0, "id": 1, "title": 1, "owner_id": 1, "created_at": 1, "updated_at": 1}
+
+# Курсор: миллисекунды created_at (BSON хранит datetime с точностью до мс) + 16 байт id
+_CURSOR_FORMAT = struct.Struct(">q16s")
+_EPOCH = datetime(1970, 1, 1)
+
+
+def encode_cursor(created_at: datetime, entity_id: UUID) -> str:
+    millis = (created_at.replace(tzinfo=None) - _EPOCH) // timedelta(milliseconds=1)
+    raw = _CURSOR_FORMAT.pack(millis, entity_id.bytes)
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        millis, id_bytes = _CURSOR_FORMAT.unpack(raw)
+        return _EPOCH + timedelta(milliseconds=millis), UUID(bytes=id_bytes)
+    except (binascii.Error, struct.error, ValueError, OverflowError):
+        raise ValidationException("cursor", "malformed pagination cursor")
+
+class AsyncMongoNoteRepository(NoteRepositoryPort):
+    def __init__(
+        self, collection: Any, cache: CachePort, logger: LoggerPort,
+        batch_window: Optional[float] = None, batch_max_size: int = 100,
+        ttl_policy: Optional[CacheTtlPolicy] = None, list_cache_ttl: int = 0, warm_max_entries: int = 0
+    ):
         self.collection = collection
         self.cache = cache
+        self._ttl = ttl_policy or CacheTtlPolicy()
+        # Страницы списков и total владельца в кеше, 0 - не кешировать
+        self._list_cache_ttl = list_cache_ttl
+        # Сколько заметок со страницы списка класть в note:{id} (в фоне, одним pipeline), 0 - не прогревать
+        self._warm_max_entries = warm_max_entries
+        self._background: Set[asyncio.Task] = set()
+        # Одновременные промахи кеша по одной заметке делят один find_one и одну запись в кеш
+        self._loads = SingleFlight(on_shared=lambda: metrics.inc("note_get_coalesced"))
+        # Опционально (batch_window не None): get_by_id разных заметок из одновременных запросов
+        # собираются в один MGET и один find по $in
+        self._batcher = (
+            BatchLoader(self._load_batch, batch_window, batch_max_size) if batch_window is not None else None
+        )
         self.logger = logger.bind(component="AsyncMongoNoteRepository")
 
-    async def list(self, user_id: Optional[UUID], skip: int, limit: int, request_id: str) -> List[Note]:
+    async def ensure_indexes(self) -> None:
+        await ensure_indexes(self.collection, NOTE_INDEXES, self.logger)
+
+    async def verify_query_plans(self, mode: str) -> List[str]:
+        # Пробные запросы повторяют фильтры и сортировки методов репозитория;
+        # count_documents/replace_one/delete_one используют те же фильтры, что и find
+        probe_id = Binary(UUID(int=0).bytes, UUID_SUBTYPE)
+        after = {"$or": [{"created_at": {"$gt": _EPOCH}}, {"created_at": _EPOCH, "id": {"$gt": probe_id}}]}
+        probes = [
+            ("get_by_id/update/delete", self.collection.find({"id": probe_id}).limit(1)),
+            ("count_by_user_id", self.collection.find({"owner_id": probe_id})),
+            ("list:owner", self.collection.find({"owner_id": probe_id}).sort(LIST_SORT).limit(1)),
+            ("list:owner:cursor", self.collection.find({"owner_id": probe_id, **after}).sort(LIST_SORT).limit(1)),
+            ("list:all", self.collection.find({}).sort(LIST_SORT).limit(1)),
+            ("list:all:cursor", self.collection.find(after).sort(LIST_SORT).limit(1)),
+        ]
+        return await verify_query_plans(self.collection, probes, self.logger, mode)
+
+    async def list(
+        self, user_id: Optional[UUID], skip: int, limit: int, request_id: str, cursor: Optional[str] = None
+    ) -> Tuple[List[Note], Optional[str]]:
+        return await self._list_page(
+            user_id, skip, limit, request_id, cursor, LIST_PROJECTION, self._to_entities_raw, "list"
+        )
+
+    async def list_summaries(
+        self, user_id: Optional[UUID], skip: int, limit: int, request_id: str, cursor: Optional[str] = None
+    ) -> Tuple[List[NoteSummary], Optional[str]]:
+        return await self._list_page(
+            user_id, skip, limit, request_id, cursor, SUMMARY_PROJECTION, self._to_summaries_raw, "list_summaries"
+        )
+
+    async def export(self, user_id: Optional[UUID], batch_size: int, request_id: str) -> AsyncIterator[List[Note]]:
+        query = {"owner_id": Binary(user_id.bytes, UUID_SUBTYPE)} if user_id else {}
+        self.logger.debug(f"Exporting notes with query={query}, batch_size={batch_size}", request_id=request_id)
+        # maxTimeMS считает суммарное время курсора на сервере, для потокового экспорта он не подходит
+        db_cursor = self.collection.find_raw_batches(
+            query, LIST_PROJECTION, max_time_ms=None
+        ).sort(LIST_SORT).batch_size(batch_size)
+        exported = 0
+        try:
+            async for batch in db_cursor:
+                notes = self._to_entities_raw(batch)
+                exported += len(notes)
+                yield notes
+        except Exception as e:
+            self.logger.error("Database error in export", error=str(e), exported=exported, request_id=request_id)
+            raise DatabaseException(f"Failed to export notes: {e}")
+        finally:
+            await db_cursor.close()
+        self.logger.debug(f"Exported {exported} notes", request_id=request_id)
+
+    async def list_page(
+        self, user_id: Optional[UUID], skip: int, limit: int, request_id: str,
+        cursor: Optional[str] = None, summaries: bool = False
+    ) -> Tuple[List[Any], Optional[str], int]:
+        projection, decode, operation = (
+            (SUMMARY_PROJECTION, self._to_summaries_raw, "list_summaries") if summaries
+            else (LIST_PROJECTION, self._to_entities_raw, "list")
+        )
+        if user_id is None:
+            items, next_cursor = await self._list_page(user_id, skip, limit, request_id, cursor, projection, decode, operation)
+            self._warm_in_background(items, summaries, request_id)
+            return items, next_cursor, 0
+        generation = await self._owner_generation(user_id, request_id) if self._list_cache_ttl else None
+        if generation is None:
+            items, next_cursor = await self._list_page(user_id, skip, limit, request_id, cursor, projection, decode, operation)
+            self._warm_in_background(items, summaries, request_id)
+            return items, next_cursor, await self.count_by_user_id(user_id, request_id)
+
+        # Ключи включают поколение владельца: любая запись меняет поколение, и старые страницы
+        # больше не читаются (истекают по TTL), без поиска и удаления ключей
+        view = "summary" if summaries else "full"
+        position = f"c:{cursor}" if cursor else f"s:{skip}"
+        page_key = f"notes:list:{user_id}:{generation}:{view}:{position}:{limit}"
+        count_key = f"notes:count:{user_id}:{generation}"
+        cached = await self.cache.get_many([page_key, count_key])
+        raw, total = cached.get(page_key), cached.get(count_key)
+        fills: Dict[str, Any] = {}
+        fetched = raw is None
+        if fetched:
+            metrics.inc("note_list_cache_misses")
+            raw = await self._fetch_page_raw(user_id, skip, limit, request_id, cursor, projection, operation)
+            fills[page_key] = raw
+        else:
+            metrics.inc("note_list_cache_hits")
+        if total is None:
+            total = await self.count_by_user_id(user_id, request_id)
+            fills[count_key] = total
+        if fills:
+            try:
+                await self.cache.write_many(fills, ttl=self._list_cache_ttl)
+            except Exception as e:
+                self.logger.error("Failed to cache list page", error=str(e), request_id=request_id)
+        items, next_cursor = self._decode_page(raw, decode, limit)
+        if fetched:
+            # Страница из кеша уже прогревала заметки, когда читалась из базы
+            self._warm_in_background(items, summaries, request_id)
+        return items, next_cursor, total
+
+    async def warm_owners(self, owner_ids: List[UUID], limit: int, request_id: str) -> int:
+        warmed = 0
+        for owner_id in owner_ids:
+            raw = await self._fetch_page_raw(owner_id, 0, limit, request_id, None, LIST_PROJECTION, "warm_owners")
+            notes = self._to_entities_raw(raw)
+            await self._warm(notes, request_id)
+            # Чтение через кеш заполняет L1 этого процесса, если он включён
+            await self.cache.get_many([f"note:{note.id}" for note in notes])
+            warmed += len(notes)
+        return warmed
+
+    def _warm_in_background(self, items: List[Any], summaries: bool, request_id: str) -> None:
+        # В сводках нет content, ими note:{id} не заполнить
+        if not self._warm_max_entries or summaries or not items:
+            return
+        task = asyncio.ensure_future(self._warm(items[:self._warm_max_entries], request_id))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _warm(self, notes: List[Note], request_id: str) -> None:
+        # SET NX: значение, записанное обновлением или tombstone удаления, новее прочитанного списка
+        try:
+            await self.cache.write_many(
+                {f"note:{note.id}": note for note in notes}, ttl=self._ttl.expire_in(), only_missing=True
+            )
+            metrics.inc("note_cache_warmed", len(notes))
+        except Exception as e:
+            self.logger.error("Failed to warm note cache", error=str(e), request_id=request_id)
+
+    async def _owner_generation(self, owner_id: UUID, request_id: str) -> Optional[str]:
+        key = f"notes:gen:{owner_id}"
+        generation = await self.cache.get(key)
+        if generation:
+            return generation
+        # Поколение - случайный токен, а не счётчик: если ключ вытеснен из Redis, новое поколение
+        # не совпадёт ни с одним старым и не поднимет устаревшие страницы
+        generation = uuid4().hex
+        try:
+            await self.cache.set(key, generation, ttl=self._ttl.expire_in())
+        except Exception as e:
+            self.logger.error("Failed to init list generation", error=str(e), request_id=request_id)
+            return None
+        return generation
+
+    async def _bump_generations(self, owner_ids: Iterable[Optional[UUID]], request_id: str) -> None:
+        if not self._list_cache_ttl:
+            return
+        entries = {f"notes:gen:{owner_id}": uuid4().hex for owner_id in set(owner_ids) if owner_id}
+        try:
+            await self.cache.write_many(entries, ttl=self._ttl.expire_in())
+        except Exception as e:
+            # Страницы со старым поколением останутся видны не дольше LIST_CACHE_TTL
+            self.logger.error("Failed to bump list generation", error=str(e), request_id=request_id)
+
+    async def _list_page(
+        self, user_id: Optional[UUID], skip: int, limit: int, request_id: str, cursor: Optional[str],
+        projection: Dict[str, int], decode: Callable[[bytes], List[Any]], operation: str
+    ) -> Tuple[List[Any], Optional[str]]:
+        raw = await self._fetch_page_raw(user_id, skip, limit, request_id, cursor, projection, operation)
+        return self._decode_page(raw, decode, limit)
+
+    async def _fetch_page_raw(
+        self, user_id: Optional[UUID], skip: int, limit: int, request_id: str, cursor: Optional[str],
+        projection: Dict[str, int], operation: str
+    ) -> bytes:
+        query: dict = {"owner_id": Binary(user_id.bytes, UUID_SUBTYPE)} if user_id else {}
+        if cursor:
+            after_created_at, after_id = decode_cursor(cursor)
+            query["$or"] = [
+                {"created_at": {"$gt": after_created_at}},
+                {"created_at": after_created_at, "id": {"$gt": Binary(after_id.bytes, UUID_SUBTYPE)}},
+            ]
         try:
-            query = {"owner_id": Binary(user_id.bytes, UUID_SUBTYPE)} if user_id else {}
             self.logger.debug(f"Listing notes with query={query}, skip={skip}, limit={limit}", request_id=request_id)
-            cursor = self.collection.find(query).skip(skip).limit(limit)
-            notes = []
-            async for doc in cursor:
-                note = self._to_entity(doc)
-                notes.append(note)
-            self.logger.debug(f"Found {len(notes)} notes", request_id=request_id)
-            return notes
+            db_cursor = self.collection.find_raw_batches(query, projection).sort(LIST_SORT)
+            if not cursor:
+                db_cursor = db_cursor.skip(skip)
+            db_cursor = db_cursor.limit(limit)
+            # Батчи - склеенные BSON-документы, страница целиком остаётся валидным входом для decode_all
+            raw = b"".join([batch async for batch in db_cursor])
+            self.logger.debug(f"Fetched {len(raw)} bytes of notes", request_id=request_id)
+            return raw
         except Exception as e:
-            self.logger.error("Database error in list", error=str(e), request_id=request_id)
+            self.logger.error(f"Database error in {operation}", error=str(e), request_id=request_id)
             raise DatabaseException(f"Failed to list notes: {e}")
 
+    @staticmethod
+    def _decode_page(raw: bytes, decode: Callable[[bytes], List[Any]], limit: int) -> Tuple[List[Any], Optional[str]]:
+        items = decode(raw)
+        next_cursor = encode_cursor(items[-1].created_at, items[-1].id) if len(items) == limit else None
+        return items, next_cursor
+
     async def create(self, entity: Note, request_id: str) -> Note:
         try:
             doc = self._to_document(entity)
             await self.collection.insert_one(doc)
+            try:
+                # Перезаписывает tombstone, если этот id раньше запрашивали или удаляли
+                await self.cache.set(f"note:{entity.id}", entity, ttl=self._ttl.expire_in())
+            except Exception as e:
+                self.logger.error("Failed to cache created note", error=str(e), request_id=request_id)
+            await self._bump_generations([entity.owner_id], request_id)
             self.logger.debug(f"Note created with id={entity.id}", request_id=request_id)
             return entity
         except Exception as e:
@@ -43,31 +306,127 @@ class AsyncMongoNoteRepository(BaseRepositoryPort[Note]):
 
     async def get_by_id(self, entity_id: UUID, request_id: str) -> Optional[Note]:
         try:
+            if self._batcher:
+                note = await self._batcher.load(entity_id)
+                return replace(note) if note else None
+
             cache_key = f"note:{entity_id}"
-            cached = await self.cache.get(cache_key)
+            cached, remaining = await self.cache.get_with_ttl(cache_key)
+            if cached == NOTE_TOMBSTONE:
+                metrics.inc("note_cache_tombstone_hits")
+                self.logger.debug("Cache tombstone for note", entity_id=str(entity_id), request_id=request_id)
+                return None
             if cached:
                 self.logger.debug("Cache hit for note", entity_id=str(entity_id), request_id=request_id)
-                return Note(**cached)
+                if self._ttl.should_refresh(remaining):
+                    self._refresh_in_background(entity_id, cache_key, remaining)
+                return self._from_cache(cached)
 
-            doc = await self.collection.find_one({"id": Binary(entity_id.bytes, UUID_SUBTYPE)})
-            if doc:
-                note = self._to_entity(doc)
-                await self.cache.set(cache_key, note.__dict__, ttl=3600)
-                self.logger.debug(f"Note fetched from DB with id={entity_id}", request_id=request_id)
-                return note
-            self.logger.debug(f"Note not found with id={entity_id}", request_id=request_id)
-            return None
+            note = await self._loads.do(cache_key, lambda: self._load(entity_id, cache_key, request_id))
+            # Загруженная сущность общая для всех ожидавших, каждому отдаём свою копию
+            return replace(note) if note else None
         except Exception as e:
             self.logger.error("Database error in get_by_id", error=str(e), request_id=request_id)
             raise DatabaseException(f"Failed to get note: {e}")
 
+    async def get_many(self, entity_ids: List[UUID], request_id: str) -> Dict[UUID, Note]:
+        try:
+            keys = {f"note:{entity_id}": entity_id for entity_id in entity_ids}
+            cached = await self.cache.get_many(list(keys))
+            found = {keys[key]: self._from_cache(value) for key, value in cached.items() if value != NOTE_TOMBSTONE}
+            if len(found) < len(cached):
+                metrics.inc("note_cache_tombstone_hits", len(cached) - len(found))
+            missing = [keys[key] for key in keys if key not in cached]
+            if missing:
+                fills = {}
+                query = {"id": {"$in": [Binary(entity_id.bytes, UUID_SUBTYPE) for entity_id in missing]}}
+                async for doc in self.collection.find(query, {"_id": 0}):
+                    note = self._to_entity(doc)
+                    found[note.id] = note
+                    fills[f"note:{note.id}"] = note
+                tombstones = {
+                    f"note:{entity_id}": NOTE_TOMBSTONE for entity_id in missing if entity_id not in found
+                } if self._ttl.negative_ttl else {}
+                try:
+                    if fills:
+                        await self.cache.write_many(fills, ttl=self._ttl.expire_in())
+                    if tombstones:
+                        # Как и в _load: tombstone промаха не перезаписывает заметку, закешированную записью
+                        await self.cache.write_many(tombstones, ttl=self._ttl.negative_ttl, only_missing=True)
+                        metrics.inc("note_cache_tombstones_written", len(tombstones))
+                except Exception as e:
+                    self.logger.error("Failed to fill cache after get_many", error=str(e), request_id=request_id)
+            self.logger.debug(
+                f"Fetched {len(found)} of {len(keys)} notes", cached=len(cached), request_id=request_id
+            )
+            return found
+        except Exception as e:
+            self.logger.error("Database error in get_many", error=str(e), request_id=request_id)
+            raise DatabaseException(f"Failed to get notes: {e}")
+
+    async def _load_batch(self, entity_ids: List[UUID]) -> Dict[UUID, Note]:
+        metrics.inc("note_get_batches")
+        metrics.inc("note_get_batched_ids", len(entity_ids))
+        return await self.get_many(entity_ids, request_id="get_by_id-batch")
+
+    @staticmethod
+    def _from_cache(value: Any) -> Note:
+        # Бинарный кодек отдаёт Note, записи старого JSON-формата приходят словарём
+        return value if isinstance(value, Note) else Note(**value)
+
+    def _refresh_in_background(self, entity_id: UUID, cache_key: str, remaining: float) -> None:
+        # Запрос получает закешированное значение сразу, заметка перечитывается из базы в фоне;
+        # повторные попадания до конца обновления присоединяются к нему через _loads
+        if cache_key in self._loads:
+            return
+        metrics.inc("note_cache_stale_refreshes" if self._ttl.is_stale(remaining) else "note_cache_early_refreshes")
+        self._loads.spawn(cache_key, lambda: self._refresh(entity_id, cache_key))
+
+    async def _refresh(self, entity_id: UUID, cache_key: str) -> Optional[Note]:
+        try:
+            return await self._load(entity_id, cache_key, request_id="cache-refresh", replace_cached=True)
+        except Exception as e:
+            self.logger.error("Background cache refresh failed", error=str(e), entity_id=str(entity_id))
+            raise
+
+    async def _load(
+        self, entity_id: UUID, cache_key: str, request_id: str, replace_cached: bool = False
+    ) -> Optional[Note]:
+        started = time.perf_counter()
+        doc = await self.collection.find_one({"id": Binary(entity_id.bytes, UUID_SUBTYPE)})
+        self._ttl.observe_load(time.perf_counter() - started)
+        if doc:
+            note = self._to_entity(doc)
+            await self.cache.set(cache_key, note, ttl=self._ttl.expire_in())
+            self.logger.debug(f"Note fetched from DB with id={entity_id}", request_id=request_id)
+            return note
+        if self._ttl.negative_ttl:
+            # После промаха - только если ключа нет: create/update, прошедший за это время, уже положил
+            # свежую заметку. Фоновое обновление заменяет закешированную заметку, которой больше нет в базе
+            await self.cache.write_many(
+                {cache_key: NOTE_TOMBSTONE}, ttl=self._ttl.negative_ttl, only_missing=not replace_cached
+            )
+            metrics.inc("note_cache_tombstones_written")
+        self.logger.debug(f"Note not found with id={entity_id}", request_id=request_id)
+        return None
+
+    async def _evict(self, cache_key: str) -> None:
+        # Удалённая заметка сразу заменяется tombstone: клиенты со старыми ссылками не доходят до Mongo.
+        # Здесь запись безусловная - удаление должно перекрыть закешированную заметку
+        if self._ttl.negative_ttl:
+            await self.cache.set(cache_key, NOTE_TOMBSTONE, ttl=self._ttl.negative_ttl)
+            metrics.inc("note_cache_tombstones_written")
+        else:
+            await self.cache.delete(cache_key)
+
     async def update(self, entity: Note, request_id: str) -> Note:
         try:
             entity.updated_at = datetime.utcnow()
             cache_key = f"note:{entity.id}"
             doc = self._to_document(entity)
             await self.collection.replace_one({"id": Binary(entity.id.bytes, UUID_SUBTYPE)}, doc)
-            await self.cache.set(cache_key, entity.__dict__, ttl=3600)
+            await self.cache.set(cache_key, entity, ttl=self._ttl.expire_in())
+            await self._bump_generations([entity.owner_id], request_id)
             self.logger.debug(f"Note updated with id={entity.id}", request_id=request_id)
             return entity
         except Exception as e:
@@ -77,13 +436,166 @@ class AsyncMongoNoteRepository(BaseRepositoryPort[Note]):
     async def delete(self, entity_id: UUID, request_id: str) -> None:
         try:
             cache_key = f"note:{entity_id}"
-            await self.collection.delete_one({"id": Binary(entity_id.bytes, UUID_SUBTYPE)})
-            await self.cache.delete(cache_key)
+            doc = await self.collection.find_one_and_delete(
+                {"id": Binary(entity_id.bytes, UUID_SUBTYPE)}, projection={"_id": 0, "owner_id": 1}
+            )
+            await self._evict(cache_key)
+            if doc:
+                await self._bump_generations([self._as_uuid(doc["owner_id"])], request_id)
             self.logger.debug(f"Note deleted with id={entity_id}", request_id=request_id)
         except Exception as e:
             self.logger.error("Database error in delete", error=str(e), request_id=request_id)
             raise DatabaseException(f"Failed to delete note: {e}")
 
+    async def update_owned(
+        self, entity_id: UUID, owner_id: Optional[UUID], changes: Dict[str, Any], request_id: str
+    ) -> Optional[Note]:
+        try:
+            doc = await self.collection.find_one_and_update(
+                self._owned_filter(entity_id, owner_id),
+                {"$set": {**changes, "updated_at": datetime.utcnow()}},
+                projection={"_id": 0},
+                return_document=ReturnDocument.AFTER,
+            )
+            if not doc:
+                self.logger.debug(f"No owned note to update with id={entity_id}", request_id=request_id)
+                return None
+            note = self._to_entity(doc)
+            await self.cache.set(f"note:{entity_id}", note, ttl=self._ttl.expire_in())
+            await self._bump_generations([note.owner_id], request_id)
+            self.logger.debug(f"Note updated with id={entity_id}", request_id=request_id, fields=list(changes))
+            return note
+        except Exception as e:
+            self.logger.error("Database error in update_owned", error=str(e), request_id=request_id)
+            raise DatabaseException(f"Failed to update note: {e}")
+
+    async def delete_owned(self, entity_id: UUID, owner_id: Optional[UUID], request_id: str) -> Optional[Note]:
+        try:
+            doc = await self.collection.find_one_and_delete(
+                self._owned_filter(entity_id, owner_id), projection={"_id": 0}
+            )
+            if not doc:
+                self.logger.debug(f"No owned note to delete with id={entity_id}", request_id=request_id)
+                return None
+            note = self._to_entity(doc)
+            await self._evict(f"note:{entity_id}")
+            await self._bump_generations([note.owner_id], request_id)
+            self.logger.debug(f"Note deleted with id={entity_id}", request_id=request_id)
+            return note
+        except Exception as e:
+            self.logger.error("Database error in delete_owned", error=str(e), request_id=request_id)
+            raise DatabaseException(f"Failed to delete note: {e}")
+
+    async def bulk_write(
+        self, operations: List[BulkOperation[Note]], ordered: bool, request_id: str
+    ) -> List[BulkItemResult[Note]]:
+        results = [self._bulk_result(index, op) for index, op in enumerate(operations)]
+        try:
+            # 1. Повтор id в пакете отклоняется: второй delete того же id отчитался бы об успехе
+            # и освободил бы квоту ещё раз
+            seen = set()
+            for result, op in zip(results, operations):
+                if op.action == BulkAction.CREATE:
+                    continue
+                if op.entity_id in seen:
+                    result.error = ValidationException("entity_id", f"duplicate id {op.entity_id} in batch")
+                seen.add(op.entity_id)
+
+            # 2. Один запрос на проверку существования и владельца для update/delete. Это только ранний отсев
+            # и различение NotFound/AccessDenied: каждая запись ниже сама фильтрует по владельцу
+            target_ids = [r.entity_id for r in results if r.action != BulkAction.CREATE and r.ok]
+            owners = {}
+            if target_ids:
+                async for doc in self.collection.find(
+                    {"id": {"$in": [Binary(i.bytes, UUID_SUBTYPE) for i in target_ids]}},
+                    projection={"_id": 0, "id": 1, "owner_id": 1}
+                ):
+                    owners[self._as_uuid(doc["id"])] = self._as_uuid(doc["owner_id"])
+
+            pending = []
+            for result, op in zip(results, operations):
+                if result.ok and op.action != BulkAction.CREATE:
+                    owner = owners.get(op.entity_id)
+                    result.owner_id = owner
+                    if owner is None:
+                        result.error = NotFoundError("Note", str(op.entity_id))
+                    elif op.owner_id and owner != op.owner_id:
+                        result.error = AccessDeniedError("Access to this Note is denied")
+                if result.error:
+                    if ordered:
+                        break
+                    continue
+                pending.append((result.index, op))
+
+            # 3. Запись сериями: создания и обновления - одной bulk-операцией, удаления - по одной.
+            # Без порядка серий две. В упорядоченном режиме серии идут по индексам, новая начинается
+            # на каждой смене записи и удаления и выполняется, только если предыдущие прошли без ошибок
+            if ordered:
+                runs = [list(run) for _, run in groupby(pending, key=lambda item: item[1].action == BulkAction.DELETE)]
+            else:
+                runs = [
+                    run for run in (
+                        [item for item in pending if item[1].action != BulkAction.DELETE],
+                        [item for item in pending if item[1].action == BulkAction.DELETE],
+                    ) if run
+                ]
+            executed = set()
+            for run in runs:
+                if run[0][1].action == BulkAction.DELETE:
+                    failed = await self._delete_run(run, ordered, results, executed)
+                else:
+                    failed = await self._write_run(run, ordered, results, executed)
+                if ordered and failed:
+                    break
+
+            # 4. Упорядоченный режим: невыполненные операции после первой ошибки пропущены
+            if ordered:
+                first_failure = next((r.index for r in results if r.error), None)
+                for result in results:
+                    if first_failure is not None and result.ok and result.index not in executed:
+                        result.error = OperationSkippedError(first_failure)
+
+            # 5. Кеш обновляется pipeline: созданные/обновлённые пишутся, удалённые стираются или заменяются tombstone
+            cache_entries, tombstones = {}, {}
+            for result in results:
+                if not result.ok:
+                    continue
+                if result.action == BulkAction.DELETE:
+                    if self._ttl.negative_ttl:
+                        tombstones[f"note:{result.entity_id}"] = NOTE_TOMBSTONE
+                    else:
+                        cache_entries[f"note:{result.entity_id}"] = None
+                elif result.entity:
+                    cache_entries[f"note:{result.entity_id}"] = result.entity
+                # Новое поколение списков владельца уходит тем же pipeline
+                if self._list_cache_ttl and result.owner_id:
+                    cache_entries[f"notes:gen:{result.owner_id}"] = uuid4().hex
+            try:
+                await self.cache.write_many(cache_entries, ttl=self._ttl.expire_in())
+                if tombstones:
+                    await self.cache.write_many(tombstones, ttl=self._ttl.negative_ttl)
+                    metrics.inc("note_cache_tombstones_written", len(tombstones))
+            except Exception as e:
+                # Запись в Mongo уже выполнена - ошибка кеша не должна превращать пакет в ошибку целиком
+                self.logger.error("Cache error in bulk_write", error=str(e), request_id=request_id)
+
+            self.logger.debug(
+                "Bulk write completed", request_id=request_id, ordered=ordered, total=len(operations),
+                failed=sum(1 for r in results if not r.ok)
+            )
+            return results
+        except Exception as e:
+            self.logger.error("Database error in bulk_write", error=str(e), request_id=request_id)
+            raise DatabaseException(f"Failed to bulk write notes: {e}")
+
+    async def exists(self, entity_id: UUID, request_id: str) -> bool:
+        try:
+            doc = await self.collection.find_one({"id": Binary(entity_id.bytes, UUID_SUBTYPE)}, projection={"_id": 1})
+            return doc is not None
+        except Exception as e:
+            self.logger.error("Database error in exists", error=str(e), request_id=request_id)
+            raise DatabaseException(f"Failed to check note existence: {e}")
+
     async def count_by_user_id(self, user_id: UUID, request_id: str) -> int:
         try:
             count = await self.collection.count_documents({"owner_id": Binary(user_id.bytes, UUID_SUBTYPE)})
@@ -93,6 +605,112 @@ class AsyncMongoNoteRepository(BaseRepositoryPort[Note]):
             self.logger.error("Database error in count_by_user_id", error=str(e), request_id=request_id)
             raise DatabaseException(f"Failed to count notes: {e}")
 
+    async def _write_run(
+        self, run: List[Tuple[int, BulkOperation[Note]]], ordered: bool, results: List[BulkItemResult[Note]],
+        executed: Set[int]
+    ) -> bool:
+        # В упорядоченном режиме Mongo останавливается на первой ошибке записи, операции после неё не выполнялись
+        failed_at = {}
+        try:
+            await self.collection.bulk_write([self._to_bulk_request(op) for _, op in run], ordered=ordered)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                failed_at[run[error["index"]][0]] = DatabaseException(error.get("errmsg", "Write failed"))
+        stop_at = min(failed_at) if ordered and failed_at else None
+        updates = []
+        for index, op in run:
+            if index in failed_at:
+                results[index].error = failed_at[index]
+            elif stop_at is None or index < stop_at:
+                executed.add(index)
+                if op.action == BulkAction.UPDATE:
+                    updates.append((index, op))
+
+        # Актуальные версии обновлённых заметок одним запросом. Обновление, не нашедшее документ, здесь тоже
+        # не находит его и становится NotFound; операции той же серии после него к этому моменту уже выполнены
+        if updates:
+            updated = {}
+            async for doc in self.collection.find(
+                {"id": {"$in": [Binary(op.entity_id.bytes, UUID_SUBTYPE) for _, op in updates]}}, projection={"_id": 0}
+            ):
+                note = self._to_entity(doc)
+                updated[note.id] = note
+            for index, op in updates:
+                results[index].entity = updated.get(op.entity_id)
+                if results[index].entity is None:
+                    results[index].error = NotFoundError("Note", str(op.entity_id))
+        return any(not results[index].ok for index, _ in run)
+
+    async def _delete_run(
+        self, run: List[Tuple[int, BulkOperation[Note]]], ordered: bool, results: List[BulkItemResult[Note]],
+        executed: Set[int]
+    ) -> bool:
+        # find_one_and_delete вместо DeleteOne: в ответе bulk_write только общее число удалённых,
+        # а по документу видно, какой именно удалила эта операция и чей он был
+        async def delete_one(op: BulkOperation[Note]) -> Optional[dict]:
+            return await self.collection.find_one_and_delete(
+                self._owned_filter(op.entity_id, op.owner_id), projection={"_id": 0, "owner_id": 1}
+            )
+
+        if ordered:
+            # По одной и до первой ошибки
+            deleted = []
+            for _, op in run:
+                try:
+                    doc = await delete_one(op)
+                except Exception as e:
+                    doc = e
+                deleted.append(doc)
+                if doc is None or isinstance(doc, Exception):
+                    break
+        else:
+            limit = asyncio.Semaphore(BULK_DELETE_CONCURRENCY)
+
+            async def limited(op: BulkOperation[Note]) -> Optional[dict]:
+                async with limit:
+                    return await delete_one(op)
+
+            deleted = await asyncio.gather(*(limited(op) for _, op in run), return_exceptions=True)
+
+        failed = False
+        for (index, op), doc in zip(run, deleted):
+            executed.add(index)
+            if isinstance(doc, Exception):
+                results[index].error = DatabaseException(f"Failed to delete note: {doc}")
+            elif doc is None:
+                # Заметку удалили между проверкой и записью
+                results[index].error = NotFoundError("Note", str(op.entity_id))
+            else:
+                results[index].owner_id = self._as_uuid(doc["owner_id"])
+            failed = failed or not results[index].ok
+        return failed
+
+    @staticmethod
+    def _bulk_result(index: int, op: BulkOperation[Note]) -> BulkItemResult[Note]:
+        if op.action == BulkAction.CREATE:
+            return BulkItemResult(
+                index=index, action=op.action, entity_id=op.entity.id, owner_id=op.entity.owner_id, entity=op.entity
+            )
+        return BulkItemResult(index=index, action=op.action, entity_id=op.entity_id)
+
+    def _to_bulk_request(self, op: BulkOperation[Note]):
+        if op.action == BulkAction.CREATE:
+            return InsertOne(self._to_document(op.entity))
+        return UpdateOne(
+            self._owned_filter(op.entity_id, op.owner_id), {"$set": {**op.changes, "updated_at": datetime.utcnow()}}
+        )
+
+    @staticmethod
+    def _as_uuid(value: Any) -> UUID:
+        return value if isinstance(value, UUID) else UUID(bytes=value.as_uuid().bytes)
+
+    @staticmethod
+    def _owned_filter(entity_id: UUID, owner_id: Optional[UUID]) -> dict:
+        query = {"id": Binary(entity_id.bytes, UUID_SUBTYPE)}
+        if owner_id:
+            query["owner_id"] = Binary(owner_id.bytes, UUID_SUBTYPE)
+        return query
+
     def _to_entity(self, doc: dict) -> Note:
         # Handle both UUID and Binary objects for id and owner_id
         note_id = doc["id"] if isinstance(doc["id"], UUID) else UUID(bytes=doc["id"].as_uuid().bytes)
@@ -106,6 +724,26 @@ class AsyncMongoNoteRepository(BaseRepositoryPort[Note]):
             updated_at=doc["updated_at"],
         )
 
+    @staticmethod
+    def _to_entities_raw(batch: bytes) -> List[Note]:
+        # Быстрый путь для списков: документы из find_raw_batches с LIST_PROJECTION, id/owner_id приходят как Binary
+        return [
+            Note(
+                UUID(bytes=doc["id"]), doc["title"], doc["content"], UUID(bytes=doc["owner_id"]),
+                doc["created_at"], doc["updated_at"]
+            )
+            for doc in decode_all(batch, LIST_CODEC_OPTIONS)
+        ]
+
+    @staticmethod
+    def _to_summaries_raw(batch: bytes) -> List[NoteSummary]:
+        return [
+            NoteSummary(
+                UUID(bytes=doc["id"]), doc["title"], UUID(bytes=doc["owner_id"]), doc["created_at"], doc["updated_at"]
+            )
+            for doc in decode_all(batch, LIST_CODEC_OPTIONS)
+        ]
+
     def _to_document(self, entity: Note) -> dict:
         return {
             "id": Binary(entity.id.bytes, UUID_SUBTYPE),
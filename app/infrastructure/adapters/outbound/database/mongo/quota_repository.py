@@ -0,0 +1,109 @@
+from typing import Any
+from uuid import UUID
+from bson import Binary, UUID_SUBTYPE
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import DuplicateKeyError
+from domain.exceptions import DatabaseException
+from domain.ports.outbound.database.quota import QuotaRepositoryPort
+from domain.ports.outbound.logger.logger_port import LoggerPort
+from infrastructure.adapters.outbound.database.mongo.index_manager import ensure_indexes
+
+QUOTA_INDEXES = [
+    IndexModel([("owner_id", ASCENDING)], name="owner_id_unique", unique=True),
+]
+
+
+class AsyncMongoQuotaRepository(QuotaRepositoryPort):
+    """
+    Счётчики заметок по владельцам: {"owner_id": Binary, "count": int}.
+    Условный $inc проверяет и резервирует квоту за один запрос, без count_documents на каждый create.
+    """
+
+    def __init__(self, counters: Any, notes: Any, logger: LoggerPort):
+        self.counters = counters
+        self.notes = notes
+        self.logger = logger.bind(component="AsyncMongoQuotaRepository")
+
+    async def ensure_indexes(self) -> None:
+        await ensure_indexes(self.counters, QUOTA_INDEXES, self.logger)
+
+    async def reserve(self, owner_id: UUID, limit: int, request_id: str, amount: int = 1) -> bool:
+        owner = Binary(owner_id.bytes, UUID_SUBTYPE)
+        try:
+            if await self._try_increment(owner, limit, amount):
+                return True
+            if await self.counters.find_one({"owner_id": owner}, projection={"_id": 1}) is not None:
+                self.logger.debug("Quota exhausted", owner_id=str(owner_id), limit=limit, request_id=request_id)
+                return False
+            # Счётчика ещё нет (новый владелец или данные до появления квот) - засеваем его фактическим числом
+            current = await self.notes.count_documents({"owner_id": owner})
+            try:
+                await self.counters.insert_one({"owner_id": owner, "count": current})
+                self.logger.info("Quota counter seeded", owner_id=str(owner_id), count=current, request_id=request_id)
+            except DuplicateKeyError:
+                pass  # Параллельный запрос засеял счётчик первым
+            return await self._try_increment(owner, limit, amount)
+        except Exception as e:
+            self.logger.error("Database error in reserve", error=str(e), request_id=request_id)
+            raise DatabaseException(f"Failed to reserve quota: {e}")
+
+    async def release(self, owner_id: UUID, request_id: str, amount: int = 1) -> None:
+        try:
+            await self.counters.update_one(
+                {"owner_id": Binary(owner_id.bytes, UUID_SUBTYPE), "count": {"$gte": amount}},
+                {"$inc": {"count": -amount}}
+            )
+            self.logger.debug("Quota released", owner_id=str(owner_id), amount=amount, request_id=request_id)
+        except Exception as e:
+            self.logger.error("Database error in release", error=str(e), request_id=request_id)
+            raise DatabaseException(f"Failed to release quota: {e}")
+
+    async def reconcile(self, request_id: str) -> int:
+        try:
+            actual = {}
+            async for row in self.notes.aggregate([{"$group": {"_id": "$owner_id", "count": {"$sum": 1}}}]):
+                actual[bytes(row["_id"].bytes if isinstance(row["_id"], UUID) else row["_id"])] = row["count"]
+
+            suspects = []
+            # Полный проход по счётчикам не ограничиваем maxTimeMS: фоновая задача, а не запрос клиента
+            async for counter in self.counters.find(
+                {}, projection={"_id": 0, "owner_id": 1, "count": 1}, max_time_ms=None
+            ):
+                owner = counter["owner_id"]
+                key = bytes(owner.bytes if isinstance(owner, UUID) else owner)
+                expected = actual.pop(key, 0)
+                if counter["count"] != expected:
+                    suspects.append((owner, counter["count"], expected))
+            # Владельцы без счётчика в actual не расхождение: первый reserve засеет счётчик через count_documents
+
+            if not suspects:
+                self.logger.info("Quota counters are consistent", request_id=request_id)
+                return 0
+            fixed = 0
+            for owner, seen, expected in suspects:
+                fixed += await self._fix_counter(owner, seen, expected)
+            self.logger.warning(
+                "Quota counters reconciled", drifted=len(suspects), fixed=fixed, request_id=request_id
+            )
+            return fixed
+        except Exception as e:
+            self.logger.error("Database error in reconcile", error=str(e), request_id=request_id)
+            raise DatabaseException(f"Failed to reconcile quotas: {e}")
+
+    async def _fix_counter(self, owner: Binary, seen: int, expected: int) -> int:
+        # aggregate и чтение счётчиков разнесены во времени: пересчитываем владельца прямо перед записью.
+        # Если заметки за это время менялись, владелец активен - оставляем его следующей сверке
+        current = await self.notes.count_documents({"owner_id": owner})
+        if current != expected:
+            return 0
+        # Условие на прочитанное значение: не затираем резервирования, сделанные во время сверки
+        result = await self.counters.update_one({"owner_id": owner, "count": seen}, {"$set": {"count": current}})
+        return result.modified_count
+
+    async def _try_increment(self, owner: Binary, limit: int, amount: int) -> bool:
+        doc = await self.counters.find_one_and_update(
+            {"owner_id": owner, "count": {"$lte": limit - amount}},
+            {"$inc": {"count": amount}},
+            projection={"_id": 1},
+        )
+        return doc is not None
@@ -1,16 +1,44 @@
+import hashlib
+import time
+from typing import Optional
 from uuid import UUID
 from jose import jwt, JWTError
 from domain.ports.outbound.security.auth_port import AuthPort
 from domain.ports.outbound.logger.logger_port import LoggerPort
 from domain.exceptions import AuthenticationError
+from infrastructure.adapters.outbound.cache.memory_cache import MemoryLRUCache
 from infrastructure.config import settings
+from infrastructure.metrics import metrics
 
 class JWTAuthAdapter(AuthPort):
-    def __init__(self, logger: LoggerPort):
+    """
+    cache - проверенные токены (ключ - sha256 токена, сам токен в памяти не хранится).
+    Запись живёт до exp токена, но не дольше TTL кеша; недействительные токены не кешируются.
+    """
+
+    def __init__(self, logger: LoggerPort, cache: Optional[MemoryLRUCache] = None):
         self.logger = logger.bind(component="JWTAuthAdapter")
         self.algorithm = "HS256"
+        self.cache = cache
+        if cache is not None:
+            metrics.register_gauge("jwt_cache_hits", lambda: cache.hits)
+            metrics.register_gauge("jwt_cache_misses", lambda: cache.misses)
+            metrics.register_gauge("jwt_cache_entries", lambda: len(cache))
 
     def verify_token(self, token: str) -> tuple[UUID, str]:
+        if token and self.cache is not None:
+            key = hashlib.sha256(token.encode()).hexdigest()
+            identity = self.cache.get(key)
+            if identity is not None:
+                return identity
+            identity, expires_at = self._decode(token)
+            ttl = None if expires_at is None else expires_at - time.time()
+            if ttl is None or ttl > 0:
+                self.cache.put(key, identity, ttl)
+            return identity
+        return self._decode(token)[0]
+
+    def _decode(self, token: str) -> tuple[tuple[UUID, str], Optional[float]]:
         logger = self.logger.bind(token=token)
         try:
             if not token:
@@ -28,7 +56,8 @@ class JWTAuthAdapter(AuthPort):
                 logger.error("Invalid user_id format")
                 raise AuthenticationError("Invalid user_id format")
             logger.info("Token verified successfully")
-            return user_id, role
+            expires_at = payload.get("exp")
+            return (user_id, role), (float(expires_at) if isinstance(expires_at, (int, float)) else None)
         except JWTError as e:
             logger.error(f"Failed to verify token", error=str(e))
-            raise AuthenticationError(f"Invalid token: {str(e)}")
\ No newline at end of file
+            raise AuthenticationError(f"Invalid token: {str(e)}")
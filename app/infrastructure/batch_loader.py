@@ -0,0 +1,60 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Set, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    Собирает ключи, запрошенные за одно окно (window=0 - за одну итерацию event loop), и загружает их
+    одним вызовом load_many. Батч уходит раньше окна, если набралось max_batch_size ключей.
+    Повторный ключ внутри окна не дублируется в запросе. Ошибку load_many получают все ожидающие батча,
+    отмена одного ожидающего не отменяет загрузку для остальных.
+    """
+
+    def __init__(self, load_many: Callable[[List[K]], Awaitable[Dict[K, V]]], window: float, max_batch_size: int):
+        self._load_many = load_many
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._pending: Dict[K, asyncio.Future] = {}
+        self._timer: Optional[asyncio.Handle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> Optional[V]:
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self._max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self._window, self._dispatch) if self._window else loop.call_soon(self._dispatch)
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: Dict[K, asyncio.Future]) -> None:
+        try:
+            results = await self._load_many(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in batch.values():
+                future.set_exception(e)
+                # Если ожидающий отменился, исключение никто не заберёт; помечаем его полученным
+                future.exception()
+            return
+        for key, future in batch.items():
+            future.set_result(results.get(key))
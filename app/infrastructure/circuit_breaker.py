@@ -0,0 +1,57 @@
+import time
+from infrastructure.metrics import metrics
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, name: str):
+        super().__init__(f"{name} is unavailable (circuit open)")
+        self.name = name
+
+
+class CircuitBreaker:
+    """
+    Размыкатель для внешней зависимости. После failure_threshold сбоев подряд размыкается
+    и reset_timeout секунд отклоняет вызовы сразу, затем пропускает один пробный вызов:
+    успех замыкает цепь, сбой снова размыкает. Не потокобезопасен: используется из одного event loop.
+    Метрики: breaker_<name>_state (0 - замкнут, 1 - пробный вызов, 2 - разомкнут),
+    breaker_<name>_opened, breaker_<name>_rejected.
+    """
+
+    CLOSED, HALF_OPEN, OPEN = 0, 1, 2
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        metrics.register_gauge(f"breaker_{name}_state", lambda: self.state)
+
+    def allow(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        now = time.monotonic()
+        if now - self._opened_at >= self.reset_timeout:
+            # Один пробный вызов на reset_timeout: если он завис или отменён, следующий пропускается через тот же срок
+            self.state = self.HALF_OPEN
+            self._opened_at = now
+            return True
+        metrics.inc(f"breaker_{self.name}_rejected")
+        return False
+
+    def record_success(self) -> bool:
+        """Возвращает True, если вызов замкнул разомкнутую цепь."""
+        self._failures = 0
+        if self.state == self.CLOSED:
+            return False
+        self.state = self.CLOSED
+        return True
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                metrics.inc(f"breaker_{self.name}_opened")
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
@@ -1,4 +1,5 @@
 from dishka import make_async_container, AsyncContainer
+from dishka.integrations.fastapi import FastapiProvider
 from infrastructure.di.base_provider import BaseProvider
 from infrastructure.di.providers.mongo import MongoProvider
 from infrastructure.di.providers.redis import RedisProvider
@@ -7,16 +8,17 @@ from infrastructure.di.providers.event import EventProvider
 from infrastructure.di.providers.security import SecurityProvider
 from domain.ports.outbound.logger.logger_port import LoggerPort
 
+ROLES = ("api", "grpc", "consumer", "all")
 
-async def get_container() -> AsyncContainer:
-    container = make_async_container(
-        BaseProvider(),
-        MongoProvider(),
-        RedisProvider(),
-        NoteProvider(),
-        EventProvider(),
-        SecurityProvider(),
-    )
+
+async def get_container(role: str = "all") -> AsyncContainer:
+    # Консьюмеру нужен только логгер: обработчик событий не ходит ни в Mongo, ни в Redis
+    providers = [BaseProvider()]
+    if role != "consumer":
+        providers += [MongoProvider(), RedisProvider(), NoteProvider(), EventProvider(), SecurityProvider()]
+    if role in ("api", "all"):
+        providers.append(FastapiProvider())
+    container = make_async_container(*providers)
     logger = await container.get(LoggerPort)
-    logger.bind(component="DI").info("Async DI container initialized")
-    return container
\ No newline at end of file
+    logger.bind(component="DI").info("Async DI container initialized", role=role)
+    return container
@@ -2,6 +2,7 @@ from dishka import Provider, Scope, provide
 from motor.motor_asyncio import AsyncIOMotorClient
 from infrastructure.config import settings
 from domain.ports.outbound.logger.logger_port import LoggerPort
+from infrastructure.circuit_breaker import CircuitBreaker
 
 
 class MongoProvider(Provider):
@@ -12,4 +13,9 @@ class MongoProvider(Provider):
         return AsyncIOMotorClient(
             settings.mongo_uri,
             uuidRepresentation=settings.mongo_uuid_representation
-        )
\ No newline at end of file
+        )
+
+    @provide(scope=Scope.APP)
+    def get_mongo_breaker(self) -> CircuitBreaker:
+        # Один размыкатель на все коллекции: они живут на одном кластере
+        return CircuitBreaker("mongo", settings.mongo_breaker_threshold, settings.mongo_breaker_reset)
\ No newline at end of file
@@ -1,40 +1,73 @@
 from dishka import Provider, Scope, provide
 from motor.motor_asyncio import AsyncIOMotorClient
-from redis.asyncio import Redis as AsyncRedis
-from domain.ports.outbound.database.base_repository_port import BaseRepositoryPort
-from domain.models.entities.note import Note
+from domain.ports.outbound.database.note import NoteRepositoryPort
 from domain.ports.outbound.logger.logger_port import LoggerPort
 from domain.ports.outbound.event.event_publisher import EventPublisherPort
 from domain.ports.outbound.security.auth_port import AuthPort
+from domain.ports.outbound.database.quota import QuotaRepositoryPort
+from domain.ports.outbound.cache.cache_port import CachePort
 from infrastructure.config import settings
+from infrastructure.circuit_breaker import CircuitBreaker
+from infrastructure.adapters.outbound.database.mongo.guarded_collection import GuardedCollection
+from infrastructure.adapters.outbound.cache.ttl_policy import CacheTtlPolicy
 from infrastructure.adapters.outbound.database.mongo.note_repository import AsyncMongoNoteRepository
-from infrastructure.adapters.outbound.cache.redis_adapter import AsyncRedisCacheRepository
+from infrastructure.adapters.outbound.database.mongo.quota_repository import AsyncMongoQuotaRepository
 from infrastructure.adapters.inbound.grpc.note_service import NoteServiceServicer
 from application.services.note import AsyncNoteService
 
 
 class NoteProvider(Provider):
     @provide(scope=Scope.APP)
-    def get_async_note_repository(
+    async def get_async_note_repository(
             self,
             mongo: AsyncIOMotorClient,
-            redis: AsyncRedis,
+            cache: CachePort,
             logger: LoggerPort,
-    ) -> BaseRepositoryPort[Note]:
+            breaker: CircuitBreaker,
+    ) -> NoteRepositoryPort:
         db = mongo[settings.mongo_db]
-        collection = db["notes"]
+        collection = GuardedCollection(db["notes"], breaker, settings.mongo_timeout_ms / 1000)
         logger = logger.bind(component="AsyncNoteRepository")
-        return AsyncMongoNoteRepository(collection, AsyncRedisCacheRepository(redis, logger), logger)
+        repository = AsyncMongoNoteRepository(
+            collection, cache, logger,
+            batch_window=settings.get_batch_window_ms / 1000 if settings.get_batching_enabled else None,
+            batch_max_size=settings.get_batch_max_size,
+            ttl_policy=CacheTtlPolicy(
+                settings.redis_ttl, settings.cache_stale_ttl,
+                settings.cache_ttl_jitter, settings.cache_early_refresh_beta, settings.cache_negative_ttl
+            ),
+            list_cache_ttl=settings.list_cache_ttl,
+            warm_max_entries=settings.cache_warm_list_max
+        )
+        await repository.ensure_indexes()
+        await repository.verify_query_plans(settings.mongo_index_check)
+        return repository
+
+    @provide(scope=Scope.APP)
+    async def get_quota_repository(
+            self,
+            mongo: AsyncIOMotorClient,
+            logger: LoggerPort,
+            breaker: CircuitBreaker,
+    ) -> QuotaRepositoryPort:
+        db = mongo[settings.mongo_db]
+        timeout = settings.mongo_timeout_ms / 1000
+        repository = AsyncMongoQuotaRepository(
+            GuardedCollection(db["note_quotas"], breaker, timeout), GuardedCollection(db["notes"], breaker, timeout), logger
+        )
+        await repository.ensure_indexes()
+        return repository
 
     @provide(scope=Scope.APP)
     def get_async_note_service(
         self,
-        repo: BaseRepositoryPort[Note],
+        repo: NoteRepositoryPort,
         logger: LoggerPort,
-        event_publisher: EventPublisherPort
+        event_publisher: EventPublisherPort,
+        quota: QuotaRepositoryPort
     ) -> AsyncNoteService:
         logger = logger.bind(component="AsyncNoteService")
-        return AsyncNoteService(repo, logger, event_publisher)
+        return AsyncNoteService(repo, logger, event_publisher, quota)
 
     @provide(scope=Scope.APP)
     def get_grpc_note_service(
@@ -1,7 +1,13 @@
 from dishka import Provider, Scope, provide
 from redis.asyncio import Redis as AsyncRedis
 from infrastructure.config import settings
+from infrastructure.circuit_breaker import CircuitBreaker
+from domain.ports.outbound.cache.cache_port import CachePort
 from domain.ports.outbound.logger.logger_port import LoggerPort
+from infrastructure.adapters.outbound.cache.codec import BinaryCacheCodec, JsonCacheCodec
+from infrastructure.adapters.outbound.cache.redis_adapter import AsyncRedisCacheRepository
+from infrastructure.adapters.outbound.cache.memory_cache import MemoryLRUCache
+from infrastructure.adapters.outbound.cache.tiered_cache import TieredCacheRepository
 
 
 class RedisProvider(Provider):
@@ -10,4 +16,20 @@ class RedisProvider(Provider):
         logger = logger.bind(component="AsyncRedisProvider")
         redis = AsyncRedis.from_url(settings.redis_uri)
         logger.info("Async Redis client initialized")
-        return redis
\ No newline at end of file
+        return redis
+
+    @provide(scope=Scope.APP)
+    def get_cache(self, redis: AsyncRedis, logger: LoggerPort) -> CachePort:
+        codec = JsonCacheCodec() if settings.cache_codec == "json" else BinaryCacheCodec()
+        breaker = CircuitBreaker("redis", settings.redis_breaker_threshold, settings.redis_breaker_reset)
+        timeout = settings.redis_timeout_ms / 1000
+        cache = AsyncRedisCacheRepository(redis, logger, codec, breaker=breaker, timeout=timeout)
+        if not settings.l1_cache_enabled:
+            return cache
+        logger.bind(component="AsyncRedisProvider").info(
+            "In-process L1 cache enabled", max_bytes=settings.l1_cache_max_bytes, ttl=settings.l1_cache_ttl
+        )
+        l1 = MemoryLRUCache(settings.l1_cache_max_bytes, settings.l1_cache_ttl)
+        return TieredCacheRepository(
+            cache, redis, l1, settings.cache_invalidation_channel, logger, publish_timeout=timeout
+        )
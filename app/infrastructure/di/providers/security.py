@@ -1,11 +1,16 @@
 from dishka import Provider, Scope, provide
 from domain.ports.outbound.security.auth_port import AuthPort
 from domain.ports.outbound.logger.logger_port import LoggerPort
+from infrastructure.adapters.outbound.cache.memory_cache import MemoryLRUCache
 from infrastructure.adapters.outbound.security.jwt_adapter import JWTAuthAdapter
+from infrastructure.config import settings
 
 class SecurityProvider(Provider):
     @provide(scope=Scope.APP)
     def get_auth(self, logger: LoggerPort) -> AuthPort:
         logger = logger.bind(component="SecurityProvider")
-        logger.info("JWT auth adapter initialized")
-        return JWTAuthAdapter(logger)
\ No newline at end of file
+        cache = None
+        if settings.jwt_cache_max_bytes:
+            cache = MemoryLRUCache(settings.jwt_cache_max_bytes, settings.jwt_cache_ttl)
+        logger.info("JWT auth adapter initialized", cache_max_bytes=settings.jwt_cache_max_bytes)
+        return JWTAuthAdapter(logger, cache)
@@ -0,0 +1,24 @@
+import asyncio
+import importlib.util
+from typing import Callable, Optional
+
+
+def event_loop_factory(name: str) -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """
+    Фабрика цикла событий для asyncio.Runner: uvloop, если он выбран (или auto) и установлен,
+    иначе None - стандартный цикл asyncio. На цикле процесса работают и REST, и grpc.aio, и консьюмер.
+    """
+    if name == "asyncio":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def http_implementation(name: str) -> str:
+    """Парсер HTTP для uvicorn: httptools, если он выбран (или auto) и установлен, иначе h11."""
+    if name == "h11" or importlib.util.find_spec("httptools") is None:
+        return "h11"
+    return "httptools"
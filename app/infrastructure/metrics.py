@@ -0,0 +1,27 @@
+from typing import Callable, Dict
+
+
+class MetricsRegistry:
+    """
+    Простой реестр метрик процесса: счётчики и gauge-функции, читаемые при снимке.
+    Отдаётся как JSON через GET /metrics.
+    """
+
+    def __init__(self):
+        self._counters: Dict[str, int] = {}
+        self._gauges: Dict[str, Callable[[], float]] = {}
+
+    def inc(self, name: str, amount: int = 1) -> None:
+        self._counters[name] = self._counters.get(name, 0) + amount
+
+    def register_gauge(self, name: str, read: Callable[[], float]) -> None:
+        self._gauges[name] = read
+
+    def snapshot(self) -> Dict[str, float]:
+        values: Dict[str, float] = dict(self._counters)
+        for name, read in self._gauges.items():
+            values[name] = read()
+        return dict(sorted(values.items()))
+
+
+metrics = MetricsRegistry()
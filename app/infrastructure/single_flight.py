@@ -0,0 +1,46 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Таблица запросов "в полёте": одновременные вызовы do() с одним ключом разделяют одно выполнение fn.
+    fn выполняется в отдельной задаче, поэтому отмена любого из ожидающих (в том числе первого)
+    не отменяет загрузку для остальных. Исключение fn получают все ожидающие.
+    """
+
+    def __init__(self, on_shared: Callable[[], None] | None = None):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self._on_shared = on_shared
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            task = self.spawn(key, fn)
+        elif self._on_shared:
+            self._on_shared()
+        return await asyncio.shield(task)
+
+    def spawn(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> "asyncio.Task[T]":
+        # Запуск без ожидания (фоновое обновление); если выполнение с этим ключом уже идёт, возвращает его
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return task
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Если все ожидающие отменились, исключение никто не заберёт; забираем сами, чтобы asyncio не ругался
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,141 @@
+import multiprocessing
+import signal
+import socket
+import time
+from typing import Callable, List, Optional
+from domain.ports.outbound.logger.logger_port import LoggerPort
+
+# Не перезапускать упавший воркер чаще, чем раз в столько секунд
+_RESTART_DELAY = 1.0
+_POLL_INTERVAL = 0.5
+
+
+def reuseport_socket(host: str, port: int) -> socket.socket:
+    """
+    Слушающий сокет с SO_REUSEPORT: каждый воркер открывает свой на тот же порт,
+    ядро распределяет между ними входящие соединения.
+    """
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    return sock
+
+
+class _Worker:
+    def __init__(self, process: multiprocessing.Process, ready):
+        self.process = process
+        self.ready = ready
+        self.started_at = time.monotonic()
+
+
+class Supervisor:
+    """
+    Держит workers процессов target(worker_id, ready) и перезапускает упавшие.
+    Воркеры запускаются через spawn: каждый заново импортирует код и создаёт свой DI-контейнер и пулы,
+    ничего не наследуя от родителя (gRPC и Motor не переживают fork).
+    SIGHUP - плавная перезагрузка: воркеры заменяются по одному, старый останавливается только
+    после того, как новый выставил ready; если новый не поднялся, перезагрузка прерывается.
+    SIGTERM/SIGINT - остановка: воркерам шлётся SIGTERM, через stop_timeout секунд оставшиеся убиваются.
+    """
+
+    def __init__(
+        self, target: Callable, workers: int, logger: LoggerPort,
+        stop_timeout: float, startup_timeout: float = 60.0
+    ):
+        self.target = target
+        self.workers = workers
+        self.stop_timeout = stop_timeout
+        self.startup_timeout = startup_timeout
+        self.logger = logger.bind(component="Supervisor")
+        self._context = multiprocessing.get_context("spawn")
+        self._slots: List[Optional[_Worker]] = [None] * workers
+        self._stopping = False
+        self._reload_requested = False
+
+    def run(self) -> None:
+        signal.signal(signal.SIGTERM, self._on_stop)
+        signal.signal(signal.SIGINT, self._on_stop)
+        signal.signal(signal.SIGHUP, self._on_reload)
+        self.logger.info("Supervisor started", workers=self.workers)
+        for worker_id in range(self.workers):
+            self._slots[worker_id] = self._spawn(worker_id)
+
+        while not self._stopping:
+            if self._reload_requested:
+                self._reload_requested = False
+                self._reload()
+            self._restart_dead()
+            time.sleep(_POLL_INTERVAL)
+
+        self._stop_all()
+        self.logger.info("Supervisor stopped")
+
+    def _on_stop(self, signum, frame) -> None:
+        self._stopping = True
+
+    def _on_reload(self, signum, frame) -> None:
+        self._reload_requested = True
+
+    def _spawn(self, worker_id: int) -> _Worker:
+        ready = self._context.Event()
+        process = self._context.Process(
+            target=self.target, args=(worker_id, ready), name=f"worker-{worker_id}", daemon=False
+        )
+        process.start()
+        self.logger.info("Worker started", worker_id=worker_id, pid=process.pid)
+        return _Worker(process, ready)
+
+    def _restart_dead(self) -> None:
+        now = time.monotonic()
+        for worker_id, worker in enumerate(self._slots):
+            if worker is None or worker.process.is_alive():
+                continue
+            if now - worker.started_at < _RESTART_DELAY:
+                continue
+            self.logger.error(
+                "Worker exited unexpectedly, restarting",
+                worker_id=worker_id, pid=worker.process.pid, exitcode=worker.process.exitcode,
+            )
+            self._slots[worker_id] = self._spawn(worker_id)
+
+    def _reload(self) -> None:
+        self.logger.info("Reloading workers")
+        for worker_id, old in enumerate(self._slots):
+            if self._stopping:
+                return
+            new = self._spawn(worker_id)
+            if not self._wait_ready(new):
+                self.logger.error("New worker failed to start, reload aborted", worker_id=worker_id)
+                self._terminate([new])
+                return
+            self._slots[worker_id] = new
+            if old is not None:
+                self._terminate([old])
+        self.logger.info("Workers reloaded")
+
+    def _wait_ready(self, worker: _Worker) -> bool:
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline and not self._stopping:
+            if worker.ready.wait(_POLL_INTERVAL):
+                return True
+            if not worker.process.is_alive():
+                return False
+        return False
+
+    def _stop_all(self) -> None:
+        self.logger.info("Stopping workers")
+        self._terminate([worker for worker in self._slots if worker is not None])
+
+    def _terminate(self, workers: List[_Worker]) -> None:
+        for worker in workers:
+            if worker.process.is_alive():
+                worker.process.terminate()
+        deadline = time.monotonic() + self.stop_timeout
+        for worker in workers:
+            worker.process.join(max(0.0, deadline - time.monotonic()))
+            if worker.process.is_alive():
+                self.logger.error("Worker did not stop in time, killing", pid=worker.process.pid)
+                worker.process.kill()
+                worker.process.join()
@@ -1,18 +1,33 @@
+import argparse
 import asyncio
+import functools
+import os
+import signal
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.responses import Response
 from dishka.integrations.fastapi import setup_dishka
-from infrastructure.di.container import get_container
+from infrastructure.di.container import ROLES, get_container
 from infrastructure.adapters.inbound.broker.rabbitmq_consumer import start_consumer
 from infrastructure.adapters.inbound.grpc.server import start_grpc_server
+from infrastructure.adapters.inbound.scheduler.quota_reconciliation import start_quota_reconciliation
+from infrastructure.adapters.inbound.scheduler.cache_warmup import warm_hot_owners
 from infrastructure.adapters.inbound.grpc.auth_interceptor import AuthInterceptor
 from infrastructure.adapters.inbound.grpc.note_service import NoteServiceServicer
 from infrastructure.adapters.inbound.rest.note_router import router
+from infrastructure.adapters.inbound.rest.metrics_router import router as metrics_router
+from infrastructure.adapters.outbound.cache.tiered_cache import TieredCacheRepository
+from infrastructure.adapters.outbound.logger import configure_structlog
+from infrastructure.adapters.outbound.logger.structlog_adapter import StructlogAdapter
+from infrastructure.supervisor import Supervisor, reuseport_socket
+from infrastructure.event_loop import event_loop_factory, http_implementation
 from application.event_handlers.note_event_handler import NoteEventHandler
 from domain.ports.outbound.security.auth_port import AuthPort
 from domain.ports.outbound.logger.logger_port import LoggerPort
 from domain.ports.outbound.event.event_publisher import EventPublisherPort
+from domain.ports.outbound.database.quota import QuotaRepositoryPort
+from domain.ports.outbound.database.note import NoteRepositoryPort
+from domain.ports.outbound.cache.cache_port import CachePort
 from infrastructure.config import settings
 import uuid
 import structlog.contextvars
@@ -20,6 +35,7 @@ import structlog
 
 app = FastAPI(title="Note Service")
 app.include_router(router)
+app.include_router(metrics_router)
 
 @app.middleware("http")
 async def logging_middleware(request: Request, call_next):
@@ -49,51 +65,141 @@ async def logging_middleware(request: Request, call_next):
     finally:
         structlog.contextvars.clear_contextvars()
 
-async def main():
-    container = await get_container()
+async def main(role: str = "all", worker_id: int = 0, ready=None):
+    serves_rest = role in ("api", "all")
+    serves_grpc = role in ("grpc", "all")
+    serves_requests = serves_rest or serves_grpc
+    container = await get_container(role)
     logger = await container.get(LoggerPort)
-    handler = NoteEventHandler(logger)
-    note_service = await container.get(NoteServiceServicer)
-    auth = await container.get(AuthPort)
-    publisher = await container.get(EventPublisherPort)
-
-    auth_interceptor = AuthInterceptor(auth, logger)
-    setup_dishka(container, app)
 
     # Start RabbitMQ consumer
-    logger.info("Starting RabbitMQ consumer")
-    consumer_task = asyncio.create_task(start_consumer(settings.rabbitmq_uri, handler, logger))
+    consumer_task = None
+    if role in ("consumer", "all"):
+        logger.info("Starting RabbitMQ consumer")
+        consumer_task = asyncio.create_task(start_consumer(settings.rabbitmq_uri, NoteEventHandler(logger), logger))
+
+    publisher = None
+    reconcile_task = warmup_task = invalidation_task = None
+    if serves_requests:
+        publisher = await container.get(EventPublisherPort)
+        quota = await container.get(QuotaRepositoryPort)
+        cache = await container.get(CachePort)
+        note_repo = await container.get(NoteRepositoryPort)
+
+        # Periodic quota repair and cache warm-up are needed once per replica, not once per worker
+        if worker_id == 0:
+            # Start periodic repair of per-owner quota counters
+            reconcile_task = asyncio.create_task(
+                start_quota_reconciliation(quota, settings.quota_reconcile_interval, logger)
+            )
+            # Warm the cache for hot owners in the background, startup does not wait for it
+            warmup_task = asyncio.create_task(
+                warm_hot_owners(note_repo, settings.cache_warm_owners, settings.cache_warm_owner_limit, logger)
+            )
+
+        # L1 cache serves reads only while subscribed to invalidations from other replicas
+        if isinstance(cache, TieredCacheRepository):
+            invalidation_task = asyncio.create_task(cache.listen_invalidations())
 
     # Start async gRPC server
-    logger.info("Starting gRPC server")
-    grpc_task = asyncio.create_task(start_grpc_server(note_service, auth_interceptor, logger))
+    grpc_server = None
+    if serves_grpc:
+        logger.info("Starting gRPC server")
+        note_service = await container.get(NoteServiceServicer)
+        auth = await container.get(AuthPort)
+        grpc_server = await start_grpc_server(note_service, AuthInterceptor(auth, logger), logger)
 
+    loop = type(asyncio.get_running_loop()).__module__.split(".")[0]
+    if settings.event_loop == "uvloop" and loop != "uvloop":
+        logger.warning("uvloop is not installed, using the default asyncio event loop")
+    logger.info("Application started", role=role, worker_id=worker_id, pid=os.getpid(), event_loop=loop)
+    try:
+        if serves_rest:
+            await _serve_rest(container, logger, ready)
+        else:
+            await _wait_for_stop(ready)
+    except asyncio.CancelledError:
+        logger.info("Received shutdown signal")
+    finally:
+        # Gracefully shut down
+        logger.info("Shutting down application")
+        if grpc_server:
+            # Новые вызовы отклоняются, начатые получают shutdown_grace секунд на завершение
+            await grpc_server.stop(settings.shutdown_grace)
+            logger.info("gRPC server stopped")
+        for task in (consumer_task, reconcile_task, warmup_task, invalidation_task):
+            if task:
+                task.cancel()
+        if publisher:
+            await publisher.shutdown()
+        if consumer_task:
+            try:
+                await consumer_task
+                logger.info("Consumer task cancelled")
+            except asyncio.CancelledError:
+                logger.info("Consumer task cancellation confirmed")
+            except Exception as e:
+                # Консьюмер мог упасть раньше (брокер недоступен) - это не должно мешать закрыть пулы
+                logger.error("Consumer task failed", error=str(e))
+        await container.close()
+        logger.info("Application shutdown complete")
+
+async def _serve_rest(container, logger: LoggerPort, ready) -> None:
+    setup_dishka(container, app)
     # Start FastAPI server
     config = uvicorn.Config(
         app,
         host="0.0.0.0",
         port=settings.rest_port,
-        log_level="info"
+        log_level="info",
+        http=http_implementation(settings.http_parser),
+        timeout_graceful_shutdown=settings.shutdown_grace,
     )
+    if settings.http_parser == "httptools" and config.http != "httptools":
+        logger.warning("httptools is not installed, using h11")
     server = uvicorn.Server(config)
+    ready_task = asyncio.create_task(_notify_ready(server, ready))
 
-    logger.info("Application started")
+    # uvicorn после остановки повторно поднимает пойманный сигнал; с обработчиком по умолчанию
+    # процесс завершился бы сразу, не остановив gRPC и не закрыв пулы
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sig, lambda *_: None)
     try:
-        await server.serve()
-    except asyncio.CancelledError:
-        logger.info("Received shutdown signal")
+        await server.serve(sockets=[reuseport_socket(config.host, config.port)])
     finally:
-        # Gracefully shut down
-        logger.info("Shutting down application")
-        consumer_task.cancel()
-        await publisher.shutdown()
-        try:
-            await consumer_task
-            logger.info("Consumer task cancelled")
-        except asyncio.CancelledError:
-            logger.info("Consumer task cancellation confirmed")
-        await container.close()
-        logger.info("Application shutdown complete")
+        ready_task.cancel()
+
+async def _wait_for_stop(ready) -> None:
+    # Без uvicorn сигналы остановки ловим сами
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+    if ready is not None:
+        ready.set()
+    await stop.wait()
+
+async def _notify_ready(server: uvicorn.Server, ready) -> None:
+    # gRPC к этому моменту уже слушает; супервизор при перезагрузке останавливает старый воркер
+    # только после готовности нового
+    while not server.started:
+        await asyncio.sleep(0.05)
+    if ready is not None:
+        ready.set()
+
+def run_worker(role: str, worker_id: int, ready) -> None:
+    with asyncio.Runner(loop_factory=event_loop_factory(settings.event_loop)) as runner:
+        runner.run(main(role, worker_id, ready))
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Note Service")
+    parser.add_argument("--role", choices=ROLES, default=settings.role, help="api, grpc, consumer or all")
+    args = parser.parse_args()
+
+    configure_structlog()
+    workers = settings.workers or os.cpu_count() or 1
+    # Воркер может потратить shutdown_grace на HTTP и столько же на gRPC
+    Supervisor(
+        functools.partial(run_worker, args.role), workers, StructlogAdapter(),
+        stop_timeout=settings.shutdown_grace * 2 + 5,
+    ).run()
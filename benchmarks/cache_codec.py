@@ -0,0 +1,65 @@
+"""
+Микробенчмарк кодека кеша заметок (без Redis): JSON с пополевыми преобразованиями UUID/datetime
+против бинарного формата NOTE_V1. Меряет кодирование, декодирование до Note и размер записи.
+
+    python benchmarks/cache_codec.py --rounds 20000
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+from uuid import uuid4
+
+os.environ.setdefault("PYTHONIOENCODING", "utf-8")
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from domain.models.entities.note import Note
+from infrastructure.adapters.outbound.cache.codec import BinaryCacheCodec, JsonCacheCodec
+
+CONTENT_SIZES = (64, 1024, 16 * 1024)
+
+
+def _note(content_size: int) -> Note:
+    now = datetime.utcnow()
+    return Note(uuid4(), "Заметка о кеше", ("lorem ipsum ж " * content_size)[:content_size], uuid4(), now, now)
+
+
+def _measure(fn, rounds: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - started) / rounds * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cache codec benchmark")
+    parser.add_argument("--rounds", type=int, default=20000)
+    args = parser.parse_args()
+
+    json_codec, binary_codec = JsonCacheCodec(), BinaryCacheCodec()
+    for size in CONTENT_SIZES:
+        note = _note(size)
+        json_raw, binary_raw = json_codec.encode(note.__dict__), binary_codec.encode(note)
+        assert binary_codec.decode(binary_raw) == note
+        results = {
+            "json": (
+                _measure(lambda: json_codec.encode(note.__dict__), args.rounds),
+                _measure(lambda: Note(**json_codec.decode(json_raw)), args.rounds),
+                len(json_raw),
+            ),
+            "binary": (
+                _measure(lambda: binary_codec.encode(note), args.rounds),
+                _measure(lambda: binary_codec.decode(binary_raw), args.rounds),
+                len(binary_raw),
+            ),
+        }
+        for label, (encode_us, decode_us, stored) in results.items():
+            print(f"content={size}B {label}: encode {encode_us:.2f} us, decode {decode_us:.2f} us, {stored} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+A/B бенчмарк цикла событий и HTTP-парсера (EVENT_LOOP, HTTP_PARSER): asyncio + h11 против uvloop + httptools.
+Для каждого варианта поднимает в отдельном процессе uvicorn с минимальным FastAPI-приложением
+(без Mongo и Redis, меряется только накладной расход сервера) и нагружает его rest_throughput.py.
+Нагрузчик во всех вариантах одинаковый, поэтому разница - это сервер.
+
+    python benchmarks/event_loop.py --concurrency 64 --duration 10
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+from datetime import datetime
+from uuid import uuid4
+
+os.environ.setdefault("PYTHONIOENCODING", "utf-8")
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from infrastructure.event_loop import event_loop_factory, http_implementation
+from rest_throughput import format_result, run
+
+VARIANTS = (("asyncio", "h11"), ("asyncio", "httptools"), ("uvloop", "httptools"))
+
+
+def serve(loop: str, http: str, port: int) -> None:
+    import uvicorn
+    from fastapi import FastAPI
+
+    app = FastAPI()
+    note = {
+        "id": str(uuid4()), "title": "Заметка", "content": "lorem ipsum " * 20,
+        "owner_id": str(uuid4()), "created_at": datetime.utcnow().isoformat(), "updated_at": datetime.utcnow().isoformat(),
+    }
+
+    @app.get("/notes/{note_id}")
+    async def get_note(note_id: str):
+        return note
+
+    config = uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", access_log=False, http=http_implementation(http))
+    with asyncio.Runner(loop_factory=event_loop_factory(loop)) as runner:
+        runner.run(uvicorn.Server(config).serve())
+
+
+def _wait_up(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(url, timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server at {url} did not start")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Event loop / HTTP parser A/B benchmark")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--serve", nargs=2, metavar=("LOOP", "HTTP"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(*args.serve, args.port)
+        return
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    path = f"/notes/{uuid4()}"
+    for loop, http in VARIANTS:
+        server = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--serve", loop, http, "--port", str(args.port)])
+        try:
+            _wait_up(base_url + path)
+            # Нагрузчик всегда на одном и том же цикле, чтобы сравнивались только серверы
+            with asyncio.Runner(loop_factory=event_loop_factory("auto")) as runner:
+                result = runner.run(run(base_url, path, "GET", "", args.concurrency, args.duration))
+            print(format_result(f"{loop}+{http_implementation(http)}", result))
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
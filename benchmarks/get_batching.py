@@ -0,0 +1,146 @@
+"""
+Бенчмарк склейки get_by_id (GET_BATCHING_ENABLED): сколько обращений к Redis и MongoDB
+приходится на один запрос при конкурентной нагрузке, с батчингом и без.
+
+Запуск против MongoDB и Redis (например, из docker-compose):
+
+    MONGO_URI=mongodb://localhost:27017 REDIS_URI=redis://localhost:6379/0 \
+        python benchmarks/get_batching.py --notes 2000 --concurrency 64 --requests 20000
+
+Заметки пишутся во временную коллекцию benchmark_notes, которая удаляется после прогона.
+Каждый режим стартует с холодного кеша.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Iterable, List, Optional
+from uuid import UUID, uuid4
+
+os.environ.setdefault("PYTHONIOENCODING", "utf-8")
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+import structlog
+
+from domain.models.entities.note import Note
+from infrastructure.adapters.outbound.cache.redis_adapter import AsyncRedisCacheRepository
+from infrastructure.adapters.outbound.database.mongo.note_repository import AsyncMongoNoteRepository
+from infrastructure.adapters.outbound.logger.structlog_adapter import StructlogAdapter
+from infrastructure.config import settings
+
+
+class CountingProxy:
+    """Пропускает вызовы к клиенту как есть и считает вызовы перечисленных методов (один вызов - один round trip)."""
+
+    def __init__(self, target: Any, methods: Iterable[str], counter: Counter, prefix: str):
+        self._target = target
+        self._methods = set(methods)
+        self._counter = counter
+        self._prefix = prefix
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if name not in self._methods:
+            return attr
+
+        def counted(*args, **kwargs):
+            self._counter[f"{self._prefix}.{name}"] += 1
+            return attr(*args, **kwargs)
+        return counted
+
+
+REDIS_CALLS = ("get", "mget", "set", "setex", "delete", "pipeline")
+MONGO_CALLS = ("find_one", "find")
+
+
+async def measure(
+    collection: Any, redis: Any, note_ids: List[UUID], concurrency: int, requests: int,
+    batch_window: Optional[float], batch_max_size: int
+) -> dict:
+    counter: Counter = Counter()
+    logger = StructlogAdapter()
+    cache = AsyncRedisCacheRepository(CountingProxy(redis, REDIS_CALLS, counter, "redis"), logger)
+    repo = AsyncMongoNoteRepository(
+        CountingProxy(collection, MONGO_CALLS, counter, "mongo"), cache, logger,
+        batch_window=batch_window, batch_max_size=batch_max_size
+    )
+    await redis.delete(*(f"note:{note_id}" for note_id in note_ids))
+    counter.clear()
+
+    remaining = requests
+    rng = random.Random(42)
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await repo.get_by_id(rng.choice(note_ids), "benchmark")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    redis_calls = sum(v for k, v in counter.items() if k.startswith("redis."))
+    mongo_calls = sum(v for k, v in counter.items() if k.startswith("mongo."))
+    return {
+        "requests": requests,
+        "rps": requests / elapsed if elapsed else 0.0,
+        "redis_per_request": redis_calls / requests,
+        "mongo_per_request": mongo_calls / requests,
+        "calls": dict(sorted(counter.items())),
+    }
+
+
+def format_result(label: str, result: dict) -> str:
+    return (
+        f"{label}: {result['rps']:.0f} req/s, redis {result['redis_per_request']:.3f}/req, "
+        f"mongo {result['mongo_per_request']:.3f}/req {result['calls']}"
+    )
+
+
+async def run(notes: int, concurrency: int, requests: int, window_ms: float, max_batch_size: int) -> None:
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from redis.asyncio import Redis
+
+    mongo = AsyncIOMotorClient(settings.mongo_uri, uuidRepresentation=settings.mongo_uuid_representation)
+    redis = Redis.from_url(settings.redis_uri)
+    collection = mongo[settings.mongo_db]["benchmark_notes"]
+    now = datetime.utcnow()
+    seeded = [Note(uuid4(), f"note {i}", "content " * 16, uuid4(), now, now) for i in range(notes)]
+    seeder = AsyncMongoNoteRepository(collection, AsyncRedisCacheRepository(redis, StructlogAdapter()), StructlogAdapter())
+    await seeder.ensure_indexes()
+    await collection.insert_many([seeder._to_document(note) for note in seeded])
+    note_ids = [note.id for note in seeded]
+    try:
+        for label, window in (("unbatched", None), (f"batched window={window_ms}ms", window_ms / 1000)):
+            result = await measure(collection, redis, note_ids, concurrency, requests, window, max_batch_size)
+            print(format_result(label, result))
+    finally:
+        await collection.drop()
+        await redis.delete(*(f"note:{note_id}" for note_id in note_ids))
+        await redis.aclose()
+        mongo.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="get_by_id batching benchmark")
+    parser.add_argument("--notes", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--window-ms", type=float, default=0.0)
+    parser.add_argument("--max-batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    asyncio.run(run(args.notes, args.concurrency, args.requests, args.window_ms, args.max_batch_size))
+
+
+if __name__ == "__main__":
+    main()
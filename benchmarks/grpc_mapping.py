@@ -0,0 +1,103 @@
+"""
+Микробенчмарк сборки gRPC-ответов из сущностей (без сети и MongoDB): ответ GetNote (1 заметка)
+и страница ListNotes (1000 заметок), время маппинга + SerializeToString и размер сообщения.
+
+Сравнивает путь "до" (валидируемый NoteResponseDTO -> промежуточный pydantic GrpcNoteResponseDTO
+со строками -> protobuf) с прямым маппингом сущностей в строковые поля и в NoteV2 (bytes UUID, Timestamp).
+
+    python benchmarks/grpc_mapping.py --rounds 200
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+os.environ.setdefault("PYTHONIOENCODING", "utf-8")
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from pydantic import BaseModel
+
+from application.dto.note import NoteResponseDTO
+from domain.models.entities.note import Note
+from domain.models.page import Page
+from infrastructure.adapters.inbound.grpc import note_pb2
+from infrastructure.adapters.inbound.grpc.mappers import note_to_proto, page_to_proto_list_response
+
+SIZES = (1, 1000)
+
+
+class _GrpcNoteResponseDTO(BaseModel):
+    # Промежуточный DTO прежнего пути
+    id: str
+    title: str
+    content: str
+    owner_id: str
+    created_at: str
+    updated_at: str
+
+
+def _notes(size: int) -> list[Note]:
+    owner_id = uuid4()
+    started = datetime(2024, 1, 1)
+    return [
+        Note(uuid4(), f"note {i}", "lorem ipsum dolor sit amet " * 8, owner_id,
+             started + timedelta(seconds=i, microseconds=i), started + timedelta(seconds=i, microseconds=i))
+        for i in range(size)
+    ]
+
+
+def _chained(note: Note) -> note_pb2.NoteResponse:
+    service_dto = NoteResponseDTO(
+        id=note.id, title=note.title, content=note.content, owner_id=note.owner_id,
+        created_at=note.created_at, updated_at=note.updated_at
+    )
+    grpc_dto = _GrpcNoteResponseDTO(
+        id=str(service_dto.id), title=service_dto.title, content=service_dto.content,
+        owner_id=str(service_dto.owner_id), created_at=service_dto.created_at.isoformat(),
+        updated_at=service_dto.updated_at.isoformat()
+    )
+    return note_pb2.NoteResponse(
+        id=grpc_dto.id, title=grpc_dto.title, content=grpc_dto.content, owner_id=grpc_dto.owner_id,
+        created_at=grpc_dto.created_at, updated_at=grpc_dto.updated_at
+    )
+
+
+def _build(notes: list[Note], variant: str) -> bytes:
+    if variant == "dto chain":
+        if len(notes) == 1:
+            return _chained(notes[0]).SerializeToString()
+        return note_pb2.ListNotesResponse(notes=[_chained(n) for n in notes], total=len(notes)).SerializeToString()
+    v2 = variant == "direct v2"
+    if len(notes) == 1:
+        return note_to_proto(notes[0], v2).SerializeToString()
+    return page_to_proto_list_response(Page(notes, len(notes)), v2).SerializeToString()
+
+
+def _measure(notes: list[Note], variant: str, rounds: int) -> tuple[float, int]:
+    size = len(_build(notes, variant))
+    started = time.perf_counter()
+    for _ in range(rounds):
+        _build(notes, variant)
+    return (time.perf_counter() - started) / rounds * 1_000_000, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="gRPC response mapping benchmark")
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    for size in SIZES:
+        notes = _notes(size)
+        # На одной заметке замер слишком короткий, повторяем его пропорционально больше
+        rounds = args.rounds * 100 if size == 1 else args.rounds
+        for variant in ("dto chain", "direct", "direct v2"):
+            micros, payload = _measure(notes, variant, rounds)
+            print(f"{size} note(s), {variant}: {micros:.1f} us per response, {payload} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Микробенчмарк декодирования страницы списка заметок (без сети и MongoDB).
+
+Сравнивает путь "до" (документ с _id, UUID через isinstance/as_uuid, повторная
+валидация response_model и jsonable_encoder в FastAPI, промежуточные gRPC DTO)
+с текущим путём: сырые BSON-батчи из find_raw_batches, проекция без _id,
+UUID(bytes=...) один раз, model_dump_json / прямая сборка protobuf.
+
+    python benchmarks/list_decoding.py --notes 1000 --rounds 50
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+os.environ.setdefault("PYTHONIOENCODING", "utf-8")
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+import bson
+from bson import Binary, ObjectId, UUID_SUBTYPE
+from bson.binary import UuidRepresentation
+from bson.codec_options import CodecOptions
+from fastapi.encoders import jsonable_encoder
+
+from application.dto.note import NoteListResponseDTO, NoteResponseDTO
+from domain.models.entities.note import Note
+from domain.models.page import Page
+from infrastructure.adapters.inbound.rest.dto.note import RestNoteListResponseDTO, RestNoteResponseDTO
+from infrastructure.adapters.inbound.rest.mappers import service_to_rest_list_response_dto
+from infrastructure.adapters.outbound.database.mongo.note_repository import AsyncMongoNoteRepository
+
+
+def _page(size: int, with_object_id: bool) -> bytes:
+    owner_id = uuid4()
+    started = datetime(2024, 1, 1)
+    docs = []
+    for i in range(size):
+        doc = {
+            "id": Binary(uuid4().bytes, UUID_SUBTYPE),
+            "title": f"note {i}",
+            "content": "lorem ipsum dolor sit amet " * 8,
+            "owner_id": Binary(owner_id.bytes, UUID_SUBTYPE),
+            "created_at": started + timedelta(seconds=i),
+            "updated_at": started + timedelta(seconds=i),
+        }
+        if with_object_id:
+            doc = {"_id": ObjectId(), **doc}
+        docs.append(bson.encode(doc))
+    return b"".join(docs)
+
+
+def _baseline(raw: bytes) -> bytes:
+    notes = []
+    # Клиент создаётся с uuidRepresentation=standard, поэтому драйвер отдаёт UUID
+    for doc in bson.decode_all(raw, CodecOptions(uuid_representation=UuidRepresentation.STANDARD)):
+        note_id = doc["id"] if isinstance(doc["id"], UUID) else UUID(bytes=doc["id"].as_uuid().bytes)
+        owner_id = doc["owner_id"] if isinstance(doc["owner_id"], UUID) else UUID(bytes=doc["owner_id"].as_uuid().bytes)
+        notes.append(Note(note_id, doc["title"], doc["content"], owner_id, doc["created_at"], doc["updated_at"]))
+    service_dto = NoteListResponseDTO(
+        notes=[
+            NoteResponseDTO(id=n.id, title=n.title, content=n.content, owner_id=n.owner_id,
+                            created_at=n.created_at, updated_at=n.updated_at)
+            for n in notes
+        ],
+        total=len(notes), skip=0, limit=len(notes)
+    )
+    rest_dto = RestNoteListResponseDTO(
+        notes=[
+            RestNoteResponseDTO(id=n.id, title=n.title, content=n.content, owner_id=n.owner_id,
+                                created_at=n.created_at, updated_at=n.updated_at)
+            for n in service_dto.notes
+        ],
+        total=service_dto.total, skip=service_dto.skip, limit=service_dto.limit
+    )
+    # FastAPI: валидация по response_model и jsonable_encoder перед json.dumps
+    validated = RestNoteListResponseDTO.model_validate(rest_dto.model_dump())
+    return json.dumps(jsonable_encoder(validated)).encode("utf-8")
+
+
+def _decode(raw: bytes) -> list[Note]:
+    return AsyncMongoNoteRepository._to_entities_raw(raw)
+
+
+def _fast_rest(raw: bytes) -> bytes:
+    notes = _decode(raw)
+    service_dto = NoteListResponseDTO(
+        notes=[NoteResponseDTO.from_entity(n) for n in notes], total=len(notes), skip=0, limit=len(notes)
+    )
+    return service_to_rest_list_response_dto(service_dto).model_dump_json().encode("utf-8")
+
+
+def _fast_grpc(raw: bytes) -> bytes:
+    from infrastructure.adapters.inbound.grpc.mappers import page_to_proto_list_response
+    notes = _decode(raw)
+    return page_to_proto_list_response(Page(notes, len(notes))).SerializeToString()
+
+
+def _measure(fn, raw: bytes, rounds: int) -> float:
+    fn(raw)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn(raw)
+    return (time.perf_counter() - started) / rounds * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="List page decoding benchmark")
+    parser.add_argument("--notes", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    cases = [("baseline rest", _baseline, _page(args.notes, with_object_id=True)),
+             ("fast rest", _fast_rest, _page(args.notes, with_object_id=False))]
+    try:
+        from infrastructure.adapters.inbound.grpc import note_pb2  # noqa: F401
+        cases.append(("fast grpc", _fast_grpc, _page(args.notes, with_object_id=False)))
+    except ImportError:
+        print("gRPC stubs are not generated, run `python generate_grpc.py` to include the gRPC case")
+
+    for label, fn, raw in cases:
+        print(f"{label}: {_measure(fn, raw, args.rounds):.2f} ms per {args.notes}-note page")
+
+
+if __name__ == "__main__":
+    main()
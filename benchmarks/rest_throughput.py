@@ -0,0 +1,96 @@
+"""
+Нагрузочный бенчмарк REST API: считает requests/sec и задержки.
+
+Запуск против поднятого сервиса (docker-compose up):
+
+    python benchmarks/rest_throughput.py --token "$(python app/infrastructure/adapters/outbound/security/generate_jwt.py)" \
+        --path /notes/ --concurrency 64 --duration 15
+
+Для сравнения "до/после" прогоните скрипт на двух ревизиях с одинаковыми
+параметрами и разными --label; с --output строки результатов дописываются в файл:
+
+    python benchmarks/rest_throughput.py --path /notes/<id> --label before --output bench_output.txt
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import aiohttp
+
+
+async def _worker(session: aiohttp.ClientSession, method: str, url: str, deadline: float,
+                  latencies: list[float], errors: list[int]) -> None:
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            async with session.request(method, url) as response:
+                await response.read()
+                if response.status >= 400:
+                    errors.append(response.status)
+                    continue
+        except aiohttp.ClientError:
+            errors.append(0)
+            continue
+        latencies.append(time.perf_counter() - started)
+
+
+async def run(base_url: str, path: str, method: str, token: str, concurrency: int, duration: float) -> dict:
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    latencies: list[float] = []
+    errors: list[int] = []
+    async with aiohttp.ClientSession(base_url=base_url, headers=headers, connector=connector) as session:
+        # Прогрев: соединения, кеши, ленивые инициализации
+        async with session.request(method, path) as response:
+            await response.read()
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*(
+            _worker(session, method, path, deadline, latencies, errors) for _ in range(concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    result = {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+    }
+    if latencies:
+        result.update(
+            p50_ms=statistics.median(latencies) * 1000,
+            p99_ms=latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        )
+    return result
+
+
+def format_result(label: str, result: dict) -> str:
+    line = f"{label}: {result['rps']:.1f} req/s, {result['requests']} ok, {result['errors']} errors"
+    if "p50_ms" in result:
+        line += f", p50={result['p50_ms']:.2f}ms, p99={result['p99_ms']:.2f}ms"
+    return line
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="REST throughput benchmark")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--path", default="/notes/")
+    parser.add_argument("--method", default="GET")
+    parser.add_argument("--token", default="")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--label", default="rest")
+    parser.add_argument("--output", default="", help="append the result line to this file")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.base_url, args.path, args.method, args.token, args.concurrency, args.duration))
+    line = format_result(args.label, result)
+    print(line)
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as output:
+            output.write(line + "\n")
+
+
+if __name__ == "__main__":
+    main()
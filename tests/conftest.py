@@ -0,0 +1,56 @@
+import os
+import sys
+
+os.environ.setdefault("PYTHONIOENCODING", "utf-8")
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret-key-test-secret-key-test")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+import pytest
+
+from application.services.note import AsyncNoteService
+from infrastructure.adapters.outbound.cache.ttl_policy import CacheTtlPolicy
+from infrastructure.adapters.outbound.database.mongo.note_repository import AsyncMongoNoteRepository
+from infrastructure.adapters.outbound.database.mongo.quota_repository import AsyncMongoQuotaRepository
+from fakes import FakeCache, FakeCollection, FakePublisher, NullLogger
+
+
+@pytest.fixture
+def notes():
+    return FakeCollection(unique="id")
+
+
+@pytest.fixture
+def counters():
+    return FakeCollection(unique="owner_id")
+
+
+@pytest.fixture
+def cache():
+    return FakeCache()
+
+
+@pytest.fixture
+def ttl_policy():
+    # Модули с другой политикой кеша переопределяют эту фикстуру
+    return CacheTtlPolicy()
+
+
+@pytest.fixture
+def repo(notes, cache, ttl_policy):
+    return AsyncMongoNoteRepository(notes, cache, NullLogger(), ttl_policy=ttl_policy)
+
+
+@pytest.fixture
+def quota(counters, notes):
+    return AsyncMongoQuotaRepository(counters, notes, NullLogger())
+
+
+@pytest.fixture
+def publisher():
+    return FakePublisher()
+
+
+@pytest.fixture
+def service(repo, quota, publisher):
+    return AsyncNoteService(repo, NullLogger(), publisher, quota)
@@ -0,0 +1,346 @@
+"""
+Коллекция Mongo и кеш в памяти для unit-тестов репозиториев и сервиса.
+Поддерживают только те запросы, которые делает код приложения: равенство, $in/$gte/$lte в фильтрах,
+$set/$inc в обновлениях, $group по полю в aggregate.
+before(method, hook) вызывает hook перед следующим вызовом метода - так тесты вклиниваются
+между запросами и воспроизводят гонки.
+
+Ниже - общие помощники тестов: заметки в коллекции и счётчики квот.
+"""
+import asyncio
+import copy
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID, uuid4
+
+from bson import Binary, UUID_SUBTYPE
+from pymongo import DeleteOne, InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from pymongo.results import BulkWriteResult, DeleteResult, InsertOneResult, UpdateResult
+
+from domain.models.entities.note import Note
+
+
+def _matches(doc: dict, query: dict) -> bool:
+    for field, condition in query.items():
+        value = doc.get(field)
+        if isinstance(condition, dict):
+            for op, operand in condition.items():
+                if op == "$in" and value not in operand:
+                    return False
+                if op == "$gte" and not (value is not None and value >= operand):
+                    return False
+                if op == "$lte" and not (value is not None and value <= operand):
+                    return False
+        elif value != condition:
+            return False
+    return True
+
+
+def _project(doc: dict, projection: Optional[dict]) -> dict:
+    if not projection:
+        return copy.deepcopy(doc)
+    included = [field for field, flag in projection.items() if flag and field != "_id"]
+    if included:
+        return {field: copy.deepcopy(doc[field]) for field in included if field in doc}
+    return {field: copy.deepcopy(value) for field, value in doc.items() if projection.get(field, 1)}
+
+
+class _Cursor:
+    def __init__(self, docs: List[dict]):
+        self._docs = docs
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self._docs:
+            yield doc
+
+
+class FakeCollection:
+    def __init__(self, unique: Optional[str] = None):
+        self.docs: List[dict] = []
+        self.unique = unique
+        self.calls: List[str] = []
+        self._hooks: Dict[str, List[Callable[[], Any]]] = {}
+
+    def before(self, method: str, hook: Callable[[], Any]) -> None:
+        self._hooks.setdefault(method, []).append(hook)
+
+    async def _enter(self, method: str) -> None:
+        self.calls.append(method)
+        for hook in self._hooks.pop(method, []):
+            result = hook()
+            if hasattr(result, "__await__"):
+                await result
+
+    def _insert(self, doc: dict) -> None:
+        if self.unique and any(existing.get(self.unique) == doc.get(self.unique) for existing in self.docs):
+            raise DuplicateKeyError(f"E11000 duplicate key error: {self.unique}")
+        self.docs.append(copy.deepcopy(doc))
+
+    def _update(self, query: dict, update: dict) -> Optional[dict]:
+        for doc in self.docs:
+            if _matches(doc, query):
+                doc.update(copy.deepcopy(update.get("$set", {})))
+                for field, amount in update.get("$inc", {}).items():
+                    doc[field] = doc.get(field, 0) + amount
+                return doc
+        return None
+
+    def _delete(self, query: dict) -> Optional[dict]:
+        for index, doc in enumerate(self.docs):
+            if _matches(doc, query):
+                return self.docs.pop(index)
+        return None
+
+    async def insert_one(self, doc: dict) -> InsertOneResult:
+        await self._enter("insert_one")
+        self._insert(doc)
+        return InsertOneResult(None, True)
+
+    def find(self, query: dict, projection: Optional[dict] = None, **kwargs) -> _Cursor:
+        self.calls.append("find")
+        # find в Motor синхронный, поэтому и hook здесь только синхронный
+        for hook in self._hooks.pop("find", []):
+            hook()
+        return _Cursor([_project(doc, projection) for doc in self.docs if _matches(doc, query)])
+
+    async def find_one(self, query: dict, projection: Optional[dict] = None, **kwargs) -> Optional[dict]:
+        await self._enter("find_one")
+        doc = next((doc for doc in self.docs if _matches(doc, query)), None)
+        return _project(doc, projection) if doc is not None else None
+
+    async def find_one_and_update(
+        self, query: dict, update: dict, projection: Optional[dict] = None, **kwargs
+    ) -> Optional[dict]:
+        await self._enter("find_one_and_update")
+        doc = self._update(query, update)
+        return _project(doc, projection) if doc is not None else None
+
+    async def find_one_and_delete(self, query: dict, projection: Optional[dict] = None, **kwargs) -> Optional[dict]:
+        await self._enter("find_one_and_delete")
+        doc = self._delete(query)
+        return _project(doc, projection) if doc is not None else None
+
+    async def update_one(self, query: dict, update: dict, **kwargs) -> UpdateResult:
+        await self._enter("update_one")
+        matched = self._update(query, update) is not None
+        return UpdateResult({"n": int(matched), "nModified": int(matched)}, True)
+
+    async def delete_one(self, query: dict, **kwargs) -> DeleteResult:
+        await self._enter("delete_one")
+        return DeleteResult({"n": int(self._delete(query) is not None)}, True)
+
+    async def count_documents(self, query: dict, **kwargs) -> int:
+        await self._enter("count_documents")
+        return sum(1 for doc in self.docs if _matches(doc, query))
+
+    def aggregate(self, pipeline: List[dict], **kwargs) -> _Cursor:
+        self.calls.append("aggregate")
+        field = pipeline[0]["$group"]["_id"].lstrip("$")
+        counts: Dict[Any, int] = {}
+        for doc in self.docs:
+            counts[doc[field]] = counts.get(doc[field], 0) + 1
+        return _Cursor([{"_id": key, "count": count} for key, count in counts.items()])
+
+    async def bulk_write(self, requests: list, ordered: bool = True, **kwargs) -> BulkWriteResult:
+        await self._enter("bulk_write")
+        result = {"nInserted": 0, "nMatched": 0, "nModified": 0, "nRemoved": 0, "nUpserted": 0, "upserted": []}
+        errors = []
+        for index, request in enumerate(requests):
+            try:
+                if isinstance(request, InsertOne):
+                    self._insert(request._doc)
+                    result["nInserted"] += 1
+                elif isinstance(request, UpdateOne):
+                    if self._update(request._filter, request._doc) is not None:
+                        result["nMatched"] += 1
+                        result["nModified"] += 1
+                elif isinstance(request, DeleteOne):
+                    if self._delete(request._filter) is not None:
+                        result["nRemoved"] += 1
+            except DuplicateKeyError as e:
+                errors.append({"index": index, "code": 11000, "errmsg": str(e)})
+                if ordered:
+                    break
+        if errors:
+            raise BulkWriteError({**result, "writeErrors": errors, "writeConcernErrors": []})
+        return BulkWriteResult(result, True)
+
+
+class FakeCache:
+    """CachePort в памяти без TTL: ttl запоминается, чтобы тесты могли его проверить."""
+
+    def __init__(self):
+        self.data: Dict[str, Any] = {}
+        self.ttls: Dict[str, Optional[float]] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.data.get(key)
+
+    async def get_with_ttl(self, key: str):
+        if key not in self.data:
+            return None, None
+        return self.data[key], self.ttls.get(key)
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        return {key: self.data[key] for key in keys if key in self.data}
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self.data[key] = value
+        self.ttls[key] = ttl
+
+    async def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+        self.ttls.pop(key, None)
+
+    async def write_many(self, entries: Dict[str, Any], ttl: Optional[int] = None, only_missing: bool = False) -> None:
+        for key, value in entries.items():
+            if value is None:
+                await self.delete(key)
+            elif not (only_missing and key in self.data):
+                await self.set(key, value, ttl)
+
+
+class FakeRedis:
+    """Redis в памяти для адаптеров кеша, с pub/sub; down=True - Redis недоступен, каждый вызов падает."""
+
+    def __init__(self):
+        self.data: Dict[str, bytes] = {}
+        self.down = False
+        self.calls: List[tuple] = []
+        self.subscribers: Dict[str, List[asyncio.Queue]] = {}
+
+    def _enter(self, *call: Any) -> None:
+        self.calls.append(call)
+        if self.down:
+            raise ConnectionError("redis unavailable")
+
+    async def get(self, key: str) -> Optional[bytes]:
+        self._enter("get", key)
+        return self.data.get(key)
+
+    async def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        self._enter("mget", *keys)
+        return [self.data.get(key) for key in keys]
+
+    async def setex(self, key: str, ttl: int, value: bytes) -> None:
+        self._enter("setex", key)
+        self.data[key] = value
+
+    async def delete(self, *keys: str) -> int:
+        self._enter("delete", *keys)
+        return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+    async def publish(self, channel: str, message: str) -> int:
+        self._enter("publish", channel)
+        for subscriber in self.subscribers.get(channel, []):
+            subscriber.put_nowait({"type": "message", "channel": channel, "data": message.encode()})
+        return len(self.subscribers.get(channel, []))
+
+    def pubsub(self) -> "_FakePubSub":
+        return _FakePubSub(self)
+
+    def disconnect(self) -> None:
+        # Обрыв соединения: listen() у всех подписчиков падает на следующем сообщении
+        for queues in self.subscribers.values():
+            for queue in queues:
+                queue.put_nowait(ConnectionError("connection lost"))
+
+
+class _FakePubSub:
+    def __init__(self, redis: FakeRedis):
+        self._redis = redis
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._channels: List[str] = []
+
+    async def __aenter__(self) -> "_FakePubSub":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        for channel in self._channels:
+            self._redis.subscribers[channel].remove(self._queue)
+
+    async def subscribe(self, channel: str) -> None:
+        self._redis._enter("subscribe", channel)
+        self._redis.subscribers.setdefault(channel, []).append(self._queue)
+        self._channels.append(channel)
+
+    async def listen(self):
+        while True:
+            message = await self._queue.get()
+            if isinstance(message, Exception):
+                raise message
+            yield message
+
+
+class FakeClock:
+    """Подменяет time.monotonic: тесты двигают время присваиванием now."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class NullLogger:
+    def bind(self, **kwargs) -> "NullLogger":
+        return self
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        return lambda *args, **kwargs: None
+
+
+class FakePublisher:
+    def __init__(self):
+        self.events: List[tuple] = []
+
+    async def publish(self, event_name: str, payload: dict) -> None:
+        self.events.append((event_name, payload))
+
+    async def publish_many(self, events: List[tuple]) -> None:
+        self.events.extend(events)
+
+
+# Пользователь, от имени которого действуют тесты
+USER = uuid4()
+
+
+def as_binary(value: UUID) -> Binary:
+    return Binary(value.bytes, UUID_SUBTYPE)
+
+
+def make_note(owner_id: UUID = USER) -> Note:
+    now = datetime(2024, 1, 1)
+    return Note(uuid4(), "title", "content", owner_id, now, now)
+
+
+def stored_note(repo: Any, owner_id: UUID = USER, counters: Optional[FakeCollection] = None) -> Note:
+    """Заметка прямо в коллекции репозитория; с counters - как после create, вместе с резервом квоты."""
+    note = make_note(owner_id)
+    repo.collection.docs.append(repo._to_document(note))
+    if counters is not None:
+        counter = next((doc for doc in counters.docs if doc["owner_id"] == as_binary(owner_id)), None)
+        if counter is None:
+            counters.docs.append({"owner_id": as_binary(owner_id), "count": 1})
+        else:
+            counter["count"] += 1
+    return note
+
+
+def removed_elsewhere(collection: FakeCollection, entity_id: UUID) -> Callable[[], None]:
+    """Hook для before(): заметку удаляет параллельный запрос."""
+    def remove():
+        collection.docs[:] = [doc for doc in collection.docs if doc["id"] != as_binary(entity_id)]
+    return remove
+
+
+def counter_value(counters: FakeCollection, owner_id: UUID = USER) -> int:
+    return next(doc["count"] for doc in counters.docs if doc["owner_id"] == as_binary(owner_id))
+
+
+def owned_count(collection: FakeCollection, owner_id: UUID = USER) -> int:
+    return sum(1 for doc in collection.docs if doc["owner_id"] == as_binary(owner_id))
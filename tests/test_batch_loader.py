@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from infrastructure.batch_loader import BatchLoader
+
+
+def _recording_loader(window: float = 0, max_batch_size: int = 100):
+    batches = []
+
+    async def load_many(keys):
+        batches.append(keys)
+        return {key: key.upper() for key in keys if key != "missing"}
+
+    return BatchLoader(load_many, window, max_batch_size), batches
+
+
+async def test_keys_of_one_loop_iteration_are_loaded_together():
+    loader, batches = _recording_loader()
+
+    results = await asyncio.gather(loader.load("a"), loader.load("b"), loader.load("a"), loader.load("missing"))
+
+    assert results == ["A", "B", "A", None]
+    assert batches == [["a", "b", "missing"]]
+
+
+async def test_full_batch_is_sent_before_window_ends():
+    loader, batches = _recording_loader(window=60, max_batch_size=2)
+
+    results = await asyncio.wait_for(asyncio.gather(loader.load("a"), loader.load("b")), timeout=1)
+
+    assert results == ["A", "B"]
+    assert batches == [["a", "b"]]
+
+
+async def test_load_error_reaches_every_waiter_of_the_batch():
+    async def load_many(keys):
+        raise ConnectionError("mongo down")
+
+    loader = BatchLoader(load_many, 0, 100)
+
+    results = await asyncio.gather(loader.load("a"), loader.load("b"), return_exceptions=True)
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+
+async def test_cancelled_waiter_does_not_cancel_batch_for_others():
+    loader, batches = _recording_loader()
+
+    first = asyncio.create_task(loader.load("a"))
+    second = asyncio.create_task(loader.load("a"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "A"
+    assert batches == [["a"]]
+    with pytest.raises(asyncio.CancelledError):
+        await first
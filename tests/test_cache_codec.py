@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from domain.models.entities.note import Note
+from infrastructure.adapters.outbound.cache.codec import BinaryCacheCodec, JsonCacheCodec
+from fakes import make_note
+
+codec = BinaryCacheCodec()
+
+
+def test_note_round_trip():
+    created_at = datetime(2024, 1, 1, 12, 30, 5, 123456)
+    note = Note(uuid4(), "заголовок", "текст\nс переводом", uuid4(), created_at, datetime(2024, 2, 1))
+
+    raw = codec.encode(note)
+
+    assert raw[0] == BinaryCacheCodec.NOTE_V1
+    assert codec.decode(raw) == note
+
+
+def test_aware_datetimes_are_stored_as_utc():
+    note = make_note()
+    moscow = timezone(timedelta(hours=3))
+    aware = Note(note.id, note.title, note.content, note.owner_id,
+                 datetime(2024, 1, 1, 15, tzinfo=moscow), datetime(2024, 1, 1, 15, tzinfo=moscow))
+
+    assert codec.decode(codec.encode(aware)).created_at == datetime(2024, 1, 1, 12)
+
+
+@pytest.mark.parametrize("value", [{"id": uuid4(), "created_at": datetime(2024, 1, 1), "count": 3}, [1, "two"], "gen"])
+def test_json_round_trip(value):
+    raw = codec.encode(value)
+
+    assert raw[0] == BinaryCacheCodec.JSON_V1
+    assert codec.decode(raw) == value
+
+
+def test_bytes_round_trip():
+    raw = codec.encode(b"\x00\x01raw")
+
+    assert raw[0] == BinaryCacheCodec.RAW_V1
+    assert codec.decode(raw) == b"\x00\x01raw"
+
+
+@pytest.mark.parametrize("value", [
+    {"id": uuid4(), "owner_id": uuid4(), "title": "t", "updated_at": datetime(2024, 1, 1)},
+    b"legacy bytes",
+    "__note_tombstone__",
+])
+def test_legacy_json_entries_are_read(value):
+    assert codec.decode(JsonCacheCodec().encode(value)) == value
+
+
+@pytest.mark.parametrize("raw", [b"", b"\x01short", b"\x07payload"])
+def test_damaged_entries_raise_value_error(raw):
+    with pytest.raises(ValueError):
+        codec.decode(raw)
@@ -0,0 +1,102 @@
+import pytest
+
+from infrastructure import circuit_breaker
+from infrastructure.adapters.outbound.cache.redis_adapter import AsyncRedisCacheRepository
+from infrastructure.circuit_breaker import CircuitBreaker
+from fakes import FakeClock, FakeRedis, NullLogger
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker("test", failure_threshold=2, reset_timeout=5)
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def redis_cache(redis, breaker):
+    return AsyncRedisCacheRepository(redis, NullLogger(), breaker=breaker, timeout=1)
+
+
+def test_breaker_opens_after_consecutive_failures(breaker):
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+def test_breaker_lets_one_probe_through_after_reset_timeout(breaker, clock):
+    breaker.record_failure()
+    breaker.record_failure()
+
+    clock.now += 5
+    assert breaker.allow() and breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+
+    assert breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow()
+
+
+def test_failed_probe_opens_breaker_again(breaker, clock):
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now += 5
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now += 4.9
+    assert not breaker.allow()
+
+
+async def test_open_breaker_turns_reads_into_misses_without_calling_redis(redis_cache, redis):
+    redis.down = True
+    await redis_cache.get("a")
+    await redis_cache.get("b")
+    redis.calls.clear()
+
+    assert await redis_cache.get("c") is None
+    assert redis.calls == []
+
+
+async def test_invalidations_missed_during_outage_are_replayed_before_next_call(redis_cache, redis, clock):
+    await redis_cache.set("note:1", "old", ttl=60)
+    redis.down = True
+    await redis_cache.delete("note:1")
+    await redis_cache.set("note:2", "new", ttl=60)
+    assert redis_cache.breaker.state == CircuitBreaker.OPEN
+
+    redis.down = False
+    clock.now += 5
+    redis.calls.clear()
+
+    assert await redis_cache.get("note:1") is None
+    assert redis.calls[0][0] == "delete" and set(redis.calls[0][1:]) == {"note:1", "note:2"}
+    assert redis_cache.breaker.state == CircuitBreaker.CLOSED
+    assert redis_cache._pending == set()
+
+
+async def test_failed_replay_keeps_pending_invalidations(redis_cache, redis, clock):
+    await redis_cache.set("note:1", "old", ttl=60)
+    redis.down = True
+    await redis_cache.delete("note:1")
+    await redis_cache.delete("note:1")
+
+    clock.now += 5
+    assert await redis_cache.get("note:1") is None
+    assert redis_cache._pending == {"note:1"}
+    assert redis.data["note:1"]
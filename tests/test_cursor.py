@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from domain.exceptions import ValidationException
+from infrastructure.adapters.outbound.database.mongo.note_repository import decode_cursor, encode_cursor
+
+
+def test_round_trip_keeps_id_and_millisecond_time():
+    created_at = datetime(2024, 5, 17, 10, 30, 15, 123000)
+    entity_id = uuid4()
+
+    assert decode_cursor(encode_cursor(created_at, entity_id)) == (created_at, entity_id)
+
+
+def test_microseconds_are_truncated_like_bson():
+    entity_id = uuid4()
+
+    decoded_at, _ = decode_cursor(encode_cursor(datetime(2024, 5, 17, 10, 30, 15, 123456), entity_id))
+
+    assert decoded_at == datetime(2024, 5, 17, 10, 30, 15, 123000)
+
+
+def test_aware_datetime_is_encoded_as_naive_utc():
+    entity_id = uuid4()
+    created_at = datetime(2024, 5, 17, 10, 30, 15, tzinfo=timezone.utc)
+
+    assert decode_cursor(encode_cursor(created_at, entity_id))[0] == created_at.replace(tzinfo=None)
+
+
+def test_pre_epoch_time_round_trips():
+    entity_id = uuid4()
+    created_at = datetime(1969, 12, 31, 23, 59, 59, 1000)
+
+    assert decode_cursor(encode_cursor(created_at, entity_id)) == (created_at, entity_id)
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor(datetime(2024, 1, 1), uuid4())
+
+    assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "AAAA", "!!!!", encode_cursor(datetime(2024, 1, 1), uuid4())[:-2]])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValidationException):
+        decode_cursor(cursor)
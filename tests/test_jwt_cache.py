@@ -0,0 +1,75 @@
+import hashlib
+import time
+from uuid import uuid4
+
+import pytest
+from jose import jwt
+
+from domain.exceptions import AuthenticationError
+from infrastructure.adapters.outbound.cache import memory_cache
+from infrastructure.adapters.outbound.cache.memory_cache import MemoryLRUCache
+from infrastructure.adapters.outbound.security.jwt_adapter import JWTAuthAdapter
+from infrastructure.config import settings
+from fakes import FakeClock, NullLogger
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(memory_cache.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def token_cache(clock):
+    return MemoryLRUCache(max_bytes=64 * 1024, ttl=300)
+
+
+@pytest.fixture
+def auth(token_cache):
+    return JWTAuthAdapter(NullLogger(), token_cache)
+
+
+def _token(expires_in: float, user_id=None) -> str:
+    claims = {"sub": str(user_id or uuid4()), "role": "user", "exp": int(time.time() + expires_in)}
+    return jwt.encode(claims, settings.jwt_secret_key, algorithm="HS256")
+
+
+def _key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def test_verified_token_is_served_from_cache(auth, token_cache):
+    user_id = uuid4()
+    token = _token(60, user_id)
+
+    assert auth.verify_token(token) == (user_id, "user")
+    assert auth.verify_token(token) == (user_id, "user")
+    assert token_cache.hits == 1 and len(token_cache) == 1
+
+
+def test_cached_identity_does_not_outlive_token_exp(auth, token_cache, clock):
+    token = _token(10)
+    auth.verify_token(token)
+
+    clock.now += 9
+    assert token_cache.get(_key(token)) is not None
+    clock.now += 2
+    assert token_cache.get(_key(token)) is None
+
+
+def test_cache_ttl_caps_long_lived_tokens(auth, token_cache, clock):
+    token = _token(3600)
+    auth.verify_token(token)
+
+    clock.now += 301
+    assert token_cache.get(_key(token)) is None
+
+
+def test_expired_and_invalid_tokens_are_rejected_and_not_cached(auth, token_cache):
+    with pytest.raises(AuthenticationError):
+        auth.verify_token(_token(-10))
+    with pytest.raises(AuthenticationError):
+        auth.verify_token("not-a-token")
+
+    assert len(token_cache) == 0
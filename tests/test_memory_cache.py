@@ -0,0 +1,71 @@
+import pytest
+
+from infrastructure.adapters.outbound.cache import memory_cache
+from infrastructure.adapters.outbound.cache.memory_cache import MemoryLRUCache, approximate_size
+from fakes import FakeClock
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(memory_cache.time, "monotonic", clock)
+    return clock
+
+
+def _entry_size(key: str, value) -> int:
+    return approximate_size(value) + len(key) + memory_cache._ENTRY_OVERHEAD
+
+
+def test_least_recently_used_entry_is_evicted_when_size_is_exceeded(clock):
+    cache = MemoryLRUCache(max_bytes=3 * _entry_size("a", "x" * 100), ttl=60)
+    for key in "abc":
+        cache.put(key, "x" * 100)
+    cache.get("a")
+
+    cache.put("d", "x" * 100)
+
+    assert cache.get("b") is None
+    assert [cache.get(key) is not None for key in "acd"] == [True, True, True]
+    assert cache.evictions == 1
+    assert cache.size == 3 * _entry_size("a", "x" * 100)
+
+
+def test_overwrite_and_discard_keep_size_accounting(clock):
+    cache = MemoryLRUCache(max_bytes=10_000, ttl=60)
+    cache.put("a", "x" * 100)
+    cache.put("a", "x" * 10)
+    assert cache.size == _entry_size("a", "x" * 10)
+
+    cache.discard("a")
+    assert cache.size == 0 and len(cache) == 0
+
+
+def test_value_larger_than_cache_is_not_stored(clock):
+    cache = MemoryLRUCache(max_bytes=500, ttl=60)
+    cache.put("small", "x")
+
+    cache.put("big", "x" * 1000)
+
+    assert cache.get("big") is None and cache.get("small") == "x"
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = MemoryLRUCache(max_bytes=10_000, ttl=60)
+    cache.put("a", "value")
+
+    clock.now += 59.9
+    assert cache.get("a") == "value"
+    clock.now += 0.1
+    assert cache.get("a") is None
+    assert cache.size == 0 and cache.misses == 1
+
+
+def test_entry_ttl_is_capped_by_cache_ttl(clock):
+    cache = MemoryLRUCache(max_bytes=10_000, ttl=60)
+    cache.put("short", "value", ttl=5)
+    cache.put("long", "value", ttl=600)
+
+    clock.now += 5
+    assert cache.get("short") is None
+    clock.now += 55
+    assert cache.get("long") is None
@@ -0,0 +1,33 @@
+from uuid import uuid4
+
+from application.dto.note import NoteBatchGetDTO
+from fakes import USER, stored_note
+
+
+async def test_user_gets_only_own_notes(service, repo):
+    own, foreign, missing = stored_note(repo).id, stored_note(repo, owner_id=uuid4()).id, uuid4()
+
+    response = await service.batch_get(NoteBatchGetDTO(entity_ids=[own, foreign, missing]), USER, "user", "req")
+
+    assert (response.succeeded, response.failed) == (1, 2)
+    assert response.results[0].note.id == own
+    assert response.results[1].note is None and "denied" in response.results[1].error
+    assert response.results[2].note is None and "not found" in response.results[2].error
+
+
+async def test_admin_gets_notes_of_any_owner(service, repo):
+    foreign = stored_note(repo, owner_id=uuid4()).id
+
+    response = await service.batch_get(NoteBatchGetDTO(entity_ids=[foreign]), USER, "admin", "req")
+
+    assert response.succeeded == 1 and response.results[0].note.id == foreign
+
+
+async def test_results_keep_request_order_and_repeated_ids(service, repo, notes):
+    first, second = stored_note(repo).id, stored_note(repo).id
+
+    response = await service.batch_get(NoteBatchGetDTO(entity_ids=[second, first, second]), USER, "user", "req")
+
+    assert [item.index for item in response.results] == [0, 1, 2]
+    assert [item.note.id for item in response.results] == [second, first, second]
+    assert notes.calls.count("find") == 1
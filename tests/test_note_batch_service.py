@@ -0,0 +1,96 @@
+from uuid import UUID, uuid4
+
+import pytest
+
+from application.dto.note import NoteBatchDTO, NoteBatchOperationDTO
+from domain.exceptions import DatabaseException
+from domain.models.enums.bulk import BulkAction
+from infrastructure.config import settings
+from fakes import USER, counter_value, owned_count, stored_note
+
+
+@pytest.fixture(autouse=True)
+def quota_limit(monkeypatch):
+    monkeypatch.setattr(settings, "max_docs_per_user", 5)
+
+
+def _batch(*operations: dict, ordered: bool = False) -> NoteBatchDTO:
+    return NoteBatchDTO(operations=[NoteBatchOperationDTO(**op) for op in operations], ordered=ordered)
+
+
+def _create() -> dict:
+    return {"op": BulkAction.CREATE, "title": "t", "content": "c"}
+
+
+def _delete(entity_id: UUID) -> dict:
+    return {"op": BulkAction.DELETE, "entity_id": entity_id}
+
+
+async def test_creates_and_deletes_move_counter_with_documents(service, repo, notes, counters):
+    deleted = stored_note(repo, counters=counters).id
+
+    response = await service.batch(_batch(_create(), _create(), _delete(deleted)), USER, "user", "req")
+
+    assert response.succeeded == 3
+    assert counter_value(counters) == owned_count(notes) == 2
+
+
+async def test_repeated_delete_releases_quota_once(service, repo, notes, counters):
+    stored_note(repo, counters=counters)
+    deleted = stored_note(repo, counters=counters).id
+
+    response = await service.batch(_batch(_delete(deleted), _delete(deleted)), USER, "user", "req")
+
+    assert (response.succeeded, response.failed) == (1, 1)
+    assert counter_value(counters) == owned_count(notes) == 1
+
+
+async def test_concurrent_delete_releases_quota_once(service, repo, notes, counters, quota):
+    stored_note(repo, counters=counters)
+    deleted = stored_note(repo, counters=counters).id
+
+    async def delete_elsewhere():
+        # Одиночный DELETE того же id выполняется между проверкой владельца и записью пакета
+        assert await repo.delete_owned(deleted, USER, "other") is not None
+        await quota.release(USER, "other")
+
+    notes.before("find_one_and_delete", delete_elsewhere)
+
+    response = await service.batch(_batch(_delete(deleted)), USER, "user", "req")
+
+    assert response.failed == 1 and "not found" in response.results[0].error
+    assert counter_value(counters) == owned_count(notes) == 1
+
+
+async def test_creates_over_quota_are_rejected_together(service, repo, notes, counters):
+    for _ in range(4):
+        stored_note(repo, counters=counters)
+
+    response = await service.batch(_batch(_create(), _create()), USER, "user", "req")
+
+    assert response.failed == 2
+    assert counter_value(counters) == owned_count(notes) == 4
+
+
+async def test_skipped_creates_in_ordered_batch_release_their_reservation(service, repo, notes, counters):
+    stored_note(repo, counters=counters)
+
+    response = await service.batch(_batch(_delete(uuid4()), _create(), _create(), ordered=True), USER, "user", "req")
+
+    assert [item.error is None for item in response.results] == [False, False, False]
+    assert "Skipped" in response.results[1].error
+    assert counter_value(counters) == owned_count(notes) == 1
+
+
+async def test_failed_bulk_write_releases_reserved_creates(service, repo, notes, counters, monkeypatch):
+    stored_note(repo, counters=counters)
+
+    async def bulk_write(*args, **kwargs):
+        raise DatabaseException("bulk write failed")
+
+    monkeypatch.setattr(repo, "bulk_write", bulk_write)
+
+    with pytest.raises(DatabaseException):
+        await service.batch(_batch(_create(), _create()), USER, "user", "req")
+
+    assert counter_value(counters) == owned_count(notes) == 1
@@ -0,0 +1,130 @@
+from uuid import UUID, uuid4
+
+from domain.exceptions import (
+    AccessDeniedError, DatabaseException, NotFoundError, OperationSkippedError, ValidationException
+)
+from domain.models.bulk import BulkOperation
+from domain.models.entities.note import Note
+from domain.models.enums.bulk import BulkAction
+from fakes import USER, as_binary, make_note, removed_elsewhere, stored_note
+
+
+def _create(note: Note) -> BulkOperation[Note]:
+    return BulkOperation(BulkAction.CREATE, entity=note)
+
+
+def _update(entity_id: UUID, owner_id: UUID = USER) -> BulkOperation[Note]:
+    return BulkOperation(BulkAction.UPDATE, entity_id=entity_id, changes={"title": "new"}, owner_id=owner_id)
+
+
+def _delete(entity_id: UUID, owner_id: UUID = USER) -> BulkOperation[Note]:
+    return BulkOperation(BulkAction.DELETE, entity_id=entity_id, owner_id=owner_id)
+
+
+async def test_delete_of_note_removed_after_owner_check_is_not_found(repo, notes):
+    note = stored_note(repo)
+    notes.before("find_one_and_delete", removed_elsewhere(notes, note.id))
+
+    [result] = await repo.bulk_write([_delete(note.id)], ordered=False, request_id="req")
+
+    assert isinstance(result.error, NotFoundError)
+
+
+async def test_update_of_note_removed_after_owner_check_is_not_found(repo, notes):
+    note = stored_note(repo)
+    notes.before("bulk_write", removed_elsewhere(notes, note.id))
+
+    [result] = await repo.bulk_write([_update(note.id)], ordered=False, request_id="req")
+
+    assert isinstance(result.error, NotFoundError)
+    assert result.entity is None
+
+
+async def test_repeated_id_is_rejected_and_deleted_once(repo, notes):
+    note = stored_note(repo)
+
+    first, second = await repo.bulk_write([_delete(note.id), _delete(note.id)], ordered=False, request_id="req")
+
+    assert first.ok and first.owner_id == USER
+    assert isinstance(second.error, ValidationException)
+    assert notes.calls.count("find_one_and_delete") == 1
+    assert notes.docs == []
+
+
+async def test_unordered_batch_reports_each_item(repo, notes):
+    kept, foreign = stored_note(repo), stored_note(repo, owner_id=uuid4())
+    created = make_note()
+
+    results = await repo.bulk_write(
+        [_delete(uuid4()), _update(kept.id), _delete(foreign.id), _create(created)], ordered=False, request_id="req"
+    )
+
+    assert isinstance(results[0].error, NotFoundError)
+    assert results[1].ok and results[1].entity.title == "new"
+    assert isinstance(results[2].error, AccessDeniedError)
+    assert results[3].ok
+    assert len(notes.docs) == 3
+
+
+async def test_ordered_batch_skips_everything_after_first_failure(repo, notes):
+    first, third = make_note(), make_note()
+
+    results = await repo.bulk_write(
+        [_create(first), _delete(uuid4()), _create(third)], ordered=True, request_id="req"
+    )
+
+    assert results[0].ok
+    assert isinstance(results[1].error, NotFoundError)
+    assert isinstance(results[2].error, OperationSkippedError)
+    assert [doc["id"] for doc in notes.docs] == [as_binary(first.id)]
+
+
+async def test_ordered_batch_stops_at_write_error(repo, notes):
+    existing = stored_note(repo)
+    deleted, updated = stored_note(repo), stored_note(repo)
+
+    results = await repo.bulk_write(
+        [_delete(deleted.id), _create(existing), _update(updated.id)], ordered=True, request_id="req"
+    )
+
+    assert results[0].ok
+    assert isinstance(results[1].error, DatabaseException)
+    assert isinstance(results[2].error, OperationSkippedError)
+    assert next(doc for doc in notes.docs if doc["id"] == as_binary(updated.id))["title"] == "title"
+
+
+async def test_ordered_deletes_stop_at_late_not_found(repo, notes):
+    gone, kept = stored_note(repo), stored_note(repo)
+    notes.before("find_one_and_delete", removed_elsewhere(notes, gone.id))
+
+    results = await repo.bulk_write([_delete(gone.id), _delete(kept.id)], ordered=True, request_id="req")
+
+    assert isinstance(results[0].error, NotFoundError)
+    assert isinstance(results[1].error, OperationSkippedError)
+    assert [doc["id"] for doc in notes.docs] == [as_binary(kept.id)]
+
+
+async def test_ordered_update_after_failed_delete_is_not_written(repo, notes):
+    gone, updated = stored_note(repo), stored_note(repo)
+    notes.before("find_one_and_delete", removed_elsewhere(notes, gone.id))
+
+    results = await repo.bulk_write([_delete(gone.id), _update(updated.id)], ordered=True, request_id="req")
+
+    assert isinstance(results[0].error, NotFoundError)
+    assert isinstance(results[1].error, OperationSkippedError)
+    assert "bulk_write" not in notes.calls
+    assert notes.docs[0]["title"] == "title"
+
+
+async def test_ordered_batch_runs_operations_in_request_order(repo, notes):
+    updated, first, second = stored_note(repo), stored_note(repo), stored_note(repo)
+    created = make_note()
+
+    results = await repo.bulk_write(
+        [_update(updated.id), _delete(first.id), _create(created), _delete(second.id)], ordered=True, request_id="req"
+    )
+
+    assert all(result.ok for result in results)
+    assert results[0].entity.title == "new"
+    assert notes.calls == ["find", "bulk_write", "find", "find_one_and_delete", "bulk_write", "find_one_and_delete"]
+    assert [doc["id"] for doc in notes.docs] == [as_binary(updated.id), as_binary(created.id)]
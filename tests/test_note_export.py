@@ -0,0 +1,74 @@
+import json
+
+import grpc
+import httpx
+from dishka import Provider, Scope, make_async_container
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import FastAPI
+
+from application.services.note import AsyncNoteService
+from domain.exceptions import DatabaseException
+from domain.ports.outbound.logger.logger_port import LoggerPort
+from infrastructure.adapters.inbound.grpc import note_pb2, note_pb2_grpc
+from infrastructure.adapters.inbound.grpc.note_service import NoteServiceServicer
+from infrastructure.adapters.inbound.rest.auth import get_current_user
+from infrastructure.adapters.inbound.rest.note_router import router
+from fakes import USER, NullLogger, make_note
+
+
+def _break_after_first_batch(service: AsyncNoteService, monkeypatch) -> None:
+    async def export_notes(*args, **kwargs):
+        yield [make_note()]
+        raise DatabaseException("cursor lost")
+
+    monkeypatch.setattr(service, "export_notes", export_notes)
+
+
+class _Auth:
+    def verify_token(self, token: str):
+        return USER, "user"
+
+
+async def test_rest_export_ends_interrupted_stream_with_error_line(service, monkeypatch):
+    _break_after_first_batch(service, monkeypatch)
+
+    provider = Provider(scope=Scope.APP)
+    provider.provide(lambda: service, provides=AsyncNoteService)
+    provider.provide(lambda: NullLogger(), provides=LoggerPort)
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_current_user] = lambda: (USER, "user")
+    setup_dishka(make_async_container(provider), app)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/notes/export")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert response.status_code == 200
+    assert len(lines) == 2 and "id" in lines[0]
+    assert lines[-1]["error"] == "Internal server error" and lines[-1]["request_id"]
+
+
+async def test_grpc_export_aborts_interrupted_stream_with_status(service, monkeypatch):
+    _break_after_first_batch(service, monkeypatch)
+
+    server = grpc.aio.server()
+    note_pb2_grpc.add_NoteServiceServicer_to_server(NoteServiceServicer(service, NullLogger(), _Auth()), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    received = []
+    try:
+        async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+            stream = note_pb2_grpc.NoteServiceStub(channel).ExportNotes(
+                note_pb2.ExportNotesRequest(), metadata=[("authorization", "Bearer token")]
+            )
+            try:
+                async for note in stream:
+                    received.append(note)
+            except grpc.aio.AioRpcError as e:
+                code = e.code()
+    finally:
+        await server.stop(None)
+
+    assert len(received) == 1
+    assert code == grpc.StatusCode.INTERNAL
@@ -0,0 +1,54 @@
+from uuid import uuid4
+
+import pytest
+
+from infrastructure.adapters.outbound.cache.ttl_policy import CacheTtlPolicy
+from infrastructure.adapters.outbound.database.mongo.note_repository import NOTE_TOMBSTONE
+from fakes import make_note
+
+
+@pytest.fixture
+def ttl_policy():
+    return CacheTtlPolicy(negative_ttl=30)
+
+
+async def test_miss_writes_tombstone(repo, cache):
+    entity_id = uuid4()
+
+    assert await repo.get_by_id(entity_id, "req") is None
+    assert cache.data[f"note:{entity_id}"] == NOTE_TOMBSTONE
+    assert cache.ttls[f"note:{entity_id}"] == 30
+
+
+async def test_miss_does_not_overwrite_note_cached_by_concurrent_create(repo, notes, cache):
+    note = make_note()
+
+    def create_elsewhere():
+        # create на другом экземпляре кладёт заметку в кеш, пока это чтение идёт в базу
+        cache.data[f"note:{note.id}"] = note
+
+    notes.before("find_one", create_elsewhere)
+
+    assert await repo.get_by_id(note.id, "req") is None
+    assert cache.data[f"note:{note.id}"] == note
+    assert await repo.get_by_id(note.id, "req") == note
+
+
+async def test_get_many_miss_does_not_overwrite_note_cached_by_concurrent_create(repo, notes, cache):
+    note, missing = make_note(), uuid4()
+
+    def create_elsewhere():
+        cache.data[f"note:{note.id}"] = note
+
+    notes.before("find", create_elsewhere)
+
+    assert await repo.get_many([note.id, missing], "req") == {}
+    assert cache.data[f"note:{note.id}"] == note
+    assert cache.data[f"note:{missing}"] == NOTE_TOMBSTONE
+
+
+async def test_delete_replaces_cached_note_with_tombstone(repo, cache):
+    note = await repo.create(make_note(), "req")
+
+    assert await repo.delete_owned(note.id, note.owner_id, "req") is not None
+    assert cache.data[f"note:{note.id}"] == NOTE_TOMBSTONE
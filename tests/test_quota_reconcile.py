@@ -0,0 +1,66 @@
+from uuid import uuid4
+
+from fakes import counter_value, stored_note
+
+
+async def test_drifted_counter_is_reset_to_actual_count(quota, repo, counters):
+    owner = uuid4()
+    stored_note(repo, owner, counters)
+    stored_note(repo, owner, counters)
+    counters.docs[0]["count"] = 5
+
+    assert await quota.reconcile("req") == 1
+    assert counter_value(counters, owner) == 2
+
+
+async def test_consistent_counters_are_not_written(quota, repo, counters):
+    owner = uuid4()
+    for _ in range(3):
+        stored_note(repo, owner, counters)
+
+    assert await quota.reconcile("req") == 0
+    assert "update_one" not in counters.calls
+
+
+async def test_create_between_aggregate_and_counter_read_is_not_rolled_back(quota, repo, notes, counters):
+    owner = uuid4()
+    stored_note(repo, owner, counters)
+    stored_note(repo, owner, counters)
+    aggregate = notes.aggregate
+
+    def aggregate_then_create(pipeline, **kwargs):
+        cursor = aggregate(pipeline, **kwargs)
+        # reserve + insert завершаются после снимка aggregate, но до чтения счётчиков
+        stored_note(repo, owner, counters)
+        return cursor
+
+    notes.aggregate = aggregate_then_create
+
+    assert await quota.reconcile("req") == 0
+    assert counter_value(counters, owner) == 3
+
+
+async def test_reservation_before_conditional_set_wins(quota, repo, counters):
+    owner = uuid4()
+    stored_note(repo, owner, counters)
+    counters.docs[0]["count"] = 4
+
+    def reserve():
+        counters.docs[0]["count"] += 1
+
+    counters.before("update_one", reserve)
+
+    assert await quota.reconcile("req") == 0
+    assert counter_value(counters, owner) == 5
+
+
+async def test_owner_without_counter_is_left_for_reserve_to_seed(quota, repo, counters):
+    owner = uuid4()
+    stored_note(repo, owner)
+    stored_note(repo, owner)
+
+    assert await quota.reconcile("req") == 0
+    assert counters.docs == []
+
+    assert await quota.reserve(owner_id=owner, limit=10, request_id="req")
+    assert counter_value(counters, owner) == 3
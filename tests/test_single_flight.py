@@ -0,0 +1,80 @@
+import asyncio
+
+from infrastructure.single_flight import SingleFlight
+
+
+async def test_concurrent_calls_join_in_flight_load():
+    shared = []
+    flight = SingleFlight(on_shared=lambda: shared.append(1))
+    release, calls = asyncio.Event(), []
+
+    async def load():
+        calls.append(1)
+        await release.wait()
+        return "note"
+
+    first = asyncio.create_task(flight.do("key", load))
+    second = asyncio.create_task(flight.do("key", load))
+    await asyncio.sleep(0)
+    assert "key" in flight
+    release.set()
+
+    assert await asyncio.gather(first, second) == ["note", "note"]
+    assert len(calls) == 1 and len(shared) == 1
+    assert "key" not in flight
+
+
+async def test_cancelled_waiter_does_not_cancel_load_for_others():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def load():
+        await release.wait()
+        return "note"
+
+    first = asyncio.create_task(flight.do("key", load))
+    second = asyncio.create_task(flight.do("key", load))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == "note"
+    assert first.cancelled()
+
+
+async def test_load_error_reaches_every_waiter_and_is_not_cached():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def load():
+        await release.wait()
+        raise ValueError("boom")
+
+    waiters = [asyncio.create_task(flight.do("key", load)) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+
+    for result in await asyncio.gather(*waiters, return_exceptions=True):
+        assert isinstance(result, ValueError)
+    assert len(flight) == 0
+
+    async def retry():
+        return "note"
+
+    assert await flight.do("key", retry) == "note"
+
+
+async def test_spawn_returns_running_load_for_same_key():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def load():
+        await release.wait()
+        return "note"
+
+    task = flight.spawn("key", load)
+    assert flight.spawn("key", load) is task
+    release.set()
+    assert await flight.do("other", load) == "note"
+    assert await task == "note"
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from infrastructure.adapters.outbound.cache.memory_cache import MemoryLRUCache
+from infrastructure.adapters.outbound.cache.tiered_cache import TieredCacheRepository
+from fakes import FakeCache, FakeRedis, NullLogger
+
+CHANNEL = "cache:invalidate"
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+async def replicas(redis, cache):
+    # Две реплики приложения над общим L2 и общим каналом инвалидаций
+    tiered = [
+        TieredCacheRepository(cache, redis, MemoryLRUCache(max_bytes=64 * 1024, ttl=60), CHANNEL, NullLogger())
+        for _ in range(2)
+    ]
+    listeners = [asyncio.create_task(replica.listen_invalidations(retry_delay=0)) for replica in tiered]
+    await _subscribed(*tiered)
+    yield tiered
+    for listener in listeners:
+        listener.cancel()
+    await asyncio.gather(*listeners, return_exceptions=True)
+
+
+async def _subscribed(*replicas: TieredCacheRepository) -> None:
+    while not all(replica.l1_active for replica in replicas):
+        await asyncio.sleep(0)
+
+
+async def _delivered() -> None:
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+async def test_l1_is_not_used_before_subscription(redis, cache):
+    tiered = TieredCacheRepository(cache, redis, MemoryLRUCache(max_bytes=64 * 1024, ttl=60), CHANNEL, NullLogger())
+    await cache.set("note:1", "v1")
+
+    assert await tiered.get("note:1") == "v1"
+    assert len(tiered.l1) == 0
+
+
+async def test_write_on_one_replica_invalidates_l1_of_the_other(replicas, cache):
+    writer, reader = replicas
+    await cache.set("note:1", "v1")
+    assert await reader.get("note:1") == "v1"
+    assert reader.l1.get("note:1") == "v1"
+
+    await writer.set("note:1", "v2", ttl=60)
+    await _delivered()
+
+    assert reader.l1.get("note:1") is None
+    assert await reader.get("note:1") == "v2"
+
+
+async def test_only_missing_write_does_not_invalidate_cached_values(replicas, cache, redis):
+    writer, reader = replicas
+    await cache.set("note:1", "v1")
+    await reader.get("note:1")
+    redis.calls.clear()
+
+    await writer.write_many({"note:1": "tombstone"}, ttl=30, only_missing=True)
+    await _delivered()
+
+    assert reader.l1.get("note:1") == "v1"
+    assert not any(call[0] == "publish" for call in redis.calls)
+
+
+async def test_lost_subscription_disables_and_clears_l1_until_resubscribed(replicas, cache, redis):
+    _, reader = replicas
+    await cache.set("note:1", "v1")
+    await reader.get("note:1")
+
+    redis.disconnect()
+    while reader.l1_active:
+        await asyncio.sleep(0)
+    assert len(reader.l1) == 0
+
+    await _subscribed(reader)
+    assert await reader.get("note:1") == "v1"
+    assert reader.l1.get("note:1") == "v1"
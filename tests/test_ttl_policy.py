@@ -0,0 +1,54 @@
+import math
+
+import pytest
+
+from infrastructure.adapters.outbound.cache import ttl_policy
+from infrastructure.adapters.outbound.cache.ttl_policy import CacheTtlPolicy
+
+
+@pytest.fixture
+def unit_draw(monkeypatch):
+    # -log(1 - random()) == 1: раннее обновление начинается ровно за load_time * beta до мягкого TTL
+    monkeypatch.setattr(ttl_policy.random, "random", lambda: 1 - math.exp(-1))
+
+
+def test_stale_entry_is_refreshed_and_served():
+    policy = CacheTtlPolicy(ttl=60, stale_ttl=30)
+
+    assert policy.should_refresh(30) and policy.is_stale(30)
+    assert not policy.should_refresh(30.5) and not policy.is_stale(30.5)
+
+
+def test_unknown_remaining_time_never_triggers_refresh():
+    policy = CacheTtlPolicy(stale_ttl=30, beta=1.0)
+    policy.observe_load(5)
+
+    assert not policy.should_refresh(None) and not policy.is_stale(None)
+
+
+def test_early_refresh_starts_load_time_times_beta_before_soft_ttl(unit_draw):
+    policy = CacheTtlPolicy(ttl=60, stale_ttl=30, beta=2.0)
+    policy.observe_load(0.5)
+
+    assert policy.should_refresh(30 + 1.0)
+    assert not policy.should_refresh(30 + 1.01)
+
+
+def test_early_refresh_is_off_without_beta_or_load_time(unit_draw):
+    assert not CacheTtlPolicy(stale_ttl=30).should_refresh(30.01)
+    assert not CacheTtlPolicy(stale_ttl=30, beta=1.0).should_refresh(30.01)
+
+
+def test_load_time_is_a_moving_average():
+    policy = CacheTtlPolicy()
+    policy.observe_load(1.0)
+    policy.observe_load(2.0)
+
+    assert policy.load_time == pytest.approx(1.1)
+
+
+def test_expire_in_adds_stale_ttl_to_jittered_ttl():
+    policy = CacheTtlPolicy(ttl=100, stale_ttl=30, jitter=0.1)
+
+    assert all(120 <= policy.expire_in() <= 140 for _ in range(200))
+    assert CacheTtlPolicy(ttl=100, stale_ttl=30).expire_in() == 130